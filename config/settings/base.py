@@ -290,12 +290,36 @@ WAGTAILIMAGES_FEATURE_DETECTION_ENABLED = False
 # Allows to change the max size of the image that user can upload. Defaults to 6MB
 WAGTAILIMAGES_MAX_UPLOAD_SIZE = 20 * 1024 * 1024
 
+# Reject images that would decode to more than this many pixels, checked
+# from the header before decoding (48MP phone photos are ~49 million)
+WAGTAILIMAGES_MAX_IMAGE_PIXELS = 64_000_000
+
 # Django file upload size limits - set to match Wagtail image upload limit
 DATA_UPLOAD_MAX_MEMORY_SIZE = 20 * 1024 * 1024  # 20MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 20 * 1024 * 1024  # 20MB
 
 WAGTAILIMAGES_EXTENSIONS = ["gif", "jpg", "jpeg", "png", "webp", "svg"]
 
+# Pre-generate AVIF alternatives of the large rendition profiles. Needs a
+# Pillow that can write AVIF (Pillow >= 11.2, or pillow-heif < 0.22);
+# without one this setting has no effect.
+IMAGES_AVIF_RENDITIONS = env.bool("IMAGES_AVIF_RENDITIONS", default=False)
+
+# Local read-through cache of originals for rendition generation (see
+# housegallery/images/original_cache.py). /tmp on Cloud Run is memory
+# backed, so keep the cap well under the instance's memory. 0 disables it.
+IMAGES_ORIGINAL_CACHE_DIR = env(
+    "IMAGES_ORIGINAL_CACHE_DIR", default="/tmp/housegallery-originals",
+)
+IMAGES_ORIGINAL_CACHE_MAX_BYTES = env.int(
+    "IMAGES_ORIGINAL_CACHE_MAX_BYTES", default=256 * 1024 * 1024,
+)
+
+# Origin (e.g. https://events.example.com) of the ASGI service that streams
+# kiosk events (see cloudbuild/start-events). The WSGI site cannot hold
+# the connections open; empty serves them from the site's own origin.
+KIOSK_EVENTS_ORIGIN = env("KIOSK_EVENTS_ORIGIN", default="").rstrip("/")
+
 WAGTAILADMIN_RICH_TEXT_EDITORS = {
     'default': {
         'WIDGET': 'wagtail.admin.rich_text.DraftailRichTextArea',
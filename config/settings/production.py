@@ -43,6 +43,10 @@ else:
     _cloudrun_url = env("CLOUDRUN_SERVICE_URL", default=None)
     if _cloudrun_url:
         ALLOWED_HOSTS.append(urlparse(_cloudrun_url).netloc)
+# The kiosk events service runs this same code under its own URL
+_events_origin = env("KIOSK_EVENTS_ORIGIN", default=None)
+if _events_origin:
+    ALLOWED_HOSTS.append(urlparse(_events_origin).netloc)
 CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS", default=[])
 SECURE_SSL_REDIRECT = True
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
@@ -59,16 +63,33 @@ DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
 # Use database cache as default for persistence across Cloud Run cold starts.
 # The kiosk carousel cache and other page-level caches survive container restarts.
 CACHES = {
+    # Per-process LRU in front of the shared database cache, so repeated
+    # reads of hot keys skip the round trip to Postgres
     "default": {
+        "BACKEND": "housegallery.core.cache_backends.TieredCache",
+        "OPTIONS": {
+            "L2": "persistent",
+            "L1_MAX_ENTRIES": 1000,
+            "L1_TIMEOUT": 5,
+            # Publishes become visible on every instance within this window
+            "VERSION_KEYS": ["exhibitions_listing_version"],
+            "VERSION_KEY_TIMEOUT": 1,
+            # Counters shared between instances must not be read from L1
+            "L1_EXCLUDE_PREFIXES": ["newsletter_subscribe_", "newsletter_unsubscribe_"],
+        },
+    },
+    "persistent": {
         "BACKEND": "django.core.cache.backends.db.DatabaseCache",
         "LOCATION": "django_cache_table",
     },
-    # Keep in-memory cache available for anything that needs speed over persistence
-    "locmem": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "housegallery-cache",
+    # Resolved rendition URLs (see housegallery.core.rendition_resolver),
+    # one small entry per image and spec. A table of their own, so culling
+    # them never evicts the listing and carousel caches.
+    "renditions": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "rendition_cache_table",
         "OPTIONS": {
-            "MAX_ENTRIES": 1000,
+            "MAX_ENTRIES": 100000,
         },
     },
 }
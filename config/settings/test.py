@@ -53,5 +53,8 @@ STORAGES = {
     },
 }
 
+# Tests that need the originals cache enable it with their own directory
+IMAGES_ORIGINAL_CACHE_MAX_BYTES = 0
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -1,5 +1,13 @@
 from rest_framework import serializers
 from housegallery.images.models import CustomImage
+from housegallery.images.renditions import avif_enabled
+
+
+def accepts_avif(request):
+    """Return True if AVIF renditions are enabled and the client's Accept header allows them"""
+    if request is None or not avif_enabled():
+        return False
+    return 'image/avif' in request.META.get('HTTP_ACCEPT', '')
 
 
 class ImageRenditionSerializer(serializers.Serializer):
@@ -30,6 +38,8 @@ class ImageSerializer(serializers.ModelSerializer):
             'height',
             'file_size',
             'original_url',
+            'placeholder',
+            'dominant_color',
             'renditions',
             'metadata',
             'created_at',
@@ -45,13 +55,18 @@ class ImageSerializer(serializers.ModelSerializer):
 
         try:
             urls = get_image_urls(obj)
-            return {
+            renditions = {
                 'thumbnail': {'url': urls['thumb_url']},
                 'medium': {'url': urls['medium_url']},
                 'full': {'url': urls['full_url']},
                 'srcset': urls['srcset'],
                 'sizes': urls['sizes'],
             }
+            # Clients that can decode AVIF get the smaller files, once built
+            if urls.get('full_avif_url') and accepts_avif(self.context.get('request')):
+                renditions['full'] = {'url': urls['full_avif_url'], 'format': 'avif'}
+                renditions['srcset'] = urls['avif_srcset']
+            return renditions
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
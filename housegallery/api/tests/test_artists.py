@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -68,4 +70,13 @@ class ArtistAPITest(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('metadata', response.data)
-        self.assertIn('artwork_count', response.data['metadata'])
\ No newline at end of file
+        self.assertIn('artwork_count', response.data['metadata'])
+
+    @mock.patch('housegallery.api.viewsets.mixins.avif_enabled', return_value=True)
+    def test_artist_response_varies_on_accept(self, avif_enabled):
+        """Nested image renditions depend on Accept, so caches must key on it"""
+        self.client.credentials(HTTP_API_KEY=self.api_key1.key)
+        response = self.client.get('/api/v1/artists/profile/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Accept', response['Vary'])
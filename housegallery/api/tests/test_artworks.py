@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -127,4 +129,13 @@ class ArtworkAPITest(TestCase):
         self.assertIn('oil', materials)
         self.assertIn('canvas', materials)
         self.assertIn('watercolor', materials)
-        self.assertIn('paper', materials)
\ No newline at end of file
+        self.assertIn('paper', materials)
+
+    @mock.patch('housegallery.api.viewsets.mixins.avif_enabled', return_value=True)
+    def test_artwork_response_varies_on_accept(self, avif_enabled):
+        """Nested image renditions depend on Accept, so caches must key on it"""
+        self.client.credentials(HTTP_API_KEY=self.api_key1.key)
+        response = self.client.get('/api/v1/artworks/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Accept', response['Vary'])
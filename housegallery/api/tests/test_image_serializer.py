@@ -129,3 +129,32 @@ class TestImageSerializer:
         metadata = serializer.data["metadata"]
 
         assert metadata["mime_type"] == "image/webp"
+
+
+@pytest.mark.django_db
+class TestImageSerializerAvifNegotiation:
+
+    MOCK_AVIF_URLS = {
+        **MOCK_IMAGE_URLS,
+        "full_avif_url": "/media/test_full.avif",
+        "avif_srcset": "/media/test_thumb.jpg 400w, /media/test_full.avif 1440w",
+    }
+
+    def _renditions(self, image, rf, accept):
+        request = rf.get("/", HTTP_ACCEPT=accept)
+        with patch(
+            "housegallery.core.image_utils.get_image_urls",
+            return_value=self.MOCK_AVIF_URLS,
+        ), patch("housegallery.api.serializers.images.avif_enabled", return_value=True):
+            return ImageSerializer(instance=image, context={"request": request}).data["renditions"]
+
+    def test_avif_served_when_accepted(self, make_image, rf):
+        renditions = self._renditions(make_image(), rf, "image/avif,image/webp,*/*")
+
+        assert renditions["full"] == {"url": "/media/test_full.avif", "format": "avif"}
+        assert renditions["srcset"] == self.MOCK_AVIF_URLS["avif_srcset"]
+
+    def test_webp_served_otherwise(self, make_image, rf):
+        renditions = self._renditions(make_image(), rf, "image/webp,*/*")
+
+        assert renditions["full"] == {"url": "/media/test_full.jpg"}
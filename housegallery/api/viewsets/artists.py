@@ -5,9 +5,10 @@ from housegallery.artists.models import Artist
 from housegallery.api.serializers import ArtistSerializer
 from housegallery.api.authentication.api_key import APIKeyAuthentication
 from housegallery.api.permissions.artist_scoped import ArtistScopedPermission
+from housegallery.api.viewsets.mixins import VaryOnAcceptMixin
 
 
-class ArtistViewSet(viewsets.ReadOnlyModelViewSet):
+class ArtistViewSet(VaryOnAcceptMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for Artist data.
     
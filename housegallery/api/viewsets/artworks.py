@@ -8,9 +8,10 @@ from housegallery.artworks.models import Artwork, ArtworkImage
 from housegallery.api.serializers import ArtworkSerializer, ArtworkListSerializer
 from housegallery.api.authentication.api_key import APIKeyAuthentication
 from housegallery.api.permissions.artist_scoped import ArtistScopedPermission
+from housegallery.api.viewsets.mixins import VaryOnAcceptMixin
 
 
-class ArtworkViewSet(viewsets.ReadOnlyModelViewSet):
+class ArtworkViewSet(VaryOnAcceptMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for Artwork data.
     
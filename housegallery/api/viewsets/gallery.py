@@ -5,9 +5,10 @@ from housegallery.images.models import CustomImage
 from housegallery.api.serializers import ArtworkSerializer, ArtworkListSerializer, ImageSerializer
 from housegallery.api.authentication.readonly_token import ReadOnlyTokenAuthentication
 from housegallery.api.permissions.readonly_token import ReadOnlyTokenPermission
+from housegallery.api.viewsets.mixins import VaryOnAcceptMixin
 
 
-class GalleryArtworkViewSet(viewsets.ReadOnlyModelViewSet):
+class GalleryArtworkViewSet(VaryOnAcceptMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only access to all artworks, authenticated via ReadOnlyToken.
 
@@ -59,7 +60,7 @@ class GalleryArtworkViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
-class GalleryImageViewSet(viewsets.ReadOnlyModelViewSet):
+class GalleryImageViewSet(VaryOnAcceptMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only access to all images, authenticated via ReadOnlyToken.
 
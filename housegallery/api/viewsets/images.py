@@ -3,13 +3,16 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from housegallery.images.models import CustomImage
+from housegallery.images.renditions import AVIF_ALTERNATIVES, avif_enabled, profile_spec
 from housegallery.artworks.models import Artwork
 from housegallery.api.serializers import ImageSerializer
+from housegallery.api.serializers.images import accepts_avif
 from housegallery.api.authentication.api_key import APIKeyAuthentication
 from housegallery.api.permissions.artist_scoped import ArtistScopedPermission
+from housegallery.api.viewsets.mixins import VaryOnAcceptMixin
 
 
-class ImageViewSet(viewsets.ReadOnlyModelViewSet):
+class ImageViewSet(VaryOnAcceptMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for Image data.
     
@@ -44,7 +47,7 @@ class ImageViewSet(viewsets.ReadOnlyModelViewSet):
             image_ids.add(artist.profile_image_id)
         
         return CustomImage.objects.filter(id__in=image_ids)
-    
+
     @action(detail=True, methods=['get'])
     def renditions(self, request, pk=None):
         """
@@ -67,22 +70,34 @@ class ImageViewSet(viewsets.ReadOnlyModelViewSet):
             'renditions': {}
         }
         
-        # Standard renditions
-        rendition_specs = [
-            ('thumbnail_400', 'width-400|format-webp|webpquality-90'),
-            ('web_optimized_1200', 'width-1200|format-webp|webpquality-85'),
-            ('high_quality_2400', 'max-2400x2400|format-webp|webpquality-95'),
+        # Standard renditions, all pre-generated on upload
+        rendition_profiles = [
+            ('thumbnail_400', 'thumb_webp'),
+            ('web_optimized_1200', 'large_webp'),
+            ('high_quality_2400', 'display'),
         ]
         
-        for name, spec in rendition_specs:
+        use_avif = accepts_avif(request)
+        
+        for name, profile in rendition_profiles:
             try:
-                rendition = image.get_rendition(spec)
+                rendition = None
+                rendition_format = 'WebP'
+                if use_avif and profile in AVIF_ALTERNATIVES:
+                    # Only AVIF renditions the background worker has built
+                    rendition = image.renditions.filter(
+                        filter_spec=profile_spec(AVIF_ALTERNATIVES[profile]),
+                    ).first()
+                    rendition_format = 'AVIF'
+                if rendition is None:
+                    rendition = image.get_rendition(profile_spec(profile))
+                    rendition_format = 'WebP'
                 renditions['renditions'][name] = {
                     'url': rendition.url,
                     'width': rendition.width,
                     'height': rendition.height,
                     'file_size': rendition.file.size if hasattr(rendition.file, 'size') else None,
-                    'format': 'WebP'
+                    'format': rendition_format
                 }
             except Exception as e:
                 # Log error but continue with other renditions
@@ -100,7 +115,7 @@ class ImageViewSet(viewsets.ReadOnlyModelViewSet):
         Request body should contain:
         - width: desired width (optional)
         - height: desired height (optional)
-        - format: output format (jpeg, png, webp)
+        - format: output format (jpeg, png, webp, or avif when enabled)
         - quality: compression quality (1-100)
         """
         image = self.get_object()
@@ -118,9 +133,12 @@ class ImageViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        if output_format not in ['jpeg', 'png', 'webp']:
+        allowed_formats = ['jpeg', 'png', 'webp']
+        if avif_enabled():
+            allowed_formats.append('avif')
+        if output_format not in allowed_formats:
             return Response(
-                {'error': 'Format must be jpeg, png, or webp'},
+                {'error': f"Format must be {', '.join(allowed_formats[:-1])}, or {allowed_formats[-1]}"},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
@@ -147,6 +165,8 @@ class ImageViewSet(viewsets.ReadOnlyModelViewSet):
         if output_format != 'png':  # PNG doesn't support quality
             if output_format == 'webp':
                 filter_parts.append(f'format-webp|webpquality-{quality}')
+            elif output_format == 'avif':
+                filter_parts.append(f'format-avif|avifquality-{quality}')
             else:
                 filter_parts.append(f'format-jpeg|jpegquality-{quality}')
         else:
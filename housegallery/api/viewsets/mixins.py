@@ -0,0 +1,18 @@
+from django.utils.cache import patch_vary_headers
+from housegallery.images.renditions import avif_enabled
+
+
+class VaryOnAcceptMixin:
+    """
+    For viewsets whose responses include image rendition URLs.
+
+    ImageSerializer picks AVIF or WebP URLs from the Accept header, whether
+    it is used directly or nested in another serializer, so caches must key
+    those responses on Accept.
+    """
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if avif_enabled():
+            patch_vary_headers(response, ['Accept'])
+        return response
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ArtistsConfig(AppConfig):
+    name = 'housegallery.artists'
+    verbose_name = "Artists"
+
+    def ready(self):
+        # Import signals to register handlers
+        from . import signals
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from housegallery.core.cache_dependencies import ARTIST, invalidate_dependents
+from .models import Artist
+
+
+# ============================================================================
+# Cache Invalidation Signals
+# ============================================================================
+
+@receiver(post_save, sender=Artist)
+@receiver(post_delete, sender=Artist)
+def invalidate_artist_dependents(sender, instance, **kwargs):
+    """
+    Invalidate cached listings and carousels that show an artist's name.
+    """
+    invalidate_dependents(ARTIST, [instance.pk])
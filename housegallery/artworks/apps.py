@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ArtworksConfig(AppConfig):
+    name = 'housegallery.artworks'
+    verbose_name = "Artworks"
+
+    def ready(self):
+        # Import signals to register handlers
+        from . import signals
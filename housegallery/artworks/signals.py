@@ -0,0 +1,50 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from taggit.models import Tag
+
+from housegallery.core.cache_dependencies import ARTWORK, TAG, invalidate_dependents
+from .models import Artwork, ArtworkArtist, ArtworkImage, ArtworkTag
+
+
+# ============================================================================
+# Cache Invalidation Signals
+# ============================================================================
+
+@receiver(post_save, sender=Artwork)
+@receiver(post_delete, sender=Artwork)
+def invalidate_artwork_dependents(sender, instance, **kwargs):
+    """
+    Invalidate cached galleries, listings and carousels built from an artwork
+    when its title, date, size or other details change.
+    """
+    invalidate_dependents(ARTWORK, [instance.pk])
+
+
+@receiver(post_save, sender=ArtworkImage)
+@receiver(post_delete, sender=ArtworkImage)
+@receiver(post_save, sender=ArtworkArtist)
+@receiver(post_delete, sender=ArtworkArtist)
+def invalidate_artwork_dependents_on_relation_change(sender, instance, **kwargs):
+    """
+    Invalidate an artwork's dependents when its images or artists change.
+    """
+    invalidate_dependents(ARTWORK, [instance.artwork_id])
+
+
+@receiver(post_save, sender=ArtworkTag)
+@receiver(post_delete, sender=ArtworkTag)
+def invalidate_artwork_dependents_on_material_change(sender, instance, **kwargs):
+    """
+    Invalidate an artwork's dependents when a material is added or removed.
+    """
+    invalidate_dependents(ARTWORK, [instance.content_object_id])
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_dependents(sender, instance, **kwargs):
+    """
+    Invalidate payloads that display a material or image tag when the tag
+    is renamed, merged or deleted.
+    """
+    invalidate_dependents(TAG, [instance.pk])
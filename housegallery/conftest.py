@@ -1,12 +1,17 @@
 import io
+import threading
+from contextlib import contextmanager
 from unittest.mock import MagicMock
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.db.models.signals import post_save
 from PIL import Image as PILImage
 from wagtail.models import Page as WagtailPage
 
+from housegallery.core.cache_utils import recompute_lock
+from housegallery.core.rendition_resolver import resolver
 from housegallery.exhibitions.models import ExhibitionsIndexPage
 from housegallery.home.models import HomePage
 from housegallery.images.models import CustomImage, generate_standard_renditions
@@ -20,6 +25,50 @@ def disable_rendition_signal():
     post_save.connect(generate_standard_renditions, sender=CustomImage)
 
 
+@pytest.fixture(autouse=True)
+def clear_rendition_resolver():
+    """Start each test with an empty in-process rendition URL cache."""
+    resolver.clear_local()
+    yield
+    resolver.clear_local()
+
+
+@pytest.fixture
+def hold_recompute_lock(db):
+    """Context manager that holds a recompute lock from another database
+    connection, as another worker would."""
+
+    @contextmanager
+    def hold(key):
+        taken = threading.Event()
+        release = threading.Event()
+        acquired = []
+
+        def worker():
+            try:
+                with recompute_lock(key) as got_lock:
+                    acquired.append(got_lock)
+                    taken.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        taken.wait(5)
+        if acquired != [True]:
+            release.set()
+            thread.join()
+            raise AssertionError(f"Could not take the recompute lock for {key!r}")
+        try:
+            yield
+        finally:
+            release.set()
+            thread.join()
+
+    return hold
+
+
 @pytest.fixture
 def root_page(db):
     """Get or create the Wagtail root page."""
@@ -98,6 +147,7 @@ def make_image_with_renditions():
             mock_rendition.width = spec["width"]
             mock_rendition.height = spec["height"]
             mock_rendition.filter_spec = spec["filter_spec"]
+            mock_rendition.focal_point_key = spec.get("focal_point_key", "")
             mock_renditions.append(mock_rendition)
 
         if not hasattr(image, "_prefetched_objects_cache"):
@@ -40,8 +40,12 @@ class TaggedSetBlock(blocks.StructBlock):
         context = super().get_context(value, parent_context)
         tag = value.get('tag', '')
         if tag:
+            from housegallery.core.rendition_resolver import resolver
             from housegallery.images.models import CustomImage
-            context['images'] = CustomImage.objects.filter(tags__name__iexact=tag).distinct()
+            images = list(CustomImage.objects.filter(tags__name__iexact=tag).distinct())
+            # Resolve every URL the template asks for in one batch
+            resolver.resolve(images, ['web_optimized'])
+            context['images'] = images
         else:
             context['images'] = []
         return context
@@ -62,11 +66,15 @@ class AllImagesBlock(blocks.StructBlock):
         """Add all images to the template context."""
         context = super().get_context(value, parent_context)
         limit = value.get('limit')
+        from housegallery.core.rendition_resolver import resolver
         from housegallery.images.models import CustomImage
         queryset = CustomImage.objects.all()
         if limit:
             queryset = queryset[:limit]
-        context['images'] = queryset
+        images = list(queryset)
+        # Resolve every URL the template asks for in one batch
+        resolver.resolve(images, ['web_optimized', 'display'])
+        context['images'] = images
         return context
 
 
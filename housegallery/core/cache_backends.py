@@ -0,0 +1,237 @@
+"""Two-tier cache backend: a small in-process LRU in front of a shared cache.
+
+Every ``cache.get`` against the DatabaseCache is a round trip to Postgres,
+which adds up on the hot paths (the exhibitions listing version, listing
+chunks and kiosk carousels are read on every request). ``TieredCache``
+answers repeated reads from a bounded per-process LRU (L1) and only falls
+through to the shared backend (L2) on a miss.
+
+Coherence between instances
+---------------------------
+Writes and deletes go through to L2 and update this process's L1 straight
+away. Other instances only see the change once their L1 copy expires, so
+L1 entries live for ``L1_TIMEOUT`` seconds at most. Keys listed in
+``VERSION_KEYS`` (e.g. ``exhibitions_listing_version``) get the even shorter
+``VERSION_KEY_TIMEOUT``: payload keys embed the version, so once an instance
+sees the new version it reads the new payload, and a publish is visible
+everywhere within ``VERSION_KEY_TIMEOUT`` seconds. Keys starting with one of
+``L1_EXCLUDE_PREFIXES`` (rate-limit counters, recompute locks) always go to
+L2.
+
+Example::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "housegallery.core.cache_backends.TieredCache",
+            "OPTIONS": {
+                "L2": "persistent",
+                "L1_MAX_ENTRIES": 1000,
+                "L1_TIMEOUT": 5,
+                "VERSION_KEYS": ["exhibitions_listing_version"],
+                "VERSION_KEY_TIMEOUT": 1,
+            },
+        },
+        "persistent": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache_table",
+        },
+    }
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.base import BaseCache
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """Bounded per-process LRU (L1) in front of another configured cache (L2)."""
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._l2_alias = options["L2"]
+        self.l1_max_entries = int(options.get("L1_MAX_ENTRIES", 1000))
+        self.l1_timeout = float(options.get("L1_TIMEOUT", 5))
+        self.version_keys = frozenset(options.get("VERSION_KEYS", ()))
+        self.version_key_timeout = float(options.get("VERSION_KEY_TIMEOUT", 1))
+        self.l1_exclude_prefixes = tuple(options.get("L1_EXCLUDE_PREFIXES", ()))
+
+        # Values are stored pickled, like LocMemCache, so callers can't
+        # mutate the cached copy through the object they were handed
+        self._l1 = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    # L1 helpers
+
+    def _l1_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    def _l1_eligible(self, key):
+        return not (
+            key.startswith(self.l1_exclude_prefixes) or key.endswith(":lock")
+        )
+
+    def _l1_ttl(self, key, timeout):
+        ttl = self.version_key_timeout if key in self.version_keys else self.l1_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, timeout)
+        return ttl
+
+    def _l1_get(self, key, version):
+        l1_key = self._l1_key(key, version)
+        with self._lock:
+            entry = self._l1.get(l1_key)
+            if entry is None:
+                return _MISSING
+            expires_at, pickled = entry
+            if expires_at <= time.monotonic():
+                del self._l1[l1_key]
+                return _MISSING
+            self._l1.move_to_end(l1_key)
+        return pickle.loads(pickled)
+
+    def _l1_set(self, key, value, timeout, version):
+        if not self._l1_eligible(key):
+            return
+        ttl = self._l1_ttl(key, timeout)
+        l1_key = self._l1_key(key, version)
+        if ttl <= 0:
+            self._l1_delete(key, version)
+            return
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._l1[l1_key] = (time.monotonic() + ttl, pickled)
+            self._l1.move_to_end(l1_key)
+            while len(self._l1) > self.l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, key, version):
+        l1_key = self._l1_key(key, version)
+        with self._lock:
+            self._l1.pop(l1_key, None)
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._stats[name] += n
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        if self._l1_eligible(key):
+            value = self._l1_get(key, version)
+            if value is not _MISSING:
+                self._count("l1_hits")
+                return value
+            self._count("l1_misses")
+
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count("l2_misses")
+            return default
+        self._count("l2_hits")
+        self._l1_set(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            value = self._l1_get(key, version) if self._l1_eligible(key) else _MISSING
+            if value is _MISSING:
+                remaining.append(key)
+            else:
+                found[key] = value
+        self._count("l1_hits", len(found))
+        self._count("l1_misses", len(remaining))
+
+        if remaining:
+            from_l2 = self.l2.get_many(remaining, version=version)
+            self._count("l2_hits", len(from_l2))
+            self._count("l2_misses", len(remaining) - len(from_l2))
+            for key, value in from_l2.items():
+                self._l1_set(key, value, DEFAULT_TIMEOUT, version)
+            found.update(from_l2)
+        return found
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # Must stay atomic across instances, so L2 decides
+        added = self.l2.add(key, value, timeout, version=version)
+        if added:
+            self._l1_set(key, value, timeout, version)
+        else:
+            self._l1_delete(key, version)
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.l2.set(key, value, timeout, version=version)
+        self._l1_set(key, value, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key in failed:
+                self._l1_delete(key, version)
+            else:
+                self._l1_set(key, value, timeout, version)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._l1_delete(key, version)
+        return self.l2.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(key, version)
+        return self.l2.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        for key in keys:
+            self._l1_delete(key, version)
+        self.l2.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        if self._l1_eligible(key) and self._l1_get(key, version) is not _MISSING:
+            return True
+        return self.l2.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._l1_delete(key, version)
+        return self.l2.incr(key, delta, version=version)
+
+    def clear(self):
+        self.clear_local()
+        self.l2.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+    # Introspection
+
+    def clear_local(self):
+        """Drop this process's L1 without touching the shared cache."""
+        with self._lock:
+            self._l1.clear()
+
+    def stats(self):
+        """Return per-tier hit/miss counters for this process."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["l1_entries"] = len(self._l1)
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
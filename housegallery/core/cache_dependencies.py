@@ -0,0 +1,115 @@
+"""Dependency-tracked invalidation for cached payloads.
+
+Anything that caches data derived from images, artworks, artists, tags or
+exhibitions records which objects it read with ``record_dependencies``.
+Signal handlers call ``invalidate_dependents`` when one of those objects
+changes, which deletes exactly the cache keys built from it. Cached
+payloads can therefore live until invalidated instead of relying on a TTL.
+
+Versioned keys (e.g. one per publish) name their ``family``, a key shared
+by every version; recording a new version forgets the dependencies of the
+versions it supersedes and deletes their cache entries.
+
+Keys that are not plain cache entries (e.g. the persisted exhibition gallery
+manifest) can register a callback for their prefix with
+``register_invalidator``.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+# Dependency kinds
+IMAGE = "image"
+ARTWORK = "artwork"
+ARTIST = "artist"
+TAG = "tag"
+EXHIBITION = "exhibition"
+
+# Use as an object id to depend on every object of a kind
+ANY = None
+
+_invalidators = {}
+
+
+def register_invalidator(prefix, callback):
+    """Call ``callback(cache_key)`` instead of deleting keys starting with ``prefix``."""
+    _invalidators[prefix] = callback
+
+
+def record_dependencies(cache_key, dependencies, family=""):
+    """Record the objects a cached payload was built from.
+
+    Args:
+        cache_key: The cache key (or registered prefix key) of the payload.
+        dependencies: Dict mapping a dependency kind to an iterable of
+                      object ids. Use ``ANY`` as an id to depend on every
+                      object of that kind.
+        family: Optional key shared by every version of a versioned key.
+                Other keys recorded with the same family are superseded:
+                their dependencies are forgotten and their cache entries
+                deleted.
+
+    Replaces any dependencies previously recorded for the key.
+    """
+    from housegallery.core.models import CacheDependency
+
+    rows = [
+        CacheDependency(cache_key=cache_key, kind=kind, object_id=object_id, family=family)
+        for kind, object_ids in dependencies.items()
+        for object_id in set(object_ids)
+    ]
+
+    stale = CacheDependency.objects.filter(cache_key=cache_key)
+    if family:
+        superseded = set(
+            CacheDependency.objects.filter(family=family)
+            .exclude(cache_key=cache_key)
+            .values_list("cache_key", flat=True)
+        )
+        if superseded:
+            stale = CacheDependency.objects.filter(cache_key__in=[cache_key, *superseded])
+            cache.delete_many(superseded)
+    stale.delete()
+    CacheDependency.objects.bulk_create(rows)
+
+
+def invalidate_dependents(kind, object_ids):
+    """Invalidate every payload that depends on the given objects.
+
+    Returns the set of invalidated keys.
+    """
+    from housegallery.core.models import CacheDependency
+
+    object_ids = [object_id for object_id in object_ids if object_id is not None]
+
+    dependents = CacheDependency.objects.filter(kind=kind).filter(
+        Q(object_id__in=object_ids) | Q(object_id__isnull=True)
+    )
+    keys = set(dependents.values_list("cache_key", flat=True))
+    if not keys:
+        return keys
+
+    # Forget the dependencies first so a callback that rebuilds and
+    # re-records a payload is not undone afterwards
+    CacheDependency.objects.filter(cache_key__in=keys).delete()
+
+    plain_keys = []
+    for key in keys:
+        callback = next(
+            (callback for prefix, callback in _invalidators.items() if key.startswith(prefix)),
+            None,
+        )
+        if callback is None:
+            plain_keys.append(key)
+            continue
+        try:
+            callback(key)
+        except Exception:
+            logger.exception("Cache invalidator failed for %s", key)
+
+    cache.delete_many(plain_keys)
+    return keys
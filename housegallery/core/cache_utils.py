@@ -0,0 +1,162 @@
+"""Cache helpers that protect expensive payloads from stampedes.
+
+When a popular key expires or is invalidated, every worker that misses at
+the same moment would otherwise rebuild it in parallel. ``get_or_compute``
+lets one worker rebuild while the others keep serving the previous value,
+and refreshes keys with a TTL slightly before they expire (probabilistic
+early expiry, a.k.a. XFetch) so most rebuilds happen before a miss at all.
+"""
+
+import hashlib
+import math
+import random
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db import OperationalError
+from django.db import connections
+from django.db import transaction
+
+# How long a worker without a value to serve waits for another worker's
+# rebuild, in seconds, before rebuilding itself
+WAIT_TIMEOUT = 5
+
+# Higher values refresh earlier; 1.0 is the usual XFetch default
+EARLY_EXPIRY_BETA = 1.0
+
+_MISSING = object()
+
+
+def _lock_id(key):
+    """Postgres advisory lock id (a signed 64-bit integer) for ``key``."""
+    digest = hashlib.blake2b(f"recompute:{key}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@contextmanager
+def recompute_lock(key, using=DEFAULT_DB_ALIAS):
+    """Try to take the recompute lock for ``key``; yields True if acquired.
+
+    This is a Postgres advisory lock, so it is visible to every worker as
+    soon as it is taken, whatever transaction either side is in. Inside a
+    transaction (e.g. ``ATOMIC_REQUESTS``) it is held until that
+    transaction ends, so other workers only see it released once the
+    rebuilt value has been committed to the database cache. Outside one
+    it is released on leaving the block.
+    """
+    connection = connections[using]
+    lock_id = _lock_id(key)
+    in_transaction = connection.in_atomic_block
+    with connection.cursor() as cursor:
+        if in_transaction:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [lock_id])
+        else:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired and not in_transaction:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+def wait_for_recompute(key, timeout=WAIT_TIMEOUT, using=DEFAULT_DB_ALIAS):
+    """Block until no worker holds the recompute lock for ``key``.
+
+    Returns False if it is still held after ``timeout`` seconds. Waiting
+    takes the lock in shared mode, which does not stop other waiters.
+    """
+    connection = connections[using]
+    lock_id = _lock_id(key)
+    try:
+        # A savepoint, so a timeout does not break the caller's transaction
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute("SELECT current_setting('lock_timeout')")
+            previous = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT set_config('lock_timeout', %s, true)", [f"{int(timeout * 1000)}ms"],
+            )
+            cursor.execute("SELECT pg_advisory_xact_lock_shared(%s)", [lock_id])
+            cursor.execute("SELECT set_config('lock_timeout', %s, true)", [previous])
+    except OperationalError:
+        return False
+    return True
+
+
+def _should_refresh_early(expires_at, compute_time, beta):
+    """Return True if a value should be rebuilt ahead of its expiry.
+
+    The chance grows as expiry approaches and with how long the value took
+    to build, so slow payloads start refreshing earlier.
+    """
+    if expires_at is None:
+        return False
+    return time.time() - compute_time * beta * math.log(random.random() or 1e-12) >= expires_at
+
+
+def _compute_and_store(key, compute, timeout, stale_key):
+    start = time.time()
+    value = compute()
+    compute_time = time.time() - start
+
+    expires_at = start + timeout if timeout is not None else None
+    cache.set(key, (value, expires_at, compute_time), timeout)
+    if stale_key:
+        # Last known good value, kept without expiry for serving while a
+        # later version of the key is rebuilt
+        cache.set(stale_key, value, None)
+    return value
+
+
+def get_or_compute(
+    key, compute, timeout=None, stale_key=None, beta=EARLY_EXPIRY_BETA, allow_stale=True,
+):
+    """Return the cached value for ``key``, computing it with stampede protection.
+
+    Args:
+        key: Cache key for the payload.
+        compute: Zero-argument callable that builds the payload.
+        timeout: Cache timeout in seconds, or None to keep until invalidated.
+        stale_key: Optional key under which the last good value is kept. Use
+                   a key that does not change between versions (e.g. without
+                   the publish timestamp) so a fresh version can be served
+                   stale while it is rebuilt.
+        beta: Early expiry aggressiveness; 0 disables early refresh.
+        allow_stale: False to never return the value under ``stale_key``,
+                     for callers that store the result under a version of
+                     their own (e.g. a response ETag).
+
+    Only the worker holding the recompute lock rebuilds. Others serve the
+    current or stale value, or wait for the rebuild (at most
+    ``WAIT_TIMEOUT`` seconds) if there is nothing to serve.
+    """
+    envelope = cache.get(key)
+    if envelope is not None:
+        value, expires_at, compute_time = envelope
+        if not _should_refresh_early(expires_at, compute_time, beta):
+            return value
+        stale = value
+    else:
+        stale = cache.get(stale_key, _MISSING) if stale_key and allow_stale else _MISSING
+
+    with recompute_lock(key) as acquired:
+        if acquired:
+            # Another worker may have finished a rebuild since the read above
+            current = cache.get(key)
+            if current is not None and (envelope is None or current[1] != envelope[1]):
+                return current[0]
+            return _compute_and_store(key, compute, timeout, stale_key)
+
+    if stale is not _MISSING:
+        return stale
+
+    # Nothing to serve: wait for the worker holding the lock to finish
+    if wait_for_recompute(key, WAIT_TIMEOUT):
+        envelope = cache.get(key)
+        if envelope is not None:
+            return envelope[0]
+
+    return _compute_and_store(key, compute, timeout, stale_key)
@@ -1,19 +1,121 @@
 """Shared image URL utilities for responsive images with srcset support."""
 
+import functools
+
+from housegallery.images.renditions import IMAGE_URL_PROFILES
+from housegallery.images.renditions import avif_alternative_specs
+from housegallery.images.renditions import profile_specs
+from housegallery.images.renditions import standard_specs
+
+
+def rendition_prefetch(lookup="renditions", specs=None):
+    """Return a ``Prefetch`` that loads only the renditions for ``specs``.
+
+    A plain ``prefetch_related("renditions")`` pulls every rendition row
+    (legacy specs, admin thumbnails, one-off API sizes). ``specs`` defaults
+    to the pre-generated standard profiles. Renditions outside the set are
+    still found by ``get_rendition``, at the cost of a query.
+    """
+    from django.db.models import Prefetch
+    from wagtail.images import get_image_model
+
+    if specs is None:
+        specs = standard_specs()
+    rendition_model = get_image_model().get_rendition_model()
+    return Prefetch(
+        lookup,
+        queryset=rendition_model.objects.filter(filter_spec__in=list(specs)),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _filter(filter_spec):
+    from wagtail.images.models import Filter
+
+    return Filter(spec=filter_spec)
+
+
+def focal_point_key(image_obj, filter_spec):
+    """Return the ``focal_point_key`` a rendition of ``image_obj`` made
+    with ``filter_spec`` now would have.
+
+    Empty for specs that do not depend on the focal point; for crops
+    (``fill-``) it changes whenever the focal point is edited.
+    """
+    return _filter(filter_spec).get_cache_key(image_obj)
+
+
+def _rendition_index(image_obj):
+    """Return ``{(filter_spec, focal_point_key): rendition}`` for the
+    image's renditions.
+
+    The index is built once per prefetched list and kept on the instance,
+    so repeated lookups are O(1) instead of a scan per spec.
+    """
+    renditions = image_obj.renditions.all()
+    cached = getattr(image_obj, "_rendition_index_cache", None)
+    if cached is not None and cached[0] is renditions and cached[1] == len(renditions):
+        return cached[2]
+
+    index = {}
+    for rendition in renditions:
+        index.setdefault((rendition.filter_spec, rendition.focal_point_key), rendition)
+    if isinstance(getattr(image_obj, "_prefetched_objects_cache", None), dict):
+        image_obj._rendition_index_cache = (renditions, len(renditions), index)  # noqa: SLF001
+    return index
+
 
 def _find_rendition_in_prefetch(image_obj, filter_spec):
     """Check prefetched renditions for a matching filter spec.
 
-    Returns the rendition object if found in prefetch cache, None otherwise.
+    Only a rendition made with the image's current focal point matches,
+    so a crop from before a focal point edit is never returned. Returns
+    the rendition object if found in prefetch cache, None otherwise.
     """
     try:
-        renditions = list(image_obj.renditions.all())
-        for rendition in renditions:
-            if rendition.filter_spec == filter_spec:
-                return rendition
+        return _rendition_index(image_obj).get(
+            (filter_spec, focal_point_key(image_obj, filter_spec)),
+        )
     except Exception:
-        pass
-    return None
+        return None
+
+
+class _OriginalAsRendition:
+    """Stand-in that points at the original file while a rendition is queued."""
+
+    def __init__(self, image_obj):
+        self.url = image_obj.file.url
+        self.width = image_obj.width
+        self.height = image_obj.height
+
+
+def _get_or_fallback(image_obj, filter_spec):
+    """Return a rendition that is missing from the prefetch cache.
+
+    If the rendition is still waiting in the background queue, the original
+    file is served instead of rendering it inside the request. Returns None
+    if neither is available.
+    """
+    from housegallery.images.rendition_queue import is_rendition_queued
+
+    try:
+        if isinstance(image_obj.pk, int) and is_rendition_queued(image_obj, filter_spec):
+            return _OriginalAsRendition(image_obj)
+        return image_obj.get_rendition(filter_spec)
+    except Exception:
+        return None
+
+
+def get_rendition_data(image_obj, filter_spec):
+    """Get serializable data for a single rendition of an image.
+
+    Returns a dict with ``url``, ``width`` and ``height``, or None if the
+    rendition cannot be generated. While the rendition is queued, the
+    original file is returned in its place.
+    """
+    from housegallery.core.rendition_resolver import resolver
+
+    return resolver.resolve_one(image_obj, filter_spec)
 
 
 def get_image_urls(image_obj, specs=None):
@@ -22,32 +124,51 @@ def get_image_urls(image_obj, specs=None):
     Args:
         image_obj: A Wagtail image instance (e.g. CustomImage).
         specs: Optional dict mapping size names to Wagtail filter specs.
-               Defaults to thumb/medium/full for responsive srcset.
+               Defaults to the thumb/medium/full profiles in
+               ``IMAGE_URL_PROFILES`` for responsive srcset.
 
     Returns:
         Dict with ``{key}_url`` for each spec, plus ``original_url``,
-        ``srcset``, ``sizes``, ``width``, ``height``, ``alt``, ``credit``,
-        and ``title``.
+        ``srcset``, ``avif_srcset``, ``sizes``, ``width``, ``height``,
+        ``alt``, ``credit``, ``title``, ``placeholder`` and
+        ``dominant_color``. ``avif_srcset`` is the srcset with AVIF
+        renditions swapped in where they exist, for a
+        ``<source type="image/avif">``; it is empty when there are none.
+        When AVIF is enabled, ``{key}_avif_url`` is also set for each
+        spec that has an AVIF alternative.
     """
     if specs is None:
-        specs = {
-            "thumb": "width-400",
-            "medium": "width-800|format-webp",
-            "full": "width-1440|format-webp|webpquality-85",
-        }
+        specs = profile_specs(IMAGE_URL_PROFILES)
+
+    return _resolve_image_urls([image_obj], specs)[0]
+
+
+def _resolve_image_urls(images, specs):
+    """Resolve renditions for ``images`` in bulk and build their URL dicts."""
+    from housegallery.core.rendition_resolver import resolver
 
+    resolved = resolver.resolve_each(images, specs)
+
+    alternatives = avif_alternative_specs()
+    avif_specs = {key: alternatives[spec] for key, spec in specs.items() if spec in alternatives}
+    if avif_specs:
+        # AVIF is slow to encode, so only renditions the background worker
+        # has already built are used
+        avif = resolver.resolve_each(images, avif_specs, generate=False)
+    else:
+        avif = [{} for _img in images]
+
+    return [
+        _build_image_urls(img, data, avif_data)
+        for img, data, avif_data in zip(images, resolved, avif)
+    ]
+
+
+def _build_image_urls(image_obj, rendition_data, avif_data):
+    """Build the ``get_image_urls`` dict from ``{key: rendition data}``."""
     urls = {}
-    rendition_data = {}  # Store rendition objects for srcset generation
-    for key, filter_spec in specs.items():
-        rendition = _find_rendition_in_prefetch(image_obj, filter_spec)
-        if rendition is None:
-            try:
-                rendition = image_obj.get_rendition(filter_spec)
-            except Exception:
-                rendition = None
-        urls[f"{key}_url"] = rendition.url if rendition else ""
-        if rendition:
-            rendition_data[key] = rendition
+    for key, data in rendition_data.items():
+        urls[f"{key}_url"] = data["url"] if data else ""
 
     # Original file URL
     try:
@@ -56,32 +177,43 @@ def get_image_urls(image_obj, specs=None):
         urls["original_url"] = urls.get("full_url", "")
 
     # Build srcset if we have multiple sizes
-    srcset_parts = []
-    if "thumb" in rendition_data:
-        srcset_parts.append(f"{rendition_data['thumb'].url} {rendition_data['thumb'].width}w")
-    if "medium" in rendition_data:
-        srcset_parts.append(f"{rendition_data['medium'].url} {rendition_data['medium'].width}w")
-    if "full" in rendition_data:
-        srcset_parts.append(f"{rendition_data['full'].url} {rendition_data['full'].width}w")
+    srcset_parts = [
+        f"{rendition_data[key]['url']} {rendition_data[key]['width']}w"
+        for key in ("thumb", "medium", "full")
+        if rendition_data.get(key)
+    ]
 
     urls["srcset"] = ", ".join(srcset_parts) if len(srcset_parts) > 1 else ""
     urls["sizes"] = "(max-width: 600px) 400px, (max-width: 1200px) 800px, 1440px" if urls["srcset"] else ""
 
+    avif_parts = [
+        f"{(avif_data.get(key) or rendition_data[key])['url']} {rendition_data[key]['width']}w"
+        for key in ("thumb", "medium", "full")
+        if rendition_data.get(key)
+    ]
+    has_avif = any(avif_data.values())
+    for key, data in avif_data.items():
+        urls[f"{key}_avif_url"] = data["url"] if data else ""
+    urls["avif_srcset"] = ", ".join(avif_parts) if urls["srcset"] and has_avif else ""
+
     # Image metadata
     urls["width"] = image_obj.width
     urls["height"] = image_obj.height
     urls["alt"] = getattr(image_obj, "alt", "") or image_obj.title or ""
     urls["credit"] = getattr(image_obj, "credit", "") or ""
     urls["title"] = image_obj.title or ""
+    urls["placeholder"] = getattr(image_obj, "placeholder", "") or ""
+    urls["dominant_color"] = getattr(image_obj, "dominant_color", "") or ""
 
     return urls
 
 
 def get_image_urls_batch(image_objects, specs=None):
-    """Get image URLs for multiple images, batch-loading missing renditions.
+    """Get image URLs for multiple images, resolving renditions in bulk.
 
-    More efficient than calling ``get_image_urls`` per image because it
-    pre-fetches renditions for the whole batch in a single query.
+    More efficient than calling ``get_image_urls`` per image because the
+    rendition resolver looks up every image's renditions together: cached
+    entries first, then a single query for the rest.
 
     Args:
         image_objects: Iterable of Wagtail image instances.
@@ -91,38 +223,10 @@ def get_image_urls_batch(image_objects, specs=None):
         List of dicts (same structure as ``get_image_urls``), in input order.
     """
     if specs is None:
-        specs = {
-            "thumb": "width-400",
-            "medium": "width-800|format-webp",
-            "full": "width-1440|format-webp|webpquality-85",
-        }
+        specs = profile_specs(IMAGE_URL_PROFILES)
 
     images = list(image_objects)
     if not images:
         return []
 
-    # Batch-load existing renditions for all images + specs in one query
-    from wagtail.images.models import AbstractRendition
-    rendition_model = type(images[0]).get_rendition_model()
-    filter_specs = list(specs.values())
-    image_pks = [img.pk for img in images]
-
-    existing = rendition_model.objects.filter(
-        image_id__in=image_pks,
-        filter_spec__in=filter_specs,
-    ).select_related("image")
-
-    # Build lookup: (image_pk, filter_spec) -> rendition
-    lookup = {}
-    for rendition in existing:
-        lookup[(rendition.image_id, rendition.filter_spec)] = rendition
-
-    # Attach prefetched renditions so get_image_urls finds them
-    for img in images:
-        matched = [r for r in existing if r.image_id == img.pk]
-        # Populate the prefetch cache so get_image_urls finds them
-        if not hasattr(img, "_prefetched_objects_cache"):
-            img._prefetched_objects_cache = {}  # noqa: SLF001
-        img._prefetched_objects_cache["renditions"] = matched  # noqa: SLF001
-
-    return [get_image_urls(img, specs) for img in images]
+    return _resolve_image_urls(images, specs)
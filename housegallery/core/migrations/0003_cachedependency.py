@@ -0,0 +1,27 @@
+# Generated by Django 5.0.10 on 2026-10-17 00:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cache_key', models.CharField(db_index=True, max_length=250)),
+                ('kind', models.CharField(max_length=32)),
+                ('object_id', models.PositiveBigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Cache Dependency',
+                'verbose_name_plural': 'Cache Dependencies',
+                'indexes': [models.Index(fields=['kind', 'object_id'], name='cache_dependency_lookup_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_cachedependency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachedependency',
+            name='family',
+            field=models.CharField(blank=True, db_index=True, max_length=250),
+        ),
+    ]
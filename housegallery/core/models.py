@@ -99,3 +99,31 @@ class BlankPage(Page, ListingFields):
         + ListingFields.promote_panels
     )
 
+
+
+# CACHING #
+
+class CacheDependency(models.Model):
+    """Records that a cached payload was built from a given object.
+
+    One row per (cache key, object). ``object_id`` is null for payloads that
+    depend on every object of a kind, e.g. a carousel of all images. See
+    ``housegallery.core.cache_dependencies`` for the API.
+    """
+
+    cache_key = models.CharField(max_length=250, db_index=True)
+    kind = models.CharField(max_length=32)
+    object_id = models.PositiveBigIntegerField(null=True, blank=True)
+    # Shared by every version of a versioned key, so superseded versions
+    # can be cleaned up when a new one is recorded
+    family = models.CharField(max_length=250, blank=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Cache Dependency"
+        verbose_name_plural = "Cache Dependencies"
+        indexes = [
+            models.Index(fields=['kind', 'object_id'], name='cache_dependency_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.cache_key} -> {self.kind}:{self.object_id or '*'}"
@@ -0,0 +1,349 @@
+"""Process-wide cache of resolved rendition URLs.
+
+Every page that shows an image needs its rendition URL, width and height,
+and getting them normally means a query per image (or a prefetch per
+page). The resolver keeps ``{url, width, height}`` for each
+(image, filter spec) pair in two tiers:
+
+* a bounded in-process LRU, checked first and shared by every request in
+  the worker;
+* the ``renditions`` cache (a database cache with its own table in
+  production, falling back to the default cache elsewhere), which
+  survives restarts and is shared between workers. It is kept apart so
+  the many small entries here never cull the page-level caches.
+
+Misses for a whole batch are filled from the images' prefetched
+renditions, then one query for the rest, and only then by generating the
+rendition. Entries carry a signature of the image's file and focal point,
+so a stale entry for a re-cropped or replaced image is never served.
+Deleting a rendition or changing an image invalidates its entries through
+the signal handlers in ``housegallery.images.signals``; other workers'
+local tiers catch up within ``LOCAL_TIMEOUT``.
+
+Stand-ins for renditions still waiting in the background queue are never
+cached, so the real rendition is picked up as soon as it exists.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from housegallery.images.renditions import profile_spec, standard_specs
+
+logger = logging.getLogger(__name__)
+
+# Entries kept in each worker's local tier
+LOCAL_MAX_ENTRIES = 5000
+
+# Seconds a local entry is trusted before the shared tier is asked again.
+# Bounds how long another worker's invalidation can go unnoticed.
+LOCAL_TIMEOUT = 60
+
+CACHE_KEY_PREFIX = "rendition_url"
+
+# Cache alias of the shared tier, used when it is configured
+CACHE_ALIAS = "renditions"
+
+# Seconds a shared entry lives; entries for images nobody views expire
+SHARED_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def shared_cache():
+    """The cache backing the shared tier."""
+    return caches[CACHE_ALIAS if CACHE_ALIAS in settings.CACHES else "default"]
+
+
+def image_signature(image_obj):
+    """Return what a rendition of ``image_obj`` depends on besides its spec."""
+    return (
+        getattr(image_obj.file, "name", ""),
+        image_obj.focal_point_x,
+        image_obj.focal_point_y,
+        image_obj.focal_point_width,
+        image_obj.focal_point_height,
+    )
+
+
+def _rendition_to_data(rendition):
+    return {
+        "url": rendition.url,
+        "width": rendition.width,
+        "height": rendition.height,
+    }
+
+
+def _is_cacheable(image_obj, data):
+    return (
+        isinstance(image_obj.pk, int)
+        and isinstance(data["url"], str)
+        and isinstance(data["width"], int)
+        and isinstance(data["height"], int)
+    )
+
+
+class RenditionResolver:
+    """Resolve rendition data for many images at once through both cache tiers."""
+
+    def __init__(self, max_entries=LOCAL_MAX_ENTRIES, timeout=LOCAL_TIMEOUT):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._local = OrderedDict()
+        self._specs_by_image = defaultdict(set)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    # -- public API ---------------------------------------------------------
+
+    def resolve(self, images, profiles):
+        """Resolve named profiles for ``images``.
+
+        Args:
+            images: Iterable of Wagtail image instances.
+            profiles: Dict mapping result keys to profile names (see
+                      ``housegallery.images.renditions``), or a list of
+                      profile names (which are then also the keys).
+
+        Returns:
+            ``{image_id: {key: {"url", "width", "height"} or None}}``.
+        """
+        if not isinstance(profiles, dict):
+            profiles = {name: name for name in profiles}
+        specs = {key: profile_spec(name) for key, name in profiles.items()}
+        return self.resolve_specs(images, specs)
+
+    def resolve_specs(self, images, specs):
+        """Like ``resolve`` but with ``{key: filter spec}``."""
+        images = list(images)
+        return dict(zip(
+            (image.pk for image in images),
+            self.resolve_each(images, specs),
+        ))
+
+    def resolve_each(self, images, specs, generate=True):
+        """Return ``[{key: data or None}]`` for ``{key: filter spec}``, in input order.
+
+        Unlike ``resolve_specs`` this also works for unsaved images. With
+        ``generate=False`` only renditions that already exist are returned;
+        nothing is rendered inside the request.
+        """
+        images = list(images)
+        by_spec = self._resolve(images, set(specs.values()), generate)
+        return [
+            {key: by_spec.get((id(image), spec)) for key, spec in specs.items()}
+            for image in images
+        ]
+
+    def resolve_one(self, image_obj, filter_spec):
+        """Return rendition data for a single image and spec, or None."""
+        return self._resolve([image_obj], {filter_spec}).get((id(image_obj), filter_spec))
+
+    def invalidate(self, image_id, specs=None):
+        """Forget cached entries for an image.
+
+        ``specs`` defaults to every spec this worker has seen for the image
+        plus the standard profiles, which covers the shared tier too.
+        """
+        with self._lock:
+            known = self._specs_by_image.pop(image_id, set())
+            if specs is None:
+                specs = known | set(standard_specs())
+            else:
+                specs = set(specs)
+                remaining = known - specs
+                if remaining:
+                    self._specs_by_image[image_id] = remaining
+            for spec in specs:
+                self._local.pop((image_id, spec), None)
+
+        try:
+            shared_cache().delete_many([self._cache_key(image_id, spec) for spec in specs])
+        except Exception:
+            logger.exception("Could not invalidate cached renditions for image %s", image_id)
+
+    def clear_local(self):
+        """Empty this worker's local tier (the shared tier is left alone)."""
+        with self._lock:
+            self._local.clear()
+            self._specs_by_image.clear()
+
+    def stats(self):
+        """Return hit and miss counters and the local tier's size."""
+        with self._lock:
+            return {
+                "local_hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "local_entries": len(self._local),
+            }
+
+    # -- internals ----------------------------------------------------------
+
+    def _resolve(self, images, specs, generate=True):
+        """Return ``{(id(image), spec): data}`` for every pair that resolves."""
+        from housegallery.core.image_utils import _OriginalAsRendition
+        from housegallery.core.image_utils import _find_rendition_in_prefetch
+        from housegallery.core.image_utils import _get_or_fallback
+
+        found = {}
+        to_share = []  # (image, spec, data)
+        missing = []  # (image, spec)
+
+        # 1. Local tier, then whatever the caller already prefetched
+        now = time.monotonic()
+        for image in images:
+            signature = image_signature(image) if isinstance(image.pk, int) else None
+            for spec in specs:
+                data = self._get_local(image, spec, signature, now)
+                if data is None and _has_prefetched_renditions(image):
+                    rendition = _find_rendition_in_prefetch(image, spec)
+                    if rendition is not None:
+                        data = _rendition_to_data(rendition)
+                        self._set_local(image, spec, signature, data)
+                if data is None:
+                    missing.append((image, spec))
+                else:
+                    found[(id(image), spec)] = data
+
+        # 2. Shared tier, one round trip for the batch
+        if missing:
+            keys = {
+                self._cache_key(image.pk, spec): (image, spec)
+                for image, spec in missing if isinstance(image.pk, int)
+            }
+            try:
+                shared = shared_cache().get_many(list(keys)) if keys else {}
+            except Exception:
+                logger.exception("Could not read cached renditions")
+                shared = {}
+            still_missing = []
+            for image, spec in missing:
+                entry = shared.get(self._cache_key(image.pk, spec)) if isinstance(image.pk, int) else None
+                if entry is not None and entry[0] == image_signature(image):
+                    found[(id(image), spec)] = entry[1]
+                    self._set_local(image, spec, entry[0], entry[1])
+                    self.shared_hits += 1
+                else:
+                    still_missing.append((image, spec))
+            missing = still_missing
+
+        # 3. One query for existing renditions of images without a prefetch
+        unprefetched = [
+            (image, spec) for image, spec in missing
+            if isinstance(image.pk, int) and not _has_prefetched_renditions(image)
+        ]
+        if unprefetched:
+            from housegallery.images.models import Rendition
+
+            wanted = {(image.pk, spec) for image, spec in unprefetched}
+            renditions = {}
+            for rendition in Rendition.objects.filter(
+                image_id__in={image_id for image_id, _spec in wanted},
+                filter_spec__in={spec for _image_id, spec in wanted},
+            ):
+                renditions.setdefault((rendition.image_id, rendition.filter_spec), []).append(rendition)
+            still_missing = []
+            for image, spec in missing:
+                rendition = _match_focal_point(image, spec, renditions.get((image.pk, spec)))
+                if rendition is None:
+                    still_missing.append((image, spec))
+                else:
+                    data = _rendition_to_data(rendition)
+                    found[(id(image), spec)] = data
+                    to_share.append((image, spec, data))
+            missing = still_missing
+
+        # 4. Generate (or stand in for) anything that does not exist yet
+        for image, spec in missing if generate else ():
+            self.misses += 1
+            rendition = _get_or_fallback(image, spec)
+            if rendition is None:
+                continue
+            data = _rendition_to_data(rendition)
+            found[(id(image), spec)] = data
+            if not isinstance(rendition, _OriginalAsRendition):
+                to_share.append((image, spec, data))
+
+        self._share(to_share)
+        return found
+
+    def _get_local(self, image, spec, signature, now):
+        if signature is None:
+            return None
+        key = (image.pk, spec)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires, entry_signature, data = entry
+            if expires <= now or entry_signature != signature:
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def _set_local(self, image, spec, signature, data):
+        if signature is None or not _is_cacheable(image, data):
+            return
+        key = (image.pk, spec)
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.timeout, signature, data)
+            self._local.move_to_end(key)
+            self._specs_by_image[image.pk].add(spec)
+            while len(self._local) > self.max_entries:
+                (old_image_id, old_spec), _entry = self._local.popitem(last=False)
+                specs = self._specs_by_image.get(old_image_id)
+                if specs is not None:
+                    specs.discard(old_spec)
+                    if not specs:
+                        del self._specs_by_image[old_image_id]
+
+    def _share(self, entries):
+        values = {}
+        for image, spec, data in entries:
+            if not _is_cacheable(image, data):
+                continue
+            signature = image_signature(image)
+            self._set_local(image, spec, signature, data)
+            values[self._cache_key(image.pk, spec)] = (signature, data)
+        if not values:
+            return
+        try:
+            shared_cache().set_many(values, SHARED_TIMEOUT)
+        except Exception:
+            logger.exception("Could not cache resolved renditions")
+
+    @staticmethod
+    def _cache_key(image_id, spec):
+        return f"{CACHE_KEY_PREFIX}:{image_id}:{spec}"
+
+
+def _has_prefetched_renditions(image):
+    prefetched = getattr(image, "_prefetched_objects_cache", None)
+    return isinstance(prefetched, dict) and "renditions" in prefetched
+
+
+def _match_focal_point(image, spec, renditions):
+    """Pick the rendition made with the image's current focal point."""
+    if not renditions:
+        return None
+    from housegallery.core.image_utils import focal_point_key
+
+    try:
+        key = focal_point_key(image, spec)
+    except Exception:
+        return None
+    for rendition in renditions:
+        if rendition.focal_point_key == key:
+            return rendition
+    return None
+
+
+# Shared by every request in the process
+resolver = RenditionResolver()
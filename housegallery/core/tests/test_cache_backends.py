@@ -0,0 +1,160 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+
+from housegallery.core.cache_backends import TieredCache
+
+
+SHARED_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tiered-cache-tests",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def _shared_l2(settings):
+    settings.CACHES = SHARED_CACHE
+    caches["shared"].clear()
+
+
+def make_instance(**options):
+    """Return a TieredCache as one app instance would see it."""
+    return TieredCache(None, {"OPTIONS": {"L2": "shared", **options}})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("housegallery.core.cache_backends.time.monotonic", clock):
+        yield clock
+
+
+class TestTieredCache:
+    """Tests for the L1 LRU in front of a shared L2 cache."""
+
+    def test_second_read_is_an_l1_hit(self):
+        cache = make_instance()
+        cache.set("key", "value")
+        cache.clear_local()
+
+        assert cache.get("key") == "value"
+        assert cache.get("key") == "value"
+        assert cache.stats() == {
+            "l1_hits": 1, "l1_misses": 1, "l2_hits": 1, "l2_misses": 0, "l1_entries": 1,
+        }
+
+    def test_miss_on_both_tiers_returns_default(self):
+        cache = make_instance()
+
+        assert cache.get("missing", "default") == "default"
+        assert cache.stats()["l2_misses"] == 1
+
+    def test_lru_is_bounded(self):
+        cache = make_instance(L1_MAX_ENTRIES=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.stats()["l1_entries"] == 2
+        cache.reset_stats()
+        cache.get("b")
+        assert cache.stats()["l2_hits"] == 1
+
+    def test_cached_value_is_not_shared_by_reference(self):
+        cache = make_instance()
+        cache.set("items", [1, 2])
+
+        cache.get("items").append(3)
+        assert cache.get("items") == [1, 2]
+
+    def test_other_instance_sees_change_after_l1_timeout(self, clock):
+        web1 = make_instance(L1_TIMEOUT=5)
+        web2 = make_instance(L1_TIMEOUT=5)
+        web1.set("key", "old")
+        assert web2.get("key") == "old"
+
+        web1.set("key", "new")
+        assert web1.get("key") == "new"
+        assert web2.get("key") == "old"
+
+        clock.now += 5
+        assert web2.get("key") == "new"
+
+    def test_version_keys_use_shorter_window(self, clock):
+        web1 = make_instance(
+            L1_TIMEOUT=60, VERSION_KEYS=["listing_version"], VERSION_KEY_TIMEOUT=1,
+        )
+        web2 = make_instance(
+            L1_TIMEOUT=60, VERSION_KEYS=["listing_version"], VERSION_KEY_TIMEOUT=1,
+        )
+        web1.set("listing_version", 1)
+        assert web2.get("listing_version") == 1
+
+        web1.set("listing_version", 2)
+        clock.now += 1
+        assert web2.get("listing_version") == 2
+
+    def test_delete_on_other_instance_is_visible_after_timeout(self, clock):
+        web1 = make_instance(L1_TIMEOUT=5)
+        web2 = make_instance(L1_TIMEOUT=5)
+        web1.set("key", "value")
+        web2.get("key")
+
+        web1.delete_many(["key"])
+        assert web1.get("key") is None
+
+        clock.now += 5
+        assert web2.get("key") is None
+
+    def test_excluded_prefixes_and_locks_bypass_l1(self):
+        web1 = make_instance(L1_EXCLUDE_PREFIXES=["rate_"])
+        web2 = make_instance(L1_EXCLUDE_PREFIXES=["rate_"])
+        web1.set("rate_1.2.3.4", 1)
+        web2.get("rate_1.2.3.4")
+
+        web1.set("rate_1.2.3.4", 2)
+        assert web2.get("rate_1.2.3.4") == 2
+        assert web2.stats()["l1_hits"] == 0
+
+        assert web1.add("payload:lock", 1)
+        assert not web2.add("payload:lock", 1)
+        web1.delete("payload:lock")
+        assert web2.add("payload:lock", 1)
+
+    def test_get_many_combines_tiers(self):
+        cache = make_instance()
+        cache.set("a", 1)
+        caches["shared"].set("b", 2)
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        stats = cache.stats()
+        assert (stats["l1_hits"], stats["l2_hits"], stats["l2_misses"]) == (1, 1, 1)
+
+    def test_incr_goes_to_l2(self):
+        cache = make_instance()
+        cache.set("count", 1)
+
+        assert cache.incr("count") == 2
+        assert cache.get("count") == 2
+
+    def test_ttl_shorter_than_l1_timeout_is_respected(self, clock):
+        cache = make_instance(L1_TIMEOUT=5)
+        cache.set("key", "value", timeout=2)
+
+        clock.now += 2
+        cache.reset_stats()
+        cache.get("key")
+        assert cache.stats()["l1_hits"] == 0
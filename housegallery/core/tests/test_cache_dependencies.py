@@ -0,0 +1,88 @@
+import pytest
+from django.core.cache import cache
+
+from housegallery.core import cache_dependencies
+from housegallery.core.cache_dependencies import (
+    ANY,
+    ARTWORK,
+    IMAGE,
+    invalidate_dependents,
+    record_dependencies,
+    register_invalidator,
+)
+from housegallery.core.models import CacheDependency
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def _use_locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHE
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestCacheDependencies:
+    """Tests for the dependency-tracked cache invalidation registry."""
+
+    def test_invalidates_only_dependent_keys(self):
+        cache.set("uses_image_1", "a", None)
+        cache.set("uses_image_2", "b", None)
+        record_dependencies("uses_image_1", {IMAGE: [1]})
+        record_dependencies("uses_image_2", {IMAGE: [2]})
+
+        assert invalidate_dependents(IMAGE, [1]) == {"uses_image_1"}
+
+        assert cache.get("uses_image_1") is None
+        assert cache.get("uses_image_2") == "b"
+        assert not CacheDependency.objects.filter(cache_key="uses_image_1").exists()
+
+    def test_kinds_are_independent(self):
+        cache.set("uses_artwork_1", "a", None)
+        record_dependencies("uses_artwork_1", {ARTWORK: [1]})
+
+        invalidate_dependents(IMAGE, [1])
+
+        assert cache.get("uses_artwork_1") == "a"
+
+    def test_any_matches_every_object(self):
+        cache.set("all_images", "a", None)
+        record_dependencies("all_images", {IMAGE: [ANY]})
+
+        invalidate_dependents(IMAGE, [99])
+
+        assert cache.get("all_images") is None
+
+    def test_recording_replaces_previous_dependencies(self):
+        cache.set("payload", "a", None)
+        record_dependencies("payload", {IMAGE: [1]})
+        record_dependencies("payload", {IMAGE: [2]})
+
+        invalidate_dependents(IMAGE, [1])
+
+        assert cache.get("payload") == "a"
+
+    def test_new_version_supersedes_its_family(self):
+        cache.set("listing_v1", "old", None)
+        cache.set("other_v1", "kept", None)
+        record_dependencies("listing_v1", {IMAGE: [1]}, family="listing")
+        record_dependencies("other_v1", {IMAGE: [1]}, family="other")
+
+        record_dependencies("listing_v2", {IMAGE: [2]}, family="listing")
+
+        assert cache.get("listing_v1") is None
+        assert cache.get("other_v1") == "kept"
+        assert set(CacheDependency.objects.values_list("cache_key", flat=True)) == {
+            "listing_v2", "other_v1",
+        }
+
+    def test_registered_invalidator_called_for_prefix(self, monkeypatch):
+        monkeypatch.setattr(cache_dependencies, "_invalidators", {})
+        calls = []
+        register_invalidator("custom_", calls.append)
+        record_dependencies("custom_7", {IMAGE: [1]})
+
+        invalidate_dependents(IMAGE, [1])
+
+        assert calls == ["custom_7"]
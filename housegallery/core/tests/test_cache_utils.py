@@ -0,0 +1,187 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+
+from housegallery.core import cache_utils
+from housegallery.core.cache_utils import get_or_compute, recompute_lock
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+DATABASE_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "test_cache_utils_table",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def _use_locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHE
+    cache.clear()
+
+
+class Counter:
+    def __init__(self, value="fresh"):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.django_db
+class TestGetOrCompute:
+    """Tests for the stampede-protected cache helper."""
+
+    def test_computes_once_then_serves_cached(self):
+        compute = Counter()
+
+        assert get_or_compute("key", compute) == "fresh"
+        assert get_or_compute("key", compute) == "fresh"
+        assert compute.calls == 1
+
+    def test_caches_falsy_values(self):
+        compute = Counter(value=[])
+
+        get_or_compute("key", compute)
+        get_or_compute("key", compute)
+
+        assert compute.calls == 1
+
+    def test_serves_stale_while_another_worker_rebuilds(self, hold_recompute_lock):
+        get_or_compute("key_v1", Counter("old"), stale_key="key_stale")
+        compute = Counter("new")
+
+        with hold_recompute_lock("key_v2"):
+            assert get_or_compute("key_v2", compute, stale_key="key_stale") == "old"
+        assert compute.calls == 0
+
+        assert get_or_compute("key_v2", compute, stale_key="key_stale") == "new"
+
+    def test_fresh_only_callers_wait_instead_of_serving_stale(self, monkeypatch, hold_recompute_lock):
+        monkeypatch.setattr(cache_utils, "WAIT_TIMEOUT", 0.05)
+        get_or_compute("key_v1", Counter("old"), stale_key="key_stale")
+        compute = Counter("new")
+
+        with hold_recompute_lock("key_v2"):
+            assert get_or_compute(
+                "key_v2", compute, stale_key="key_stale", allow_stale=False,
+            ) == "new"
+        assert compute.calls == 1
+
+    def test_waits_then_computes_when_nothing_to_serve(self, monkeypatch, hold_recompute_lock):
+        monkeypatch.setattr(cache_utils, "WAIT_TIMEOUT", 0.05)
+        compute = Counter()
+
+        with hold_recompute_lock("key"):
+            assert get_or_compute("key", compute) == "fresh"
+        assert compute.calls == 1
+
+    def test_refreshes_early_near_expiry(self, monkeypatch):
+        compute = Counter()
+        get_or_compute("key", compute, timeout=60)
+
+        # Pretend the value is about to expire and took long to build
+        value, expires_at, _ = cache.get("key")
+        cache.set("key", (value, time.time() + 0.001, 10.0), 60)
+
+        get_or_compute("key", compute, timeout=60)
+        assert compute.calls == 2
+
+    def test_no_early_refresh_without_timeout(self):
+        compute = Counter()
+        get_or_compute("key", compute)
+        get_or_compute("key", compute)
+        assert cache.get("key")[1] is None
+        assert compute.calls == 1
+
+    def test_lock_is_exclusive(self, hold_recompute_lock):
+        with hold_recompute_lock("key"):
+            with recompute_lock("key") as acquired:
+                assert acquired is False
+        with recompute_lock("key") as acquired:
+            assert acquired is True
+
+    def test_lock_is_held_until_the_transaction_ends(self):
+        def acquired_by_another_worker():
+            def attempt():
+                with recompute_lock("key") as acquired:
+                    return acquired
+
+            return _on_own_connection(attempt)
+
+        with transaction.atomic():
+            with recompute_lock("key") as acquired:
+                assert acquired is True
+            # Released with the commit that makes the rebuilt value visible
+            assert acquired_by_another_worker() is False
+
+
+def _on_own_connection(function):
+    """Run ``function`` in a thread with its own database connection, as
+    another worker would, and return its result."""
+    result = []
+
+    def worker():
+        try:
+            result.append(function())
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    return result[0] if result else None
+
+
+@pytest.mark.django_db
+class TestConcurrentRebuild:
+    """Workers in request transactions, sharing the database cache."""
+
+    @pytest.fixture(autouse=True)
+    def _use_database_cache(self, settings):
+        settings.CACHES = DATABASE_CACHE
+        # Outside the test's transaction, so every worker can see it
+        _on_own_connection(lambda: call_command("createcachetable"))
+        yield
+
+        def drop():
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE {DATABASE_CACHE['default']['LOCATION']}")
+
+        _on_own_connection(drop)
+
+    def test_only_one_worker_rebuilds(self):
+        calls = []
+        start = threading.Barrier(3)
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.3)
+            return "fresh"
+
+        results = []
+
+        def worker():
+            try:
+                start.wait()
+                with transaction.atomic():
+                    results.append(get_or_compute("key", compute))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["fresh"] * 3
+        assert len(calls) == 1
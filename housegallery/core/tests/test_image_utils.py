@@ -6,8 +6,10 @@ from housegallery.core.image_utils import (
     _find_rendition_in_prefetch,
     get_image_urls,
     get_image_urls_batch,
+    rendition_prefetch,
 )
 from housegallery.images.models import CustomImage
+from housegallery.images.renditions import profile_spec
 
 
 def _mock_rendition(url="/media/test.jpg", width=400, height=300, filter_spec="width-400"):
@@ -17,6 +19,7 @@ def _mock_rendition(url="/media/test.jpg", width=400, height=300, filter_spec="w
     rendition.width = width
     rendition.height = height
     rendition.filter_spec = filter_spec
+    rendition.focal_point_key = ""
     return rendition
 
 
@@ -55,6 +58,21 @@ class TestFindRenditionInPrefetch:
 
         assert result is None
 
+    def test_crop_from_before_focal_point_edit_is_ignored(self, make_image):
+        image = make_image()
+        image.get_rendition("fill-60x60")
+        image.focal_point_x = image.focal_point_y = 0
+        image.focal_point_width = image.focal_point_height = 1
+        image.save()
+
+        loaded = CustomImage.objects.prefetch_related("renditions").get(pk=image.pk)
+
+        assert [r.filter_spec for r in loaded.renditions.all()] == ["fill-60x60"]
+        assert _find_rendition_in_prefetch(loaded, "fill-60x60") is None
+        assert _find_rendition_in_prefetch(loaded, "width-400") is None
+        loaded.get_rendition("fill-60x60")
+        assert _find_rendition_in_prefetch(loaded, "fill-60x60") is not None
+
     def test_exception_returns_none(self):
         image_obj = MagicMock()
         image_obj.renditions.all.side_effect = RuntimeError("DB error")
@@ -255,3 +273,49 @@ class TestGetImageUrlsBatch:
         assert "tiny_url" in result[0]
         assert "huge_url" in result[0]
         assert "thumb_url" not in result[0]
+
+    def test_batch_renditions_need_no_further_queries(
+        self, make_image, django_assert_num_queries,
+    ):
+        images = [make_image(title=f"Image {i}") for i in range(3)]
+        for image in images:
+            image.get_renditions("width-400", "width-800|format-webp")
+        images = list(CustomImage.objects.filter(pk__in=[i.pk for i in images]))
+        specs = {"thumb": "width-400", "medium": "width-800|format-webp"}
+
+        with django_assert_num_queries(1):
+            result = get_image_urls_batch(images, specs=specs)
+
+        assert all(item["thumb_url"] and item["medium_url"] for item in result)
+
+
+@pytest.mark.django_db
+class TestRenditionPrefetch:
+    def test_loads_only_requested_specs(self, make_image):
+        image = make_image()
+        image.get_renditions("width-400", "fill-60x60")
+
+        loaded = CustomImage.objects.prefetch_related(
+            rendition_prefetch(specs=["width-400"]),
+        ).get(pk=image.pk)
+
+        assert [r.filter_spec for r in loaded.renditions.all()] == ["width-400"]
+        assert _find_rendition_in_prefetch(loaded, "width-400") is not None
+
+    def test_defaults_to_standard_profiles(self, make_image):
+        image = make_image()
+        image.get_renditions(profile_spec("thumb"), "fill-60x60")
+
+        loaded = CustomImage.objects.prefetch_related(rendition_prefetch()).get(pk=image.pk)
+
+        assert [r.filter_spec for r in loaded.renditions.all()] == [profile_spec("thumb")]
+
+    def test_index_picks_up_renditions_added_later(self, make_image):
+        image = make_image()
+        loaded = CustomImage.objects.prefetch_related(rendition_prefetch()).get(pk=image.pk)
+        assert _find_rendition_in_prefetch(loaded, "width-400") is None
+
+        # get_rendition() appends new renditions to the prefetched list
+        loaded.get_rendition("width-400")
+
+        assert _find_rendition_in_prefetch(loaded, "width-400") is not None
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache, caches
+from django.template import Context, Template
+
+from housegallery.core.rendition_resolver import RenditionResolver, resolver
+from housegallery.images.models import CustomImage
+from housegallery.images.renditions import profile_spec
+
+
+@pytest.fixture
+def images(make_image):
+    images = [make_image(title=f"Image {i}") for i in range(3)]
+    for image in images:
+        image.get_rendition(profile_spec("thumb"))
+    return list(CustomImage.objects.filter(pk__in=[i.pk for i in images]))
+
+
+@pytest.mark.django_db
+class TestRenditionResolver:
+    def test_resolves_batch_with_one_query(self, images, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = RenditionResolver().resolve(images, {"small": "thumb"})
+
+        assert set(result) == {image.pk for image in images}
+        for image in images:
+            expected = image.get_rendition(profile_spec("thumb"))
+            assert result[image.pk]["small"] == {
+                "url": expected.url, "width": expected.width, "height": expected.height,
+            }
+
+    def test_second_resolve_needs_no_queries(self, images, django_assert_num_queries):
+        local = RenditionResolver()
+        local.resolve(images, ["thumb"])
+
+        with django_assert_num_queries(0):
+            local.resolve(images, ["thumb"])
+
+        assert local.stats()["local_hits"] == len(images)
+
+    def test_shared_tier_serves_other_processes(self, images, django_assert_num_queries):
+        RenditionResolver().resolve(images, ["thumb"])
+        other = RenditionResolver()
+
+        with django_assert_num_queries(0):
+            result = other.resolve(images, ["thumb"])
+
+        assert all(result[image.pk]["thumb"] for image in images)
+        assert other.stats()["shared_hits"] == len(images)
+
+    def test_shared_tier_uses_its_own_cache(self, images, settings):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"},
+            "renditions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "renditions"},
+        }
+        key = f"rendition_url:{images[0].pk}:{profile_spec('thumb')}"
+
+        RenditionResolver().resolve(images, ["thumb"])
+
+        assert caches["renditions"].get(key) is not None
+        assert caches["default"].get(key) is None
+
+    def test_local_tier_is_bounded(self, images):
+        local = RenditionResolver(max_entries=2)
+
+        local.resolve(images, ["thumb"])
+
+        assert local.stats()["local_entries"] == 2
+
+    def test_focal_point_change_is_not_served_stale(self, images):
+        image = images[0]
+        local = RenditionResolver()
+        local.resolve_one(image, "fill-100x100")
+
+        image.focal_point_x, image.focal_point_y = 0, 0
+        image.focal_point_width = image.focal_point_height = 1
+
+        with patch.object(CustomImage, "get_rendition", wraps=image.get_rendition) as get:
+            local.resolve_one(image, "fill-100x100")
+
+        get.assert_called_once_with("fill-100x100")
+
+    def test_queued_stand_in_is_not_cached(self, make_image):
+        image = make_image()
+        local = RenditionResolver()
+
+        with patch("housegallery.images.rendition_queue.is_rendition_queued", return_value=True):
+            data = local.resolve_one(image, profile_spec("thumb"))
+
+        assert data["url"] == image.file.url
+        assert local.stats()["local_entries"] == 0
+        assert cache.get(f"rendition_url:{image.pk}:{profile_spec('thumb')}") is None
+
+
+@pytest.mark.django_db
+class TestInvalidation:
+    def test_rendition_delete_invalidates(self, images):
+        image = images[0]
+        spec = profile_spec("thumb")
+        assert resolver.resolve_one(image, spec) is not None
+
+        image.renditions.filter(filter_spec=spec).delete()
+
+        assert cache.get(f"rendition_url:{image.pk}:{spec}") is None
+        with patch.object(CustomImage, "get_rendition", return_value=None) as get:
+            resolver.resolve_one(image, spec)
+        get.assert_called_once_with(spec)
+
+    def test_image_save_invalidates(self, images):
+        image = images[0]
+        resolver.resolve(images, ["thumb"])
+
+        image.save()
+
+        assert cache.get(f"rendition_url:{image.pk}:{profile_spec('thumb')}") is None
+        assert resolver.stats()["local_entries"] == len(images) - 1
+
+
+@pytest.mark.django_db
+class TestRenditionTags:
+    def test_rendition_tag(self, images):
+        image = images[0]
+        expected = image.get_rendition(profile_spec("thumb"))
+
+        output = Template(
+            '{% load rendition_tags %}'
+            '{% rendition image "thumb" as img %}{{ img.url }} {{ img.width }}|'
+            '{% rendition_url image "thumb" %}'
+        ).render(Context({"image": image}))
+
+        assert output == f"{expected.url} {expected.width}|{expected.url}"
+
+    def test_missing_image_renders_nothing(self):
+        output = Template(
+            '{% load rendition_tags %}[{% rendition_url image "thumb" %}]'
+        ).render(Context({"image": None}))
+
+        assert output == "[]"
@@ -0,0 +1,89 @@
+"""Compact, versioned snapshot of the exhibitions listing for the cache.
+
+The listing used to cache a pickled list of ExhibitionPage instances, which
+drags the whole model graph into every cache row. The snapshot keeps only
+what ``exhibitions_listing.html`` reads and is stored as a JSON string.
+"""
+
+import datetime
+import hashlib
+import json
+
+# Bump when the item layout changes; payloads with another version are
+# treated as a cache miss and rebuilt.
+LISTING_SNAPSHOT_VERSION = 2
+
+
+def build_listing_item(exhibition):
+    """Return the listing fields for a single ExhibitionPage as a plain dict.
+
+    ``fingerprint`` is a hash of the other fields, used as the card's
+    template fragment cache key so any content change renders a fresh card.
+    """
+    item = {
+        "pk": exhibition.pk,
+        "title": exhibition.title,
+        "url": exhibition.url,
+        "start_date": exhibition.start_date,
+        "end_date": exhibition.end_date,
+        "last_published_at": (
+            exhibition.last_published_at.isoformat() if exhibition.last_published_at else ""
+        ),
+        "date_short": exhibition.get_formatted_date_short(),
+        "date_month_year": exhibition.get_formatted_date_month_year(),
+        "artist_names": [
+            exhibition_artist.artist.name
+            for exhibition_artist in exhibition.exhibition_artists.all()
+        ],
+        "video_embed_url": exhibition.video_embed_url or "",
+        "gallery_images": exhibition.get_filtered_gallery_images(),
+    }
+    item["fingerprint"] = hashlib.md5(
+        json.dumps(item, sort_keys=True, default=str).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return item
+
+
+def build_listing_snapshot(exhibitions):
+    """Return listing items for an iterable of ExhibitionPage instances."""
+    return [build_listing_item(exhibition) for exhibition in exhibitions]
+
+
+def encode_listing_snapshot(items):
+    """Serialize listing items to a compact JSON string."""
+    payload = {
+        "version": LISTING_SNAPSHOT_VERSION,
+        "items": [
+            {
+                **item,
+                "start_date": item["start_date"].isoformat() if item["start_date"] else None,
+                "end_date": item["end_date"].isoformat() if item["end_date"] else None,
+            }
+            for item in items
+        ],
+    }
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def decode_listing_snapshot(payload):
+    """Deserialize a payload from encode_listing_snapshot().
+
+    Returns None if the payload is missing, malformed or was written by a
+    different snapshot version.
+    """
+    if not payload:
+        return None
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != LISTING_SNAPSHOT_VERSION:
+        return None
+
+    items = data["items"]
+    for item in items:
+        for key in ("start_date", "end_date"):
+            if item[key]:
+                item[key] = datetime.date.fromisoformat(item[key])
+    return items
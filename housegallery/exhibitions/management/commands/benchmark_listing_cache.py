@@ -0,0 +1,72 @@
+"""
+Management command to compare the exhibitions listing cache payload formats.
+
+Reports payload size and mean load time for the JSON listing snapshot
+against pickled ExhibitionPage lists, the format the listing cache used
+before the snapshot was introduced.
+"""
+
+import pickle
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from housegallery.exhibitions.listing import (
+    build_listing_snapshot,
+    decode_listing_snapshot,
+    encode_listing_snapshot,
+)
+from housegallery.exhibitions.models import ExhibitionsIndexPage
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the exhibitions listing cache payload (JSON snapshot vs pickle)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-id',
+            type=int,
+            help='ExhibitionsIndexPage to benchmark (defaults to the first live one)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=50,
+            help='Number of loads to average over (default: 50)',
+        )
+
+    def handle(self, *args, **options):
+        index_pages = ExhibitionsIndexPage.objects.live()
+        if options['page_id']:
+            index_pages = index_pages.filter(pk=options['page_id'])
+        index_page = index_pages.first()
+        if index_page is None:
+            raise CommandError('No live ExhibitionsIndexPage found')
+
+        iterations = max(1, options['iterations'])
+
+        listing_pages = list(index_page.get_optimized_exhibitions_for_listing())
+        full_graph_pages = index_page.get_optimized_exhibitions()
+        snapshot = build_listing_snapshot(listing_pages)
+
+        payloads = [
+            ('pickle (full prefetch graph)', pickle.dumps(full_graph_pages, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            ('pickle (listing pages)', pickle.dumps(listing_pages, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            ('json snapshot', encode_listing_snapshot(snapshot), decode_listing_snapshot),
+        ]
+
+        self.stdout.write(
+            f'Benchmarking {len(listing_pages)} exhibitions over {iterations} iterations'
+        )
+
+        for label, payload, load in payloads:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                load(payload)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+
+            size = len(payload.encode('utf-8')) if isinstance(payload, str) else len(payload)
+            self.stdout.write(
+                f'  • {label}: {size:,} bytes, {elapsed_ms:.3f} ms per load'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
@@ -0,0 +1,38 @@
+"""
+Management command to (re)build the persisted gallery manifest for exhibitions.
+
+Useful after a deploy that bumps GALLERY_MANIFEST_VERSION, or to warm
+manifests for exhibitions that were published before the table existed.
+"""
+
+from django.core.management.base import BaseCommand
+from housegallery.exhibitions.models import ExhibitionGalleryManifest, ExhibitionPage
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the gallery manifest for live exhibitions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-id',
+            type=int,
+            help='Rebuild the manifest for a single exhibition page',
+        )
+
+    def handle(self, *args, **options):
+        exhibitions = ExhibitionPage.objects.live()
+        if options['page_id']:
+            exhibitions = exhibitions.filter(pk=options['page_id'])
+
+        total_count = exhibitions.count()
+        self.stdout.write(f'Rebuilding gallery manifests for {total_count} exhibitions...')
+
+        for exhibition in exhibitions.iterator():
+            manifest = ExhibitionGalleryManifest.build(exhibition)
+            self.stdout.write(
+                f'  • {exhibition.title}: {len(manifest.all_images)} images'
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {total_count} gallery manifests')
+        )
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.10 on 2026-10-17 00:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exhibitions', '0018_exhibitionphoto'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExhibitionGalleryManifest',
+            fields=[
+                ('page', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='gallery_manifest', serialize=False, to='exhibitions.exhibitionpage')),
+                ('schema_version', models.PositiveSmallIntegerField(default=1)),
+                ('source_published_at', models.DateTimeField(blank=True, null=True)),
+                ('all_images', models.JSONField(default=list)),
+                ('unified_images', models.JSONField(default=list)),
+                ('filtered_images', models.JSONField(default=list)),
+                ('hero_showcards', models.JSONField(default=list)),
+                ('built_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Exhibition Gallery Manifest',
+                'verbose_name_plural': 'Exhibition Gallery Manifests',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exhibitions', '0019_exhibitiongallerymanifest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exhibitiongallerymanifest',
+            name='is_stale',
+            field=models.BooleanField(default=False),
+        ),
+    ]
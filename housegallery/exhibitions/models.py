@@ -1,10 +1,11 @@
 import datetime
 import random
 
-from django.core.paginator import EmptyPage
-from django.core.paginator import PageNotAnInteger
-from django.core.paginator import Paginator
 from django.db import models
+from django.db.models import F
+from django.db.models import Q
+from django.http import HttpResponseBadRequest
+from django.template.response import TemplateResponse
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
 from wagtail import blocks
@@ -27,6 +28,8 @@ from housegallery.core.blocks import BlankStreamBlock
 from housegallery.core.mixins import ListingFields
 from housegallery.core.mixins import Page
 from housegallery.exhibitions.blocks import ExhibitionStreamBlock
+from housegallery.images.renditions import profile_spec
+from housegallery.images.renditions import profile_specs
 
 from .views import ExhibitionImageChooserWidget
 
@@ -85,13 +88,19 @@ class MultipleImagesBlock(blocks.Block):
         label = "Multiple Images"
 
 
-class ExhibitionsIndexPage(Page, ListingFields):
+class ExhibitionsIndexPage(RoutablePageMixin, Page, ListingFields):
     """A page listing all exhibitions."""
 
     body = StreamField(ExhibitionStreamBlock(), blank=True)
 
     template = "pages/exhibitions/exhibitions_listing.html"
 
+    # Number of exhibition cards rendered per chunk of the listing
+    LISTING_CHUNK_SIZE = 10
+    # Chunks are invalidated explicitly; the TTL only clears out versions
+    # nobody asks for any more
+    LISTING_CACHE_TIMEOUT = 60 * 60 * 24
+
     parent_page_types = [
         "home.HomePage",
         "core.BlankPage",
@@ -119,120 +128,61 @@ class ExhibitionsIndexPage(Page, ListingFields):
         """
         Return all live ExhibitionPage objects with optimized prefetching.
 
-        This method loads all data needed for the exhibition detail page in a single
-        optimized queryset, eliminating N+1 queries by prefetching:
+        This method loads all data needed for the exhibition detail page in a
+        fixed number of queries, eliminating N+1 queries by prefetching:
         - Exhibition core relationships (artists, artworks)
-        - All photo types with their images and renditions
+        - All photo types with their images and renditions, loaded together
+          by load_exhibition_photos()
+
+        Returns a list, since the photo relations are attached after the
+        pages are fetched.
 
         NOTE: For listing pages, use get_optimized_exhibitions_for_listing() instead
         to avoid prefetching photo types not used in the listing template.
         """
         from django.db.models import Prefetch
-
-        return ExhibitionPage.objects.live().public().descendant_of(self).prefetch_related(
-            # Core exhibition relationships (basic only)
-            "exhibition_artists__artist",
-            Prefetch("exhibition_artworks",
-                queryset=ExhibitionArtwork.objects
-                    .select_related("artwork")
-                    .prefetch_related(
-                        "artwork__artwork_images__image",
-                        "artwork__artwork_images__image__renditions",
-                        "artwork__artists",
-                        "artwork__materials",
-                    ),
-            ),
-
-            # Photo prefetches (simplified - no artwork relationships)
-            Prefetch("installation_photos",
-                queryset=InstallationPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-            Prefetch("opening_reception_photos",
-                queryset=OpeningReceptionPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-            Prefetch("showcard_photos",
-                queryset=ShowcardPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-            Prefetch("in_progress_photos",
-                queryset=InProgressPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-            Prefetch("exhibition_images",
-                queryset=ExhibitionImage.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # New unified exhibition photos
-            Prefetch("exhibition_photos",
-                queryset=ExhibitionPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions", "image__tags"),
-            ),
-
-        ).order_by("-start_date")
+        from housegallery.core.image_utils import rendition_prefetch
+
+        exhibitions = list(
+            ExhibitionPage.objects.live().public().descendant_of(self).prefetch_related(
+                # Core exhibition relationships (basic only)
+                "exhibition_artists__artist",
+                Prefetch("exhibition_artworks",
+                    queryset=ExhibitionArtwork.objects
+                        .select_related("artwork")
+                        .prefetch_related(
+                            "artwork__artwork_images__image",
+                            rendition_prefetch("artwork__artwork_images__image__renditions"),
+                            "artwork__artists",
+                            "artwork__materials",
+                        ),
+                ),
+            ).order_by("-start_date")
+        )
+        load_exhibition_photos(exhibitions)
+        return exhibitions
 
     def get_optimized_exhibitions_for_listing(self):
         """
         Return exhibitions with minimal prefetching for listing pages.
 
-        This method only prefetches what the listing template actually uses:
+        This method only loads what the listing template actually uses:
         - exhibition_artists (for artist names)
-        - showcard_photos (for first/last showcard)
-        - installation_photos (for gallery images)
-        - exhibition_artworks (for artwork images in gallery)
-
-        Saves ~6 queries compared to get_optimized_exhibitions() by NOT prefetching:
-        - opening_reception_photos
-        - in_progress_photos
-        - exhibition_images
-        """
-        from django.db.models import Prefetch
+        - gallery_manifest (pre-resolved gallery images, joined in the
+          main query)
 
-        return ExhibitionPage.objects.live().public().descendant_of(self).prefetch_related(
-            # Core exhibition relationships
-            "exhibition_artists__artist",
-
-            # Only showcard photos for listing (first + ending image)
-            Prefetch("showcard_photos",
-                queryset=ShowcardPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # Installation photos for gallery
-            Prefetch("installation_photos",
-                queryset=InstallationPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # Exhibition artworks for gallery
-            Prefetch("exhibition_artworks",
-                queryset=ExhibitionArtwork.objects
-                    .select_related("artwork")
-                    .prefetch_related(
-                        "artwork__artwork_images__image",
-                        "artwork__artwork_images__image__renditions",
-                        "artwork__artists",
-                        "artwork__materials",
-                    ),
-            ),
+        Photo relations, artworks and renditions are not loaded at all; the
+        card galleries are read from each exhibition's gallery manifest.
 
-            # New unified exhibition photos
-            Prefetch("exhibition_photos",
-                queryset=ExhibitionPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions", "image__tags"),
-            ),
-        ).order_by("-start_date")
+        Ordered newest first by (start_date, pk) so it can be keyset-paginated;
+        exhibitions without a start date come last.
+        """
+        return (
+            ExhibitionPage.objects.live().public().descendant_of(self)
+            .select_related("gallery_manifest")
+            .prefetch_related("exhibition_artists__artist")
+            .order_by(F("start_date").desc(nulls_last=True), "-pk")
+        )
 
     def get_exhibitions(self):
         """Backwards compatibility wrapper for get_optimized_exhibitions."""
@@ -260,66 +210,136 @@ class ExhibitionsIndexPage(Page, ListingFields):
         # Use timestamp as version for guaranteed uniqueness
         cache.set('exhibitions_listing_version', int(time.time()), None)
 
-    def get_context(self, request):
-        """Add exhibitions to the context with upcoming/current/past categorization.
+    def get_listing_chunk(self, after=None, after_id=None):
+        """Return one keyset-paginated chunk of listing items.
 
-        PERFORMANCE: Caches the exhibition queryset to avoid 25+ prefetch queries
-        on repeat visits. Cache is invalidated via signal when any exhibition
-        is published.
+        Args:
+            after: start_date of the last card already shown, or None to
+                   start from the newest exhibition. An empty string means the
+                   previous chunk ended inside the undated exhibitions.
+            after_id: pk of the last card already shown, used to break ties
+                      between exhibitions sharing a start date.
+
+        Returns a tuple of (items, next_cursor) where next_cursor is a dict of
+        query parameters for the following chunk, or None on the last chunk.
+
+        PERFORMANCE: Only the requested chunk is loaded and each chunk is
+        cached as a compact JSON listing snapshot (see
+        ``housegallery.exhibitions.listing``). Cache is invalidated via signal
+        when any exhibition is published, or when an exhibition or artist in
+        the chunk changes. Rebuilds are stampede-protected: other requests
+        keep serving the previous snapshot meanwhile.
         """
-        from django.core.cache import cache
-        from django.utils import timezone
+        from housegallery.core.cache_dependencies import ARTIST, EXHIBITION, record_dependencies
+        from housegallery.core.cache_utils import get_or_compute
+        from housegallery.exhibitions.listing import (
+            LISTING_SNAPSHOT_VERSION,
+            build_listing_snapshot,
+            decode_listing_snapshot,
+            encode_listing_snapshot,
+        )
 
-        context = super().get_context(request)
+        chunk_size = self.LISTING_CHUNK_SIZE
+        chunk_id = f"{after}_{after_id}_{chunk_size}"
 
         # Build cache key using version that changes on any exhibition publish
         cache_version = self.get_cache_version()
-        cache_key = f"exhibitions_listing_{self.pk}_{cache_version}"
+        cache_key = f"exhibitions_listing_v{LISTING_SNAPSHOT_VERSION}_{self.pk}_{cache_version}_{chunk_id}"
+        # Same chunk from any version, served while a new version is rebuilt
+        stale_key = f"exhibitions_listing_v{LISTING_SNAPSHOT_VERSION}_{self.pk}_stale_{chunk_id}"
+
+        def build_chunk():
+            exhibitions = self.get_optimized_exhibitions_for_listing()
+            if after == "":
+                exhibitions = exhibitions.filter(start_date__isnull=True)
+                if after_id is not None:
+                    exhibitions = exhibitions.filter(pk__lt=after_id)
+            elif after is not None:
+                later = Q(start_date__lt=after) | Q(start_date__isnull=True)
+                if after_id is not None:
+                    later |= Q(start_date=after, pk__lt=after_id)
+                exhibitions = exhibitions.filter(later)
+
+            # One extra item tells us whether another chunk follows
+            exhibitions = list(exhibitions[:chunk_size + 1])
+            record_dependencies(cache_key, {
+                EXHIBITION: [exhibition.pk for exhibition in exhibitions],
+                ARTIST: [
+                    exhibition_artist.artist_id
+                    for exhibition in exhibitions
+                    for exhibition_artist in exhibition.exhibition_artists.all()
+                ],
+            }, family=stale_key)
+            return encode_listing_snapshot(build_listing_snapshot(exhibitions))
+
+        # Kept until an exhibition publish bumps the version or a recorded
+        # dependency changes; only one worker rebuilds after either. The
+        # previous version is deleted when this one is recorded.
+        items = decode_listing_snapshot(get_or_compute(
+            cache_key, build_chunk, timeout=self.LISTING_CACHE_TIMEOUT, stale_key=stale_key,
+        ))
+        if items is None:
+            items = decode_listing_snapshot(build_chunk())
+
+        if len(items) <= chunk_size:
+            return items, None
+
+        items = items[:chunk_size]
+        last = items[-1]
+        next_cursor = {
+            "after": last["start_date"].isoformat() if last["start_date"] else "",
+            "after_id": last["pk"],
+        }
+        return items, next_cursor
 
-        # Try to get cached exhibitions
-        cached_data = cache.get(cache_key)
+    def get_cards_url(self, cursor):
+        """Return the URL of the card fragment for a cursor from get_listing_chunk()."""
+        from django.utils.http import urlencode
+        return self.url + self.reverse_subpage('cards') + "?" + urlencode(cursor)
 
-        if cached_data is not None:
-            all_exhibitions = cached_data
-        else:
-            # Cache miss - run the expensive prefetch query
-            all_exhibitions = list(self.get_optimized_exhibitions_for_listing())
-            # Cache for 1 hour (will be invalidated sooner if exhibition published)
-            cache.set(cache_key, all_exhibitions, 3600)
+    def get_context(self, request):
+        """Add the first chunk of exhibitions to the context.
 
-        # Get today's date for comparison
-        today = timezone.now().date()
+        Further cards are fetched from the ``cards/`` fragment endpoint as the
+        visitor scrolls, so the initial HTML stays the same size however large
+        the archive grows.
+        """
+        context = super().get_context(request)
 
-        # Filter exhibitions by date
-        upcoming_exhibitions = []
-        current_exhibitions = []
-        past_exhibitions = []
-
-        for exhibition in all_exhibitions:
-            if exhibition.start_date and exhibition.start_date > today:
-                upcoming_exhibitions.append(exhibition)
-            elif (exhibition.start_date and exhibition.start_date <= today and
-                  ((exhibition.end_date and exhibition.end_date >= today) or not exhibition.end_date)):
-                current_exhibitions.append(exhibition)
-            else:
-                past_exhibitions.append(exhibition)
+        exhibitions, next_cursor = self.get_listing_chunk()
+
+        context["exhibitions"] = exhibitions
+        context["next_cards_url"] = self.get_cards_url(next_cursor) if next_cursor else None
+        return context
 
-        # Paginate only past exhibitions
-        paginator = Paginator(past_exhibitions, 10)  # Show 10 past exhibitions per page
-        page = request.GET.get("page")
+    @route(r'^cards/$', name='cards')
+    def cards_view(self, request):
+        """
+        Render the next chunk of exhibition cards as an HTML fragment.
 
+        Accessible at /exhibitions/cards/?after=<date>&after_id=<pk>
+        """
+        after = request.GET.get("after")
+        after_id = request.GET.get("after_id")
         try:
-            paginated_past_exhibitions = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_past_exhibitions = paginator.page(1)
-        except EmptyPage:
-            paginated_past_exhibitions = paginator.page(paginator.num_pages)
-
-        context["upcoming_exhibitions"] = upcoming_exhibitions
-        context["current_exhibitions"] = current_exhibitions
-        context["past_exhibitions"] = paginated_past_exhibitions
-        context["all_exhibitions"] = all_exhibitions
-        return context
+            if after:
+                after = datetime.date.fromisoformat(after)
+            if after_id is not None:
+                after_id = int(after_id)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid cursor")
+
+        exhibitions, next_cursor = self.get_listing_chunk(after=after, after_id=after_id)
+
+        return TemplateResponse(
+            request,
+            "components/exhibitions/exhibition_listing_cards.html",
+            {
+                "page": self,
+                "exhibitions": exhibitions,
+                "next_cards_url": self.get_cards_url(next_cursor) if next_cursor else None,
+            },
+        )
 
 
 class ExhibitionArtist(Orderable):
@@ -537,6 +557,215 @@ class ExhibitionImage(Orderable):
         verbose_name_plural = "Exhibition Images"
 
 
+# Listing and catalog cards only need the small thumbnail; WebP and larger
+# sizes are skipped for performance
+THUMB_ONLY_SPECS = profile_specs({"thumb": "thumb"})
+
+
+# Photo relations on ExhibitionPage loaded together by load_exhibition_photos().
+# Maps the related_name to the through model.
+EXHIBITION_PHOTO_RELATIONS = {
+    "installation_photos": InstallationPhoto,
+    "opening_reception_photos": OpeningReceptionPhoto,
+    "showcard_photos": ShowcardPhoto,
+    "in_progress_photos": InProgressPhoto,
+    "exhibition_images": ExhibitionImage,
+    "exhibition_photos": ExhibitionPhoto,
+}
+
+
+def _photo_rows(relation, model, page_ids):
+    """Project one photo model onto the shared column layout used by the UNION.
+
+    Every column is an annotation (added in the same order for each model)
+    so the SELECT lists line up regardless of which fields a model has.
+    """
+    from django.db.models import CharField, IntegerField, Value
+
+    field_names = {field.name for field in model._meta.get_fields()}
+
+    def field_or(name, default, output_field):
+        if name in field_names:
+            return F(name)
+        return Value(default, output_field=output_field)
+
+    return (
+        model.objects.filter(page_id__in=page_ids)
+        .order_by()
+        .annotate(
+            row_relation=Value(relation, output_field=CharField()),
+            row_id=F("pk"),
+            row_page_id=F("page_id"),
+            row_image_id=F("image_id"),
+            row_sort_order=F("sort_order"),
+            row_caption=field_or("caption", "", CharField()),
+            row_image_type=field_or("image_type", "", CharField()),
+            row_related_artwork_id=field_or("related_artwork", None, IntegerField()),
+        )
+        .values_list(
+            "row_relation",
+            "row_id",
+            "row_page_id",
+            "row_image_id",
+            "row_sort_order",
+            "row_caption",
+            "row_image_type",
+            "row_related_artwork_id",
+        )
+    )
+
+
+def load_exhibition_photos(pages):
+    """Load every legacy photo relation for ``pages`` in a fixed number of queries.
+
+    One UNION query fetches the rows of all six photo models, then the images
+    are loaded once with their standard renditions and tags prefetched. The results
+    are attached to each page's prefetch cache, so ``page.installation_photos.all()``
+    and the ``get_*_images`` helpers read them without further queries.
+
+    Returns a dict mapping page pk to ``{related_name: [photo, ...]}``, each
+    list ordered by ``sort_order`` then pk.
+    """
+    from wagtail.images import get_image_model
+    from housegallery.core.image_utils import rendition_prefetch
+
+    pages = list(pages)
+    page_ids = [page.pk for page in pages]
+    photos_by_page = {
+        page_id: {relation: [] for relation in EXHIBITION_PHOTO_RELATIONS}
+        for page_id in page_ids
+    }
+    if not page_ids:
+        return photos_by_page
+
+    querysets = [
+        _photo_rows(relation, model, page_ids)
+        for relation, model in EXHIBITION_PHOTO_RELATIONS.items()
+    ]
+    rows = list(querysets[0].union(*querysets[1:], all=True))
+
+    image_ids = {row[3] for row in rows}
+    images = get_image_model().objects.filter(pk__in=image_ids).prefetch_related(
+        rendition_prefetch(), "tags",
+    )
+    images_by_id = {image.pk: image for image in images}
+
+    pages_by_id = {page.pk: page for page in pages}
+    rows.sort(key=lambda row: (row[4] is None, row[4] or 0, row[1]))
+    for relation, pk, page_id, image_id, sort_order, caption, image_type, artwork_id in rows:
+        model = EXHIBITION_PHOTO_RELATIONS[relation]
+        fields = {"pk": pk, "page_id": page_id, "image_id": image_id, "sort_order": sort_order}
+        if relation in ("exhibition_images", "exhibition_photos"):
+            fields["caption"] = caption
+        if relation == "exhibition_images":
+            fields["image_type"] = image_type
+        if relation in ("installation_photos", "exhibition_images", "exhibition_photos"):
+            fields["related_artwork_id"] = artwork_id
+
+        photo = model(**fields)
+        photo._state.adding = False
+        photo._state.db = "default"
+        photo.page = pages_by_id[page_id]
+        photo.image = images_by_id[image_id]
+        photos_by_page[page_id][relation].append(photo)
+
+    for page in pages:
+        if not hasattr(page, "_prefetched_objects_cache"):
+            page._prefetched_objects_cache = {}  # noqa: SLF001
+        for relation, model in EXHIBITION_PHOTO_RELATIONS.items():
+            queryset = model.objects.filter(page_id=page.pk)
+            queryset._result_cache = photos_by_page[page.pk][relation]  # noqa: SLF001
+            queryset._prefetch_done = True  # noqa: SLF001
+            page._prefetched_objects_cache[relation] = queryset  # noqa: SLF001
+
+    return photos_by_page
+
+
+# Bump when the shape of the stored image dicts changes so existing
+# manifests are rebuilt on first read instead of serving the old format.
+GALLERY_MANIFEST_VERSION = 1
+
+
+class ExhibitionGalleryManifest(models.Model):
+    """Pre-resolved gallery image lists for a single exhibition.
+
+    Built by the publish pipeline (see ``signals.py``) so that page views read
+    one row by primary key instead of walking the photo relations and
+    resolving renditions for every image.
+    """
+    page = models.OneToOneField(
+        "ExhibitionPage",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="gallery_manifest",
+    )
+    schema_version = models.PositiveSmallIntegerField(default=GALLERY_MANIFEST_VERSION)
+    source_published_at = models.DateTimeField(null=True, blank=True)
+    all_images = models.JSONField(default=list)
+    unified_images = models.JSONField(default=list)
+    filtered_images = models.JSONField(default=list)
+    hero_showcards = models.JSONField(default=list)
+    is_stale = models.BooleanField(default=False)
+    built_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Exhibition Gallery Manifest"
+        verbose_name_plural = "Exhibition Gallery Manifests"
+
+    def __str__(self):
+        return f"Gallery manifest for page {self.page_id}"
+
+    def is_current_for(self, page):
+        """Return True if this manifest was built from ``page``'s live revision."""
+        return (
+            self.schema_version == GALLERY_MANIFEST_VERSION
+            and self.source_published_at == page.last_published_at
+            and not self.is_stale
+        )
+
+    def is_servable(self):
+        """Return True if this manifest can be shown while a rebuild runs."""
+        return self.schema_version == GALLERY_MANIFEST_VERSION
+
+    @staticmethod
+    def dependency_key(page_id):
+        """Key under which the manifest's dependencies are recorded."""
+        return f"gallery_manifest_{page_id}"
+
+    @classmethod
+    def build(cls, page):
+        """Resolve every gallery list for ``page`` and store them in one row.
+
+        Records the images, artworks, artists and tags it was built from so
+        editing any of them drops the manifest (see ``signals.py``).
+        """
+        from housegallery.core.cache_dependencies import record_dependencies
+
+        source = ExhibitionPage.get_optimized_exhibition_detail(page.pk) or page
+        manifest, _ = cls.objects.update_or_create(
+            page_id=page.pk,
+            defaults={
+                "schema_version": GALLERY_MANIFEST_VERSION,
+                "source_published_at": page.last_published_at,
+                "all_images": source._build_all_gallery_images(),
+                "unified_images": source._build_unified_gallery_images(),
+                "filtered_images": source._build_filtered_gallery_images(),
+                "hero_showcards": source._build_hero_showcards(),
+                "is_stale": False,
+            },
+        )
+        record_dependencies(cls.dependency_key(page.pk), source._get_gallery_dependencies())
+        return manifest
+
+    @classmethod
+    def mark_stale(cls, page_id):
+        """Flag the manifest so the next read (or publish) rebuilds it.
+
+        The row is kept so other requests can serve it while one rebuilds.
+        """
+        cls.objects.filter(page_id=page_id).update(is_stale=True)
+
+
 
 
 
@@ -658,7 +887,7 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
     # No need for properties that create additional queries
 
     @classmethod
-    def get_optimized_exhibition_detail(cls, page_pk):
+    def get_optimized_exhibition_detail(cls, page_pk, include_photos=True):
         """
         Return an ExhibitionPage with all relationships optimally prefetched.
 
@@ -669,15 +898,37 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         Usage in view or serve():
             exhibition = ExhibitionPage.get_optimized_exhibition_detail(self.pk)
 
-        PERFORMANCE: Reduces ~60+ queries to ~8 queries by prefetching:
-        - All photo types with images and renditions
+        PERFORMANCE: Reduces ~60+ queries to ~12 queries by prefetching:
+        - All photo types with images and renditions (via load_exhibition_photos)
         - Artworks with their images, artists, and materials
         - Exhibition artists
+
+        Pass ``include_photos=False`` when gallery images are read from the
+        gallery manifest and only artists/artworks are needed.
+        """
+        return cls.get_optimized_exhibitions_detail(
+            [page_pk], include_photos=include_photos,
+        ).get(page_pk)
+
+    @classmethod
+    def get_optimized_exhibitions_detail(cls, page_pks, include_photos=True):
+        """
+        Bulk version of get_optimized_exhibition_detail().
+
+        Returns ``{pk: ExhibitionPage}`` for the pages that exist, loaded in
+        the same fixed number of queries however many pks are passed. The
+        gallery manifest is joined in, so ``get_all_gallery_images()`` and
+        friends cost no further queries.
         """
         from django.db.models import Prefetch
         from housegallery.artworks.models import ArtworkImage
+        from housegallery.core.image_utils import rendition_prefetch
 
-        return cls.objects.filter(pk=page_pk).prefetch_related(
+        page_pks = list(page_pks)
+        if not page_pks:
+            return {}
+
+        prefetches = [
             # Exhibition artists
             "exhibition_artists__artist",
 
@@ -689,58 +940,38 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                         Prefetch("artwork__artwork_images",
                             queryset=ArtworkImage.objects
                                 .select_related("image")
-                                .prefetch_related("image__renditions"),
+                                .prefetch_related(rendition_prefetch("image__renditions")),
                         ),
                         "artwork__artists",
                         "artwork__materials",
                     ),
             ),
+        ]
 
-            # Installation photos with images and renditions
-            Prefetch("installation_photos",
-                queryset=InstallationPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # Opening reception photos
-            Prefetch("opening_reception_photos",
-                queryset=OpeningReceptionPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # Showcard photos
-            Prefetch("showcard_photos",
-                queryset=ShowcardPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # In progress photos
-            Prefetch("in_progress_photos",
-                queryset=InProgressPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions"),
-            ),
-
-            # New unified exhibition photos
-            Prefetch("exhibition_photos",
-                queryset=ExhibitionPhoto.objects
-                    .select_related("image")
-                    .prefetch_related("image__renditions", "image__tags"),
-            ),
-        ).first()
+        pages = list(
+            cls.objects.filter(pk__in=page_pks)
+            .select_related("gallery_manifest")
+            .prefetch_related(*prefetches),
+        )
+        if include_photos:
+            # All photo types for every page with images and renditions in
+            # one UNION query
+            load_exhibition_photos(pages)
+        return {page.pk: page for page in pages}
 
     def get_context(self, request):
         """
         Add optimized exhibition data to the context.
 
         PERFORMANCE: Replaces 'self' with an optimized prefetch version to ensure
-        all template access to related data uses prefetched querysets.
+        all template access to related data uses prefetched querysets. Gallery
+        images come from the gallery manifest, so the photo relations are not
+        loaded at all.
         """
-        # Get optimized version of this page with all prefetches
-        optimized_page = ExhibitionPage.get_optimized_exhibition_detail(self.pk)
+        # Get optimized version of this page with artist/artwork prefetches
+        optimized_page = ExhibitionPage.get_optimized_exhibition_detail(
+            self.pk, include_photos=False,
+        )
         if optimized_page:
             # Copy prefetched data to self so template uses it
             self._prefetched_objects_cache = getattr(optimized_page, '_prefetched_objects_cache', {})
@@ -748,6 +979,63 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         context = super().get_context(request)
         return context
 
+    def get_gallery_manifest(self):
+        """Return this page's gallery manifest, rebuilding it if missing or stale.
+
+        Listing querysets ``select_related("gallery_manifest")`` so this costs
+        no extra query there; elsewhere it is a single primary-key lookup.
+
+        Only one worker rebuilds a stale manifest at a time; others serve the
+        stale one meanwhile.
+        """
+        from housegallery.core.cache_utils import recompute_lock
+
+        manifest = getattr(self, "_gallery_manifest", None)
+        if manifest is not None:
+            return manifest
+
+        try:
+            manifest = self.gallery_manifest
+        except ExhibitionGalleryManifest.DoesNotExist:
+            manifest = None
+
+        if manifest is None or not manifest.is_current_for(self):
+            lock_key = ExhibitionGalleryManifest.dependency_key(self.pk)
+            with recompute_lock(lock_key) as acquired:
+                if acquired or manifest is None or not manifest.is_servable():
+                    manifest = ExhibitionGalleryManifest.build(self)
+
+        self._gallery_manifest = manifest
+        return manifest
+
+    def _get_gallery_dependencies(self):
+        """Return the objects the gallery manifest is built from.
+
+        Expects the relations loaded by get_optimized_exhibition_detail().
+        """
+        from housegallery.core.cache_dependencies import ARTIST, ARTWORK, IMAGE, TAG
+
+        photos = [
+            *self.installation_photos.all(),
+            *self.opening_reception_photos.all(),
+            *self.showcard_photos.all(),
+            *self.in_progress_photos.all(),
+            *self.exhibition_photos.all(),
+        ]
+        dependencies = {
+            IMAGE: [photo.image_id for photo in photos],
+            ARTWORK: [],
+            ARTIST: [],
+            TAG: [tag.pk for photo in self.exhibition_photos.all() for tag in photo.image.tags.all()],
+        }
+        for exhibition_artwork in self.exhibition_artworks.all():
+            artwork = exhibition_artwork.artwork
+            dependencies[ARTWORK].append(artwork.pk)
+            dependencies[IMAGE].extend(ai.image_id for ai in artwork.artwork_images.all())
+            dependencies[ARTIST].extend(artist.pk for artist in artwork.artists.all())
+            dependencies[TAG].extend(tag.pk for tag in artwork.materials.all())
+        return dependencies
+
     def get_exhibition_images(self):
         """Get all installation photos (for backward compatibility)"""
         return self.installation_photos.all()
@@ -773,18 +1061,9 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
 
         Returns list of image data dicts with pre-computed URLs.
         """
-        from django.core.cache import cache
-        timestamp = int(self.last_published_at.timestamp()) if self.last_published_at else 0
-        cache_key = f"exhibition_images_by_type_{self.pk}_{timestamp}_{image_type}"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
-
         all_images = self.get_all_gallery_images()
         if image_type:
             all_images = [img for img in all_images if img.get("type") == image_type]
-
-        cache.set(cache_key, all_images, 3600)
         return all_images
 
     def get_exhibition_images_with_urls(self):
@@ -802,20 +1081,18 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
     def get_all_gallery_images(self):
         """Get all images from all typed image models with artwork data.
 
-        PERFORMANCE: Uses prefetched data when available. Uses the shared
-        ``get_image_urls`` utility which checks prefetched renditions first and
-        produces ``srcset`` / ``sizes`` strings for responsive images.
+        PERFORMANCE: Read from the persisted gallery manifest, so rendering
+        costs at most one query regardless of how many photos are attached.
         """
-        from django.core.cache import cache
+        return self.get_gallery_manifest().all_images
 
-        # Simple cache key based on exhibition ID and last published date
-        timestamp = int(self.last_published_at.timestamp()) if self.last_published_at else 0
-        cache_key = f"exhibition_images_{self.pk}_{timestamp}"
-        cached_images = cache.get(cache_key)
-
-        if cached_images is not None:
-            return cached_images
+    def _build_all_gallery_images(self):
+        """Resolve the ``all_images`` list stored on the gallery manifest.
 
+        Uses prefetched data when available. Uses the shared
+        ``get_image_urls`` utility which checks prefetched renditions first and
+        produces ``srcset`` / ``sizes`` strings for responsive images.
+        """
         from housegallery.core.image_utils import get_image_urls
 
         images = []
@@ -831,6 +1108,8 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 "image_title": urls["title"],
                 "caption": urls["title"],
                 "credit": urls["credit"],
+                "placeholder": urls["placeholder"],
+                "dominant_color": urls["dominant_color"],
                 "type": image_type,
                 "thumb_url": urls["thumb_url"] or urls["original_url"],
                 "full_url": urls["original_url"],
@@ -838,6 +1117,7 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 "full_webp_url": urls["original_url"],
                 "srcset": urls["srcset"],
                 "sizes": urls["sizes"],
+                "avif_srcset": urls["avif_srcset"],
             }
 
             return image_data
@@ -876,9 +1156,6 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 image_data["caption"] = photo.caption
             images.append(image_data)
 
-        # Cache the processed images for 1 hour
-        cache.set(cache_key, images, 3600)
-
         return images
 
     def get_randomized_gallery_images(self, seed=None):
@@ -908,16 +1185,17 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         Args:
             max_images: Maximum number of images to return (None = no limit, show all)
         """
-        from django.core.cache import cache
-
-        # Simple cache key based on exhibition ID, last published date, and max_images
-        timestamp = int(self.last_published_at.timestamp()) if self.last_published_at else 0
-        cache_key = f"exhibition_filtered_images_v2_{self.pk}_{timestamp}_{max_images}"
-        cached_images = cache.get(cache_key)
+        images = self.get_gallery_manifest().filtered_images
+        if max_images is not None:
+            images = images[:max_images]
+        return images
 
-        if cached_images is not None:
-            return cached_images
+    def _build_filtered_gallery_images(self):
+        """Resolve the ``filtered_images`` list stored on the gallery manifest.
 
+        The middle section is shuffled once here, so the order stays stable
+        until the manifest is rebuilt.
+        """
         images = []
         from housegallery.core.image_utils import get_image_urls
 
@@ -929,13 +1207,15 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
             Uses prefetched renditions when available.
             """
             image_obj = gallery_image.image
-            urls = get_image_urls(image_obj, specs={"thumb": "width-400"})
+            urls = get_image_urls(image_obj, specs=THUMB_ONLY_SPECS)
 
             # Base image data - store only serializable values for caching
             image_data = {
                 "image_title": urls["title"],
                 "caption": urls["title"],
                 "credit": urls["credit"],
+                "placeholder": urls["placeholder"],
+                "dominant_color": urls["dominant_color"],
                 "type": image_type,
                 "thumb_url": urls["thumb_url"],
                 "thumb_width": urls["width"],
@@ -963,7 +1243,7 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
             first_artwork_image = artwork_images[0]
             primary_image = first_artwork_image.image
 
-            urls = get_image_urls(primary_image, specs={"thumb": "width-400"})
+            urls = get_image_urls(primary_image, specs=THUMB_ONLY_SPECS)
 
             # Format materials as string (use prefetched data)
             materials_list = list(artwork.materials.all())
@@ -977,6 +1257,8 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 "image_title": urls["title"],
                 "caption": urls["title"],
                 "credit": urls["credit"],
+                "placeholder": urls["placeholder"],
+                "dominant_color": urls["dominant_color"],
                 "type": "artwork",
                 "thumb_url": urls["thumb_url"],
                 "thumb_width": urls["width"],
@@ -1049,13 +1331,6 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         for showcard in all_showcards[1:]:
             images.append(process_image(showcard, "showcards"))
 
-        # Apply max_images limit if specified
-        if max_images is not None:
-            images = images[:max_images]
-
-        # Cache the processed images for 1 hour
-        cache.set(cache_key, images, 3600)
-
         return images
 
     def get_current_date(self):
@@ -1085,9 +1360,25 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         return None
 
     def get_hero_showcard_data(self):
-        """Get front and back showcard images for hero section display."""
+        """Get front and back showcard images for hero section display.
+
+        Each image is a dict with ``small`` (width-400) and ``large``
+        (width-800) rendition data taken from the gallery manifest.
+        """
+        showcards = self.get_gallery_manifest().hero_showcards
+
+        return {
+            'has_showcards': bool(showcards),
+            'front_image': showcards[0] if len(showcards) > 0 else None,
+            'back_image': showcards[1] if len(showcards) > 1 else None,
+        }
+
+    def _build_hero_showcards(self):
+        """Resolve the ``hero_showcards`` list stored on the gallery manifest."""
+        from housegallery.core.image_utils import get_rendition_data
+
         # Try old showcard_photos first
-        showcards = list(self.showcard_photos.all()[:2])
+        showcards = list(self.showcard_photos.all())[:2]
 
         # Also check new exhibition_photos for showcard-tagged images
         if len(showcards) < 2:
@@ -1098,21 +1389,14 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 if "showcard" in image_tags:
                     showcards.append(photo)
 
-        if showcards:
-            first_showcard = showcards[0].image if len(showcards) > 0 else None
-            second_showcard = showcards[1].image if len(showcards) > 1 else None
-
-            return {
-                'has_showcards': True,
-                'front_image': first_showcard,
-                'back_image': second_showcard
+        return [
+            {
+                "title": showcard.image.title,
+                "small": get_rendition_data(showcard.image, profile_spec("thumb")),
+                "large": get_rendition_data(showcard.image, profile_spec("medium")),
             }
-
-        return {
-            'has_showcards': False,
-            'front_image': None,
-            'back_image': None
-        }
+            for showcard in showcards
+        ]
 
     def get_first_gallery_image(self):
         """Get the first gallery image for this exhibition."""
@@ -1133,19 +1417,16 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         4. In progress shots
         5. New unified exhibition_photos (tag-based, appended by type)
 
-        PERFORMANCE: Uses prefetched data from get_optimized_exhibition_detail() to
-        avoid N+1 queries. All image data is pre-loaded via select_related/prefetch_related.
+        PERFORMANCE: Read from the persisted gallery manifest.
         """
-        from django.core.cache import cache
-
-        # Simple cache key based on exhibition ID and last published date
-        timestamp = int(self.last_published_at.timestamp()) if self.last_published_at else 0
-        cache_key = f"exhibition_unified_images_{self.pk}_{timestamp}"
-        cached_images = cache.get(cache_key)
+        return self.get_gallery_manifest().unified_images
 
-        if cached_images is not None:
-            return cached_images
+    def _build_unified_gallery_images(self):
+        """Resolve the ``unified_images`` list stored on the gallery manifest.
 
+        Uses prefetched data from get_optimized_exhibition_detail() to avoid
+        N+1 queries. All image data is pre-loaded via select_related/prefetch_related.
+        """
         from housegallery.core.image_utils import get_image_urls
 
         images = []
@@ -1166,11 +1447,14 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 "image_title": urls["title"],
                 "caption": urls["title"],
                 "credit": urls["credit"],
+                "placeholder": urls["placeholder"],
+                "dominant_color": urls["dominant_color"],
                 "type": image_type,
                 "thumb_url": urls["thumb_url"] or urls["original_url"],
                 "full_url": urls["original_url"],
                 "srcset": urls["srcset"],
                 "sizes": urls["sizes"],
+                "avif_srcset": urls["avif_srcset"],
                 "exhibition_title": exhibition_title,
                 "exhibition_date": exhibition_date,
             }
@@ -1247,9 +1531,6 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
                 image_data["caption"] = photo.caption
             images.append(image_data)
 
-        # Cache the processed images for 1 hour
-        cache.set(cache_key, images, 3600)
-
         return images
 
     def get_gallery_index_mapping(self):
@@ -1311,7 +1592,9 @@ class ExhibitionPage(RoutablePageMixin, Page, ListingFields, ClusterableModel):
         Accessible at /exhibitions/[slug]/catalog/
         """
         # Get optimized version with prefetched relationships
-        optimized_page = ExhibitionPage.get_optimized_exhibition_detail(self.pk)
+        optimized_page = ExhibitionPage.get_optimized_exhibition_detail(
+            self.pk, include_photos=False,
+        )
         if optimized_page:
             self._prefetched_objects_cache = getattr(optimized_page, '_prefetched_objects_cache', {})
 
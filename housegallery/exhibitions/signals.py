@@ -1,10 +1,31 @@
-from django.db.models.signals import post_save
+import logging
+
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib import messages
 from django.utils import timezone
 from wagtail.models import Page
 from wagtail.signals import page_published, page_unpublished
-from .models import ExhibitionPage, EventPage, ExhibitionsIndexPage
+
+from housegallery.core.cache_dependencies import (
+    EXHIBITION,
+    invalidate_dependents,
+    register_invalidator,
+)
+from .models import (
+    EventPage,
+    ExhibitionArtwork,
+    ExhibitionGalleryManifest,
+    ExhibitionPage,
+    ExhibitionPhoto,
+    ExhibitionsIndexPage,
+    InProgressPhoto,
+    InstallationPhoto,
+    OpeningReceptionPhoto,
+    ShowcardPhoto,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -17,9 +38,11 @@ def invalidate_exhibitions_cache_on_publish(sender, instance, **kwargs):
     Invalidate the exhibitions listing cache when an ExhibitionPage is published.
 
     This ensures the listing page shows updated content immediately after publish,
-    while still benefiting from caching on normal page loads.
+    while still benefiting from caching on normal page loads. Kiosk carousels
+    that feature the exhibition are invalidated as well.
     """
     ExhibitionsIndexPage.invalidate_listing_cache()
+    invalidate_dependents(EXHIBITION, [instance.pk])
 
 
 @receiver(page_unpublished, sender=ExhibitionPage)
@@ -28,6 +51,68 @@ def invalidate_exhibitions_cache_on_unpublish(sender, instance, **kwargs):
     Invalidate the exhibitions listing cache when an ExhibitionPage is unpublished.
     """
     ExhibitionsIndexPage.invalidate_listing_cache()
+    invalidate_dependents(EXHIBITION, [instance.pk])
+
+
+# ============================================================================
+# Gallery Manifest Signals
+# ============================================================================
+
+@receiver(page_published, sender=ExhibitionPage)
+def rebuild_gallery_manifest_on_publish(sender, instance, **kwargs):
+    """
+    Rebuild the gallery manifest so the first visitor after a publish reads
+    pre-resolved image data instead of paying for the rendition lookups.
+
+    Failures are logged rather than raised; the manifest is rebuilt lazily on
+    the next read anyway.
+    """
+    try:
+        ExhibitionGalleryManifest.build(instance)
+    except Exception:
+        logger.exception("Failed to rebuild gallery manifest for page %s", instance.pk)
+
+
+def mark_gallery_manifest_stale(sender, instance, **kwargs):
+    """
+    Drop the gallery manifest when a photo or artwork link is saved or deleted
+    outside the publish flow, e.g. from a management command.
+    """
+    ExhibitionGalleryManifest.mark_stale(instance.page_id)
+    invalidate_dependents(EXHIBITION, [instance.page_id])
+
+
+def invalidate_gallery_manifest(cache_key):
+    """
+    Drop a gallery manifest whose recorded images, artworks, artists or tags
+    changed, along with the listing chunks and kiosk carousels built from it.
+    """
+    page_id = int(cache_key.rsplit("_", 1)[1])
+    ExhibitionGalleryManifest.mark_stale(page_id)
+    invalidate_dependents(EXHIBITION, [page_id])
+
+
+register_invalidator(ExhibitionGalleryManifest.dependency_key(""), invalidate_gallery_manifest)
+
+
+for _model in (
+    InstallationPhoto,
+    OpeningReceptionPhoto,
+    ShowcardPhoto,
+    InProgressPhoto,
+    ExhibitionPhoto,
+    ExhibitionArtwork,
+):
+    post_save.connect(
+        mark_gallery_manifest_stale,
+        sender=_model,
+        dispatch_uid=f"gallery_manifest_stale_save_{_model.__name__}",
+    )
+    post_delete.connect(
+        mark_gallery_manifest_stale,
+        sender=_model,
+        dispatch_uid=f"gallery_manifest_stale_delete_{_model.__name__}",
+    )
 
 
 # ============================================================================
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from housegallery.artists.models import Artist
+from housegallery.exhibitions.models import (
+    ExhibitionArtist,
+    ExhibitionGalleryManifest,
+    ExhibitionPage,
+)
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def _mock_get_image_urls(image_obj, specs=None):
+    return {
+        "thumb_url": "/media/thumb.jpg",
+        "original_url": "/media/original.jpg",
+        "srcset": "",
+        "avif_srcset": "",
+        "sizes": "",
+        "width": 400,
+        "height": 300,
+        "alt": image_obj.title,
+        "credit": getattr(image_obj, "credit", ""),
+        "title": image_obj.title,
+        "placeholder": "",
+        "dominant_color": "",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _setup(settings):
+    settings.CACHES = LOCMEM_CACHE
+    cache.clear()
+    with patch(
+        "housegallery.core.image_utils.get_image_urls",
+        side_effect=_mock_get_image_urls,
+    ):
+        yield
+
+
+def _republish(page):
+    page.save_revision().publish()
+    return ExhibitionPage.objects.get(pk=page.pk)
+
+
+@pytest.mark.django_db
+class TestDependencyInvalidation:
+    """Editing content used by a cached gallery invalidates exactly that gallery."""
+
+    def test_image_edit_marks_manifest_stale(self, exhibition_page, make_installation_photo):
+        photo = make_installation_photo(exhibition_page, title="Before")
+        page = _republish(exhibition_page)
+        assert ExhibitionGalleryManifest.objects.filter(page=page).exists()
+
+        photo.image.title = "After"
+        photo.image.save()
+
+        assert ExhibitionGalleryManifest.objects.get(page=page).is_stale
+        page = ExhibitionPage.objects.get(pk=page.pk)
+        assert page.get_all_gallery_images()[0]["image_title"] == "After"
+
+    def test_unrelated_image_edit_keeps_manifest(
+        self, exhibition_page, make_installation_photo, make_image,
+    ):
+        make_installation_photo(exhibition_page)
+        page = _republish(exhibition_page)
+        other = make_image(title="Elsewhere")
+
+        other.title = "Still elsewhere"
+        other.save()
+
+        assert not ExhibitionGalleryManifest.objects.get(page=page).is_stale
+
+    def test_artwork_edit_marks_manifest_stale(self, exhibition_page, make_exhibition_artwork):
+        artwork = make_exhibition_artwork(exhibition_page, artwork_title="Old Title")
+        page = _republish(exhibition_page)
+
+        artwork.title = "New Title"
+        artwork.save()
+
+        assert ExhibitionGalleryManifest.objects.get(page=page).is_stale
+
+    def test_artist_rename_drops_listing_chunk(self, exhibitions_index, exhibition_page):
+        artist = Artist.objects.create(name="Old Name")
+        ExhibitionArtist.objects.create(page=exhibition_page, artist=artist)
+        _republish(exhibition_page)
+
+        items, _ = exhibitions_index.get_listing_chunk()
+        assert items[0]["artist_names"] == ["Old Name"]
+
+        artist.name = "New Name"
+        artist.save()
+
+        items, _ = exhibitions_index.get_listing_chunk()
+        assert items[0]["artist_names"] == ["New Name"]
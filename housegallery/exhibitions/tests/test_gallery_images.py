@@ -11,12 +11,15 @@ MOCK_IMAGE_URLS = {
     "full_url": "/media/test_full.jpg",
     "original_url": "/media/test_original.jpg",
     "srcset": "/media/test_thumb.jpg 400w, /media/test_medium.jpg 800w",
+    "avif_srcset": "",
     "sizes": "(max-width: 600px) 400px, (max-width: 1200px) 800px, 1440px",
     "width": 1440,
     "height": 960,
     "alt": "Test Image",
     "credit": "Test Credit",
     "title": "Test Image",
+    "placeholder": "",
+    "dominant_color": "",
 }
 
 
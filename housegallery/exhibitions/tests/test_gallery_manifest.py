@@ -0,0 +1,155 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from housegallery.exhibitions.models import (
+    GALLERY_MANIFEST_VERSION,
+    ExhibitionGalleryManifest,
+    ExhibitionPage,
+)
+
+
+DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+def _mock_get_image_urls(image_obj, specs=None):
+    return {
+        "thumb_url": f"/media/{image_obj.pk}_thumb.jpg",
+        "original_url": f"/media/{image_obj.pk}.jpg",
+        "srcset": "",
+        "avif_srcset": "",
+        "sizes": "",
+        "width": 100,
+        "height": 80,
+        "alt": image_obj.title,
+        "credit": "",
+        "title": image_obj.title,
+        "placeholder": "",
+        "dominant_color": "",
+    }
+
+
+def _mock_get_rendition_data(image_obj, filter_spec):
+    return {"url": f"/media/{image_obj.pk}_{filter_spec}.jpg", "width": 400, "height": 300}
+
+
+@pytest.fixture(autouse=True)
+def _patch_image_urls(settings):
+    settings.CACHES = DUMMY_CACHE
+    with patch(
+        "housegallery.core.image_utils.get_image_urls",
+        side_effect=_mock_get_image_urls,
+    ), patch(
+        "housegallery.core.image_utils.get_rendition_data",
+        side_effect=_mock_get_rendition_data,
+    ):
+        yield
+
+
+def _republish(page):
+    page.save_revision().publish()
+    return ExhibitionPage.objects.get(pk=page.pk)
+
+
+@pytest.mark.django_db
+class TestGalleryManifest:
+    """Tests for the persisted ExhibitionGalleryManifest."""
+
+    def test_publish_builds_manifest(self, exhibition_page, make_installation_photo):
+        make_installation_photo(exhibition_page, title="Install 1")
+        page = _republish(exhibition_page)
+
+        manifest = ExhibitionGalleryManifest.objects.get(page=page)
+        assert manifest.schema_version == GALLERY_MANIFEST_VERSION
+        assert manifest.source_published_at == page.last_published_at
+        assert [img["image_title"] for img in manifest.all_images] == ["Install 1"]
+
+    def test_read_is_single_query(
+        self, exhibition_page, make_installation_photo, django_assert_num_queries,
+    ):
+        make_installation_photo(exhibition_page)
+        page = _republish(exhibition_page)
+
+        with django_assert_num_queries(1):
+            assert len(page.get_all_gallery_images()) == 1
+            page.get_unified_gallery_images()
+            page.get_filtered_gallery_images()
+            page.get_hero_showcard_data()
+
+    def test_photo_change_marks_manifest_stale(
+        self, exhibition_page, make_installation_photo,
+    ):
+        page = _republish(exhibition_page)
+        assert ExhibitionGalleryManifest.objects.filter(page=page).exists()
+
+        make_installation_photo(page, title="Late Photo")
+        assert ExhibitionGalleryManifest.objects.get(page=page).is_stale
+
+        page = ExhibitionPage.objects.get(pk=page.pk)
+        titles = [img["image_title"] for img in page.get_all_gallery_images()]
+        assert titles == ["Late Photo"]
+
+    def test_outdated_schema_version_is_rebuilt(self, exhibition_page, make_installation_photo):
+        make_installation_photo(exhibition_page)
+        page = _republish(exhibition_page)
+        ExhibitionGalleryManifest.objects.filter(page=page).update(
+            schema_version=0, all_images=[],
+        )
+
+        page = ExhibitionPage.objects.get(pk=page.pk)
+        assert len(page.get_all_gallery_images()) == 1
+        assert ExhibitionGalleryManifest.objects.get(page=page).schema_version == (
+            GALLERY_MANIFEST_VERSION
+        )
+
+    def test_hero_showcard_data_from_manifest(self, exhibition_page, make_showcard_photo):
+        make_showcard_photo(exhibition_page, title="Front")
+        make_showcard_photo(exhibition_page, title="Back")
+        page = _republish(exhibition_page)
+
+        data = page.get_hero_showcard_data()
+        assert data["has_showcards"] is True
+        assert data["front_image"]["title"] == "Front"
+        assert data["back_image"]["title"] == "Back"
+        assert data["front_image"]["small"]["url"].endswith("_width-400.jpg")
+        assert data["front_image"]["large"]["url"].endswith("_width-800.jpg")
+
+    def test_listing_joins_manifest(
+        self, exhibitions_index, exhibition_page, make_installation_photo,
+        django_assert_num_queries,
+    ):
+        make_installation_photo(exhibition_page)
+        _republish(exhibition_page)
+
+        exhibitions = list(exhibitions_index.get_optimized_exhibitions_for_listing())
+        with django_assert_num_queries(0):
+            assert len(exhibitions[0].get_filtered_gallery_images()) == 1
+
+    def test_rebuild_command(self, exhibition_page, make_installation_photo):
+        make_installation_photo(exhibition_page)
+        ExhibitionGalleryManifest.objects.all().delete()
+
+        call_command("rebuild_gallery_manifests", page_id=exhibition_page.pk)
+
+        manifest = ExhibitionGalleryManifest.objects.get(page=exhibition_page)
+        assert len(manifest.all_images) == 1
+
+    def test_stale_manifest_served_while_rebuild_locked(
+        self, settings, exhibition_page, make_installation_photo, hold_recompute_lock,
+    ):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        }
+        make_installation_photo(exhibition_page, title="Before")
+        page = _republish(exhibition_page)
+        make_installation_photo(page, title="After")
+
+        page = ExhibitionPage.objects.get(pk=page.pk)
+        with hold_recompute_lock(ExhibitionGalleryManifest.dependency_key(page.pk)):
+            titles = [img["image_title"] for img in page.get_all_gallery_images()]
+        assert titles == ["Before"]
+
+        page = ExhibitionPage.objects.get(pk=page.pk)
+        titles = [img["image_title"] for img in page.get_all_gallery_images()]
+        assert titles == ["Before", "After"]
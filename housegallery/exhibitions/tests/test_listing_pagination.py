@@ -0,0 +1,138 @@
+import datetime
+
+import pytest
+from django.test import Client
+from wagtail.models import Site
+
+from housegallery.exhibitions.models import ExhibitionPage, ExhibitionsIndexPage
+
+
+DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+@pytest.fixture
+def site(exhibitions_index):
+    Site.objects.all().delete()
+    return Site.objects.create(
+        hostname="testserver",
+        root_page=exhibitions_index.get_parent(),
+        is_default_site=True,
+    )
+
+
+@pytest.fixture
+def make_exhibitions(exhibitions_index):
+    """Create and publish exhibitions, newest first in the returned list."""
+    def _factory(start_dates):
+        pages = []
+        for index, start_date in enumerate(start_dates):
+            page = exhibitions_index.add_child(
+                instance=ExhibitionPage(
+                    title=f"Exhibition {index}",
+                    slug=f"exhibition-{index}",
+                    start_date=start_date,
+                )
+            )
+            page.save_revision().publish()
+            pages.append(page)
+        return pages
+    return _factory
+
+
+@pytest.mark.django_db
+class TestListingChunks:
+    """Tests for keyset pagination on ExhibitionsIndexPage."""
+
+    @pytest.fixture(autouse=True)
+    def _small_chunks(self, settings, monkeypatch):
+        settings.CACHES = DUMMY_CACHE
+        monkeypatch.setattr(ExhibitionsIndexPage, "LISTING_CHUNK_SIZE", 2)
+
+    def _walk(self, index_page):
+        titles = []
+        cursor = {}
+        while cursor is not None:
+            items, cursor = index_page.get_listing_chunk(**(cursor or {}))
+            titles.extend(item["title"] for item in items)
+            if cursor is not None:
+                cursor = {
+                    "after": datetime.date.fromisoformat(cursor["after"]) if cursor["after"] else "",
+                    "after_id": cursor["after_id"],
+                }
+        return titles
+
+    def test_first_chunk_is_limited(self, exhibitions_index, make_exhibitions):
+        make_exhibitions([datetime.date(2024, month, 1) for month in range(1, 6)])
+
+        items, cursor = exhibitions_index.get_listing_chunk()
+
+        assert [item["title"] for item in items] == ["Exhibition 4", "Exhibition 3"]
+        assert cursor == {"after": "2024-04-01", "after_id": items[-1]["pk"]}
+
+    def test_walks_every_exhibition_once(self, exhibitions_index, make_exhibitions):
+        # Shared start dates and undated exhibitions must not be skipped or repeated
+        make_exhibitions([
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 2, 1),
+            datetime.date(2024, 2, 1),
+            datetime.date(2024, 2, 1),
+            None,
+            None,
+            None,
+        ])
+
+        titles = self._walk(exhibitions_index)
+
+        assert titles == [
+            "Exhibition 3", "Exhibition 2", "Exhibition 1", "Exhibition 0",
+            "Exhibition 6", "Exhibition 5", "Exhibition 4",
+        ]
+
+    def test_last_chunk_has_no_cursor(self, exhibitions_index, make_exhibitions):
+        make_exhibitions([datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)])
+
+        items, cursor = exhibitions_index.get_listing_chunk()
+
+        assert len(items) == 2
+        assert cursor is None
+
+
+@pytest.mark.django_db
+class TestCardsEndpoint:
+    """Tests for the cards/ fragment route."""
+
+    @pytest.fixture(autouse=True)
+    def _small_chunks(self, settings, monkeypatch):
+        settings.CACHES = DUMMY_CACHE
+        monkeypatch.setattr(ExhibitionsIndexPage, "LISTING_CHUNK_SIZE", 2)
+
+    def test_index_renders_first_chunk_and_next_link(
+        self, site, exhibitions_index, make_exhibitions,
+    ):
+        make_exhibitions([datetime.date(2024, month, 1) for month in range(1, 4)])
+
+        html = Client().get(exhibitions_index.url).content.decode()
+
+        assert "Exhibition 2" in html
+        assert "Exhibition 1" in html
+        assert "Exhibition 0" not in html
+        assert "/exhibitions/cards/?after=2024-02-01" in html
+
+    def test_fragment_returns_next_cards(self, site, exhibitions_index, make_exhibitions):
+        pages = make_exhibitions([datetime.date(2024, month, 1) for month in range(1, 4)])
+
+        response = Client().get(
+            exhibitions_index.url + "cards/",
+            {"after": "2024-02-01", "after_id": pages[1].pk},
+        )
+        html = response.content.decode()
+
+        assert response.status_code == 200
+        assert "Exhibition 0" in html
+        assert "Exhibition 1" not in html
+        assert "<html" not in html
+        assert "data-exhibition-cards-next" not in html
+
+    def test_invalid_cursor_is_rejected(self, site, exhibitions_index):
+        response = Client().get(exhibitions_index.url + "cards/", {"after": "yesterday"})
+        assert response.status_code == 400
@@ -0,0 +1,102 @@
+import datetime
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from housegallery.exhibitions.listing import (
+    LISTING_SNAPSHOT_VERSION,
+    build_listing_snapshot,
+    decode_listing_snapshot,
+    encode_listing_snapshot,
+)
+from housegallery.exhibitions.models import ExhibitionPage
+
+
+LOCMEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+def _mock_get_image_urls(image_obj, specs=None):
+    return {
+        "thumb_url": "/media/thumb.jpg",
+        "original_url": "/media/original.jpg",
+        "srcset": "",
+        "avif_srcset": "",
+        "sizes": "",
+        "width": 400,
+        "height": 300,
+        "alt": image_obj.title,
+        "credit": "",
+        "title": image_obj.title,
+        "placeholder": "",
+        "dominant_color": "",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _patch_image_urls():
+    with patch(
+        "housegallery.core.image_utils.get_image_urls",
+        side_effect=_mock_get_image_urls,
+    ):
+        yield
+
+
+@pytest.mark.django_db
+class TestListingSnapshot:
+    """Tests for the compact exhibitions listing snapshot."""
+
+    def test_round_trip(self, exhibition_page, make_installation_photo):
+        make_installation_photo(exhibition_page, title="Install")
+        page = ExhibitionPage.objects.get(pk=exhibition_page.pk)
+
+        items = build_listing_snapshot([page])
+        decoded = decode_listing_snapshot(encode_listing_snapshot(items))
+
+        assert decoded == items
+        assert decoded[0]["start_date"] == datetime.date(2024, 3, 1)
+        assert decoded[0]["url"] == page.url
+        assert decoded[0]["gallery_images"][0]["image_title"] == "Install"
+
+    def test_other_version_is_a_miss(self, exhibition_page):
+        payload = json.loads(encode_listing_snapshot(build_listing_snapshot([exhibition_page])))
+        payload["version"] = LISTING_SNAPSHOT_VERSION + 1
+
+        assert decode_listing_snapshot(json.dumps(payload)) is None
+        assert decode_listing_snapshot(None) is None
+        assert decode_listing_snapshot("not json") is None
+
+    def test_index_context_caches_json_snapshot(
+        self, settings, exhibitions_index, exhibition_page,
+    ):
+        settings.CACHES = LOCMEM_CACHE
+        from django.core.cache import cache
+        cache.clear()
+
+        request = RequestFactory().get("/")
+        context = exhibitions_index.get_context(request)
+
+        assert [item["title"] for item in context["exhibitions"]] == ["Test Exhibition"]
+
+        version = exhibitions_index.get_cache_version()
+        chunk_size = exhibitions_index.LISTING_CHUNK_SIZE
+        cached = cache.get(
+            f"exhibitions_listing_v{LISTING_SNAPSHOT_VERSION}_{exhibitions_index.pk}_{version}"
+            f"_None_None_{chunk_size}"
+        )
+        payload = cached[0]
+        assert isinstance(payload, str)
+        assert decode_listing_snapshot(payload)[0]["pk"] == exhibition_page.pk
+
+    def test_benchmark_command(self, exhibitions_index, exhibition_page):
+        out = StringIO()
+        call_command("benchmark_listing_cache", iterations=1, stdout=out)
+
+        output = out.getvalue()
+        assert "json snapshot" in output
+        assert "pickle (listing pages)" in output
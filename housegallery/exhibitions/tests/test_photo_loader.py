@@ -0,0 +1,76 @@
+import pytest
+
+from housegallery.exhibitions.models import (
+    ExhibitionImage,
+    ExhibitionPage,
+    load_exhibition_photos,
+)
+
+
+@pytest.mark.django_db
+class TestLoadExhibitionPhotos:
+    """Tests for the single-UNION photo loader."""
+
+    def test_returns_typed_lists_per_page(
+        self, exhibition_page, make_installation_photo, make_opening_photo,
+        make_showcard_photo, make_in_progress_photo, make_exhibition_photo, make_image,
+    ):
+        make_installation_photo(exhibition_page, title="Install")
+        make_opening_photo(exhibition_page, title="Opening")
+        make_showcard_photo(exhibition_page, title="Showcard")
+        make_in_progress_photo(exhibition_page, title="Progress")
+        make_exhibition_photo(exhibition_page, title="Unified", caption="Caption")
+        ExhibitionImage.objects.create(
+            page=exhibition_page, image=make_image(title="Typed"), image_type="opening",
+        )
+
+        result = load_exhibition_photos([exhibition_page])[exhibition_page.pk]
+
+        assert [p.image.title for p in result["installation_photos"]] == ["Install"]
+        assert [p.image.title for p in result["opening_reception_photos"]] == ["Opening"]
+        assert [p.image.title for p in result["showcard_photos"]] == ["Showcard"]
+        assert [p.image.title for p in result["in_progress_photos"]] == ["Progress"]
+        assert result["exhibition_photos"][0].caption == "Caption"
+        assert result["exhibition_images"][0].image_type == "opening"
+
+    def test_orders_by_sort_order(self, exhibition_page, make_installation_photo):
+        make_installation_photo(exhibition_page, title="Second", sort_order=2)
+        make_installation_photo(exhibition_page, title="First", sort_order=1)
+
+        result = load_exhibition_photos([exhibition_page])[exhibition_page.pk]
+
+        titles = [p.image.title for p in result["installation_photos"]]
+        assert titles == ["First", "Second"]
+
+    def test_query_count_independent_of_photo_count(
+        self, exhibitions_index, exhibition_page, make_installation_photo,
+        make_showcard_photo, make_exhibition_photo, django_assert_num_queries,
+    ):
+        for _ in range(3):
+            make_installation_photo(exhibition_page)
+            make_showcard_photo(exhibition_page)
+            make_exhibition_photo(exhibition_page, tags=["installation"])
+
+        page = ExhibitionPage.objects.get(pk=exhibition_page.pk)
+        # UNION rows, images, renditions, tags
+        with django_assert_num_queries(4):
+            load_exhibition_photos([page])
+
+    def test_existing_helpers_use_loaded_photos(
+        self, exhibition_page, make_showcard_photo, make_exhibition_photo,
+        django_assert_num_queries,
+    ):
+        make_showcard_photo(exhibition_page, title="Showcard")
+        make_exhibition_photo(exhibition_page, tags=["showcard"])
+
+        page = ExhibitionPage.objects.get(pk=exhibition_page.pk)
+        load_exhibition_photos([page])
+
+        with django_assert_num_queries(0):
+            assert len(page.get_showcards_images()) == 1
+            assert page.get_first_showcard_image().title == "Showcard"
+            tags = [t.name for t in page.exhibition_photos.all()[0].image.tags.all()]
+            assert tags == ["showcard"]
+
+    def test_empty_pages(self):
+        assert load_exhibition_photos([]) == {}
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ImagesConfig(AppConfig):
+    name = 'housegallery.images'
+    verbose_name = "Images"
+
+    def ready(self):
+        # Import signals to register handlers
+        from . import signals
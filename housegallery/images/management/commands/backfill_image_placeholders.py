@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from housegallery.core.cache_dependencies import IMAGE, invalidate_dependents
+from housegallery.images.models import CustomImage
+from housegallery.images.placeholders import open_reduced
+from housegallery.images.placeholders import placeholder_from
+from housegallery.images.similarity import BAND_FIELDS
+from housegallery.images.similarity import dhash
+
+
+FINGERPRINT_FIELDS = [
+    'placeholder', 'dominant_color', 'perceptual_hash', *BAND_FIELDS,
+]
+
+
+class Command(BaseCommand):
+    help = 'Compute placeholders, dominant colours and perceptual hashes for images that lack them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute for every image, not just those missing a value',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of images per progress report and cache invalidation (default: 100)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+
+        images = CustomImage.objects.exclude(file__iendswith='.svg').order_by('pk')
+        if not options['force']:
+            images = images.filter(Q(placeholder='') | Q(perceptual_hash=''))
+
+        total = images.count()
+        if total == 0:
+            self.stdout.write(self.style.SUCCESS('All images have placeholders!'))
+            return
+
+        self.stdout.write(f'Computing placeholders and hashes for {total} images...')
+
+        processed = error_count = 0
+        updated = []
+        for image in images.only('pk', 'file').iterator(chunk_size=batch_size):
+            try:
+                with image.open_file() as f:
+                    small = open_reduced(f)
+                image.placeholder, image.dominant_color = placeholder_from(small)
+                image.set_perceptual_hash(dhash(small))
+            except Exception as e:
+                error_count += 1
+                self.stdout.write(self.style.ERROR(f'Failed for image {image.pk}: {e}'))
+            else:
+                # update() rather than save() so the upload processing and
+                # rendition signals are not run again
+                CustomImage.objects.filter(pk=image.pk).update(**{
+                    field: getattr(image, field) for field in FINGERPRINT_FIELDS
+                })
+                updated.append(image.pk)
+
+            processed += 1
+            if processed % batch_size == 0:
+                self._flush(updated)
+                self.stdout.write(f'Progress: {processed}/{total} images')
+
+        self._flush(updated)
+        self.stdout.write(self.style.SUCCESS(
+            f'Completed: {processed - error_count} placeholders computed, {error_count} errors'
+        ))
+
+    def _flush(self, updated):
+        """Rebuild cached galleries and carousels that show these images."""
+        if updated:
+            invalidate_dependents(IMAGE, updated)
+            updated.clear()
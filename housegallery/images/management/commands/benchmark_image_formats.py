@@ -0,0 +1,138 @@
+import io
+import math
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from PIL import Image as PILImage
+from PIL import ImageChops
+from PIL import ImageOps
+from PIL import ImageStat
+
+from housegallery.images.models import CustomImage
+from housegallery.images.renditions import avif_supported
+
+
+# (label, max width, max height) of the large profiles: web_optimized
+# is width-1440 and display is max-2560x2560
+SIZES = [
+    ('1440w', 1440, None),
+    ('2560max', 2560, 2560),
+]
+
+
+def resize_for(image, max_width, max_height):
+    """Downscale like the rendition profiles do (never upscale)."""
+    scale = max_width / image.width
+    if max_height:
+        scale = min(scale, max_height / image.height)
+    if scale >= 1:
+        return image
+    size = (max(round(image.width * scale), 1), max(round(image.height * scale), 1))
+    return image.resize(size, PILImage.Resampling.LANCZOS)
+
+
+def encode(image, fmt, quality):
+    """Return ``(encoded bytes, seconds)``."""
+    buf = io.BytesIO()
+    start = time.perf_counter()
+    image.save(buf, format=fmt, quality=quality)
+    return buf.getvalue(), time.perf_counter() - start
+
+
+def psnr(reference, data):
+    """Peak signal-to-noise ratio in dB of encoded ``data`` against ``reference``."""
+    with PILImage.open(io.BytesIO(data)) as decoded:
+        decoded = decoded.convert('RGB')
+        diff = ImageChops.difference(reference, decoded)
+    pixels = reference.width * reference.height * 3
+    mse = sum(ImageStat.Stat(diff).sum2) / pixels
+    if mse == 0:
+        return float('inf')
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+class Command(BaseCommand):
+    help = 'Compare AVIF against the current WebP settings for the large profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=20,
+            help='Number of images to encode (default: 20, most recent first)',
+        )
+        parser.add_argument(
+            '--webp-quality',
+            type=int,
+            nargs='+',
+            default=[85, 95],
+            help='WebP qualities to compare (default: 85 95, the current settings)',
+        )
+        parser.add_argument(
+            '--avif-quality',
+            type=int,
+            nargs='+',
+            default=[50, 60, 70],
+            help='AVIF qualities to compare (default: 50 60 70)',
+        )
+
+    def handle(self, *args, **options):
+        variants = [('WEBP', q) for q in options['webp_quality']]
+        if avif_supported():
+            variants += [('AVIF', q) for q in options['avif_quality']]
+        else:
+            self.stdout.write(self.style.WARNING(
+                'This Pillow build cannot encode AVIF; comparing WebP settings only.'
+            ))
+
+        images = (
+            CustomImage.objects.exclude(file__iendswith='.svg')
+            .order_by('-pk')[:options['sample']]
+        )
+
+        # (size, format, quality) -> [bytes, seconds, psnr sum, count]
+        totals = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        sampled = 0
+        for image in images:
+            try:
+                with image.open_file() as f, PILImage.open(f) as source:
+                    source = ImageOps.exif_transpose(source).convert('RGB')
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Skipping image {image.pk}: {e}'))
+                continue
+            sampled += 1
+
+            for label, max_width, max_height in SIZES:
+                reference = resize_for(source, max_width, max_height)
+                for fmt, quality in variants:
+                    data, seconds = encode(reference, fmt, quality)
+                    total = totals[(label, fmt, quality)]
+                    total[0] += len(data)
+                    total[1] += seconds
+                    total[2] += min(psnr(reference, data), 100)
+                    total[3] += 1
+
+        if not sampled:
+            self.stdout.write('No images to benchmark.')
+            return
+
+        self.stdout.write(f'Encoded {sampled} images\n')
+        self.stdout.write(
+            f'{"size":<8}  {"format":<6}  {"quality":>7}  {"avg KB":>8}  '
+            f'{"vs WebP":>7}  {"PSNR dB":>7}  {"encode ms":>9}'
+        )
+        baseline_quality = options['webp_quality'][0]
+        for label, _max_width, _max_height in SIZES:
+            baseline = totals[(label, 'WEBP', baseline_quality)][0]
+            for fmt, quality in variants:
+                size, seconds, psnr_sum, count = totals[(label, fmt, quality)]
+                self.stdout.write(
+                    f'{label:<8}  {fmt:<6}  {quality:>7}  {size / count / 1024:>8.1f}  '
+                    f'{size / baseline:>7.0%}  {psnr_sum / count:>7.2f}  '
+                    f'{seconds / count * 1000:>9.1f}'
+                )
+        self.stdout.write('')
+        self.stdout.write(
+            f'"vs WebP" is total size relative to WebP quality {baseline_quality}.'
+        )
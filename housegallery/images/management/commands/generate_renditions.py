@@ -1,21 +1,78 @@
+import hashlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from django.db.models import Count, Q
+from django.db import connections
+from django.db.models import Exists, OuterRef, Q
+
+from housegallery.core.cache_dependencies import IMAGE, invalidate_dependents
 from housegallery.images.models import CustomImage, Rendition
+from housegallery.images.rendition_pipeline import generate_renditions
+from housegallery.images.renditions import standard_specs
 
 
 # Standard rendition specs used across the site
-STANDARD_RENDITIONS = [
-    # Legacy template tag renditions
-    'width-400',
-    'width-400|format-webp',
-    'width-1200',
-    'width-1200|format-webp',
-    # New helper method renditions
-    'width-1440|format-webp|webpquality-85',  # get_web_optimized()
-    'fill-300x300|format-webp|webpquality-90',  # get_thumbnail()
-]
+STANDARD_RENDITIONS = standard_specs()
+
+
+def get_missing_renditions(images, specs):
+    """Return ``[(image_id, [missing specs])]`` for images lacking any of ``specs``.
 
-# Note: get_display_optimized() is handled separately as it's dynamic based on image size
+    One query: an anti-join (NOT EXISTS) per spec against the renditions
+    table, so an image missing a single spec is found even if it has as
+    many renditions as there are specs.
+    """
+    flags = {
+        f'missing_{i}': ~Exists(
+            Rendition.objects.filter(image=OuterRef('pk'), filter_spec=spec)
+        )
+        for i, spec in enumerate(specs)
+    }
+    any_missing = Q()
+    for name in flags:
+        any_missing |= Q(**{name: True})
+
+    rows = (
+        images.annotate(**flags)
+        .filter(any_missing)
+        .order_by('pk')
+        .values_list('pk', *flags)
+    )
+    return [
+        (pk, [spec for spec, missing in zip(specs, missing_flags) if missing])
+        for pk, *missing_flags in rows
+    ]
+
+
+def render_chunk(chunk):
+    """Generate renditions for ``[(image_id, specs)]``.
+
+    Each image's original is downloaded and decoded once for all of its
+    specs. Runs in the worker processes, so it only takes and returns plain
+    data: ``[(image_id, created, bytes_written, [error messages])]``.
+    """
+    images = CustomImage.objects.in_bulk([image_id for image_id, _specs in chunk])
+    results = []
+    for image_id, specs in chunk:
+        image = images.get(image_id)
+        if image is None:
+            results.append((image_id, 0, 0, ['image no longer exists']))
+            continue
+
+        renditions, failures = generate_renditions(image, specs)
+        created = len(renditions)
+        bytes_written = 0
+        for rendition in renditions.values():
+            try:
+                bytes_written += rendition.file.size
+            except Exception:
+                pass
+        errors = [f'{spec}: {e}' for spec, e in failures.items()]
+        results.append((image_id, created, bytes_written, errors))
+    return results
 
 
 class Command(BaseCommand):
@@ -30,7 +87,8 @@ class Command(BaseCommand):
         parser.add_argument(
             '--missing-only',
             action='store_true',
-            help='Only generate renditions for images missing standard sizes',
+            help='Only generate renditions for images missing standard sizes '
+                 '(always the case now; kept for existing scripts)',
         )
         parser.add_argument(
             '--image-id',
@@ -41,14 +99,25 @@ class Command(BaseCommand):
             '--batch-size',
             type=int,
             default=50,
-            help='Number of images to process before reporting progress (default: 50)',
+            help='Number of images per work unit and progress report (default: 50)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes (default: 1, in-process)',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore the checkpoint left by an interrupted run',
         )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
-        missing_only = options['missing_only']
         image_id = options.get('image_id')
-        batch_size = options['batch_size']
+        batch_size = max(options['batch_size'], 1)
+        workers = max(options['workers'], 1)
 
         # Build queryset
         if image_id:
@@ -56,45 +125,71 @@ class Command(BaseCommand):
             if not images.exists():
                 self.stdout.write(self.style.ERROR(f'Image {image_id} not found'))
                 return
-        elif missing_only:
-            # Find images missing any standard rendition
-            images = self._get_images_missing_renditions()
         else:
             images = CustomImage.objects.all()
 
-        total = images.count()
+        checkpoint_key = self._checkpoint_key(image_id)
+        if options['restart']:
+            cache.delete(checkpoint_key)
+        resume_after = cache.get(checkpoint_key)
+        if resume_after:
+            images = images.filter(pk__gt=resume_after)
+            self.stdout.write(f'Resuming after image {resume_after}')
+
+        work = get_missing_renditions(images, STANDARD_RENDITIONS)
+        total = len(work)
 
         if total == 0:
+            cache.delete(checkpoint_key)
             self.stdout.write(self.style.SUCCESS('All images have standard renditions!'))
             return
 
         if dry_run:
-            self.stdout.write(f'Would generate renditions for {total} images:')
+            missing = sum(len(specs) for _image_id, specs in work)
+            self.stdout.write(
+                f'Would generate {missing} renditions for {total} images:'
+            )
             for spec in STANDARD_RENDITIONS:
-                self.stdout.write(f'  - {spec}')
+                count = sum(spec in specs for _image_id, specs in work)
+                self.stdout.write(f'  - {spec} ({count} missing)')
             return
 
-        self.stdout.write(f'Generating renditions for {total} images...')
-
-        generated_count = 0
-        error_count = 0
-
-        for i, image in enumerate(images.iterator()):
-            try:
-                renditions_created = self._generate_for_image(image)
-                generated_count += renditions_created
+        self.stdout.write(
+            f'Generating renditions for {total} images with {workers} worker(s)...'
+        )
 
-                if (i + 1) % batch_size == 0:
-                    self.stdout.write(
-                        f'Progress: {i + 1}/{total} images '
-                        f'({generated_count} renditions created)'
-                    )
+        chunks = [work[i:i + batch_size] for i in range(0, total, batch_size)]
+        start = time.monotonic()
+        processed = generated_count = bytes_written = error_count = 0
+
+        for chunk, results in zip(chunks, self._run(chunks, workers)):
+            updated = []
+            for result_image_id, created, written, errors in results:
+                generated_count += created
+                bytes_written += written
+                if created:
+                    updated.append(result_image_id)
+                for error in errors:
+                    error_count += 1
+                    self.stdout.write(self.style.ERROR(
+                        f'Failed for image {result_image_id}: {error}'
+                    ))
+            if updated:
+                invalidate_dependents(IMAGE, updated)
+
+            # Chunks complete in order, so everything up to here is done
+            processed += len(chunk)
+            cache.set(checkpoint_key, chunk[-1][0], None)
+
+            elapsed = time.monotonic() - start
+            self.stdout.write(
+                f'Progress: {processed}/{total} images '
+                f'({generated_count} renditions created, '
+                f'{processed / elapsed if elapsed else 0:.1f} images/s)'
+            )
 
-            except Exception as e:
-                error_count += 1
-                self.stdout.write(
-                    self.style.ERROR(f'Failed for image {image.id} ({image.title}): {e}')
-                )
+        cache.delete(checkpoint_key)
+        elapsed = time.monotonic() - start
 
         # Summary
         self.stdout.write('')
@@ -103,49 +198,27 @@ class Command(BaseCommand):
             f'{generated_count} renditions created, '
             f'{error_count} errors'
         ))
-
-    def _get_images_missing_renditions(self):
-        """Find images that don't have all standard renditions."""
-        # Get images with fewer than expected renditions
-        # (This is a heuristic - checks count, not exact specs)
-        expected_count = len(STANDARD_RENDITIONS)
-
-        return CustomImage.objects.annotate(
-            rendition_count=Count('renditions')
-        ).filter(
-            Q(rendition_count__lt=expected_count)
-        )
-
-    def _generate_for_image(self, image):
-        """Generate missing renditions for a single image. Returns count created."""
-        created = 0
-
-        # Get existing rendition specs for this image
-        existing_specs = set(
-            image.renditions.values_list('filter_spec', flat=True)
+        self.stdout.write(
+            f'Throughput: {total / elapsed if elapsed else 0:.1f} images/s, '
+            f'{bytes_written / (1024 * 1024):.1f}MB written in {elapsed:.1f}s'
         )
 
-        for spec in STANDARD_RENDITIONS:
-            if spec not in existing_specs:
-                try:
-                    image.get_rendition(spec)
-                    created += 1
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'  Could not create {spec} for image {image.id}: {e}'
-                        )
-                    )
-
-        # Handle get_display_optimized() - dynamic based on image dimensions
-        try:
-            image.get_display_optimized()
-            # Note: May or may not create a new rendition depending on existing specs
-        except Exception as e:
-            self.stdout.write(
-                self.style.WARNING(
-                    f'  Could not create display_optimized for image {image.id}: {e}'
-                )
-            )
+    def _run(self, chunks, workers):
+        """Yield the results of render_chunk for each chunk, in order."""
+        if workers == 1:
+            for chunk in chunks:
+                yield render_chunk(chunk)
+            return
 
-        return created
\ No newline at end of file
+        # Forked workers must open their own database connections
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            yield from pool.map(render_chunk, chunks)
+
+    def _checkpoint_key(self, image_id):
+        """Cache key for the checkpoint, specific to the spec list and target."""
+        specs_hash = hashlib.md5(
+            '\n'.join(STANDARD_RENDITIONS).encode(), usedforsecurity=False,
+        ).hexdigest()[:12]
+        return f'generate_renditions_checkpoint_{specs_hash}_{image_id or "all"}'
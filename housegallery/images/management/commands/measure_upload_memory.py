@@ -0,0 +1,120 @@
+import gc
+import io
+import shutil
+import tempfile
+import time
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+from PIL import Image as PILImage
+
+from housegallery.images.models import CustomImage
+
+
+class _Rollback(Exception):
+    pass
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter for this process (Linux >= 4.0)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def rss_kb(field='VmRSS'):
+    """Current (VmRSS) or peak (VmHWM) resident set size in KB."""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+    raise CommandError(f'{field} not reported by /proc/self/status')
+
+
+def synthetic_photo(width, height):
+    """A noisy JPEG, rotated by EXIF like most phone photos."""
+    image = PILImage.merge('RGB', [
+        PILImage.effect_noise((width, height), sigma)
+        for sigma in (40, 60, 80)
+    ])
+    exif = PILImage.Exif()
+    exif[0x0112] = 6
+    buf = io.BytesIO()
+    image.save(buf, format='JPEG', quality=92, exif=exif.tobytes())
+    return buf.getvalue()
+
+
+class Command(BaseCommand):
+    help = 'Measure peak memory while saving a batch of uploads through CustomImage.save()'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=50,
+            help='Number of uploads in the batch (default: 50)',
+        )
+        parser.add_argument(
+            '--file',
+            help='Image to upload repeatedly (default: a synthetic 12MP JPEG with EXIF rotation)',
+        )
+        parser.add_argument(
+            '--size',
+            default='4032x3024',
+            help='Size of the synthetic JPEG (default: 4032x3024)',
+        )
+
+    def handle(self, *args, **options):
+        if options['file']:
+            with open(options['file'], 'rb') as f:
+                data = f.read()
+            name = options['file'].rsplit('/', 1)[-1]
+        else:
+            width, height = (int(v) for v in options['size'].split('x'))
+            data = synthetic_photo(width, height)
+            name = 'upload.jpg'
+        self.stdout.write(f'Uploading {options["count"]} x {len(data) / (1024 * 1024):.1f}MB ({name})')
+
+        # Write originals to a scratch directory, never the real bucket, and
+        # roll back the rows afterwards
+        field = CustomImage._meta.get_field('file')
+        original_storage = field.storage
+        scratch = tempfile.mkdtemp(prefix='upload-memory-')
+        field.storage = FileSystemStorage(location=scratch)
+
+        gc.collect()
+        start_rss = rss_kb()
+        exact_peak = reset_peak_rss()
+        if not exact_peak:
+            self.stdout.write(self.style.WARNING(
+                'Cannot reset the peak RSS counter; the peak may predate the batch.'
+            ))
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                for i in range(options['count']):
+                    image = CustomImage(
+                        title=f'Memory test {i}',
+                        file=SimpleUploadedFile(name, data),
+                    )
+                    image.save()
+                raise _Rollback
+        except _Rollback:
+            pass
+        finally:
+            field.storage = original_storage
+            shutil.rmtree(scratch, ignore_errors=True)
+        elapsed = time.perf_counter() - started
+
+        peak_rss = rss_kb('VmHWM')
+        self.stdout.write(f'RSS before batch: {start_rss / 1024:.0f}MB')
+        self.stdout.write(f'Peak RSS:         {peak_rss / 1024:.0f}MB')
+        self.stdout.write(f'Peak growth:      {(peak_rss - start_rss) / 1024:.0f}MB')
+        self.stdout.write(f'Time per upload:  {elapsed / options["count"] * 1000:.0f}ms')
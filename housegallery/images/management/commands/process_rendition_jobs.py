@@ -0,0 +1,73 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from housegallery.images.models import CustomImage
+from housegallery.images.models import RenditionJob
+from housegallery.images.original_cache import get_original_cache
+from housegallery.images.rendition_queue import process_jobs
+
+
+class Command(BaseCommand):
+    help = 'Generate queued renditions (run as a long-lived worker, or with --once)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Number of jobs to claim at a time (default: 20)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=5,
+            help='Seconds to wait when the queue is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue and exit instead of waiting for new jobs',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Put jobs that exhausted their attempts back in the queue first',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        sleep = options['sleep']
+        once = options['once']
+
+        if options['retry_failed']:
+            retried = RenditionJob.objects.filter(
+                status=RenditionJob.STATUS_FAILED,
+            ).update(status=RenditionJob.STATUS_PENDING, attempts=0)
+            self.stdout.write(f'Requeued {retried} failed jobs')
+
+        total_done = total_failed = 0
+        while True:
+            done, failed = process_jobs(batch_size)
+            total_done += done
+            total_failed += failed
+
+            if done or failed:
+                self.stdout.write(
+                    f'Processed batch: {done} renditions created, {failed} failed'
+                )
+                continue
+            if once:
+                break
+            time.sleep(sleep)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Completed: {total_done} renditions created, {total_failed} failed'
+        ))
+        original_cache = get_original_cache(CustomImage._meta.get_field('file').storage)
+        if original_cache:
+            stats = original_cache.stats()
+            self.stdout.write(
+                f'Originals cache: {stats["hits"]} hits, {stats["misses"]} downloads, '
+                f'{stats["evictions"]} evictions ({stats["bytes"] / (1024 * 1024):.0f}MB cached)'
+            )
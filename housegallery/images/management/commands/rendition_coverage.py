@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Exists, OuterRef
+
+from housegallery.images.models import CustomImage, Rendition
+from housegallery.images.renditions import standard_profiles
+
+
+def get_rendition_coverage(profiles=None):
+    """Return ``(total images, {profile: images that have its rendition})``.
+
+    Counted in a single query with one EXISTS subquery per profile.
+    ``profiles`` defaults to every pre-generated profile.
+    """
+    if profiles is None:
+        profiles = standard_profiles()
+    counts = CustomImage.objects.aggregate(
+        total=Count('pk'),
+        **{
+            name: Count('pk', filter=Exists(
+                Rendition.objects.filter(image=OuterRef('pk'), filter_spec=spec)
+            ))
+            for name, spec in profiles.items()
+        },
+    )
+    total = counts.pop('total')
+    return total, counts
+
+
+class Command(BaseCommand):
+    help = 'Report how many images have each pre-generated rendition profile'
+
+    def handle(self, *args, **options):
+        profiles = standard_profiles()
+        total, counts = get_rendition_coverage(profiles)
+
+        if total == 0:
+            self.stdout.write('No images.')
+            return
+
+        name_width = max(len(name) for name in profiles)
+        spec_width = max(len(spec) for spec in profiles.values())
+        self.stdout.write(
+            f'{"profile":<{name_width}}  {"spec":<{spec_width}}  '
+            f'{"have":>6}  {"missing":>7}  {"coverage":>8}'
+        )
+
+        all_complete = True
+        for name, spec in profiles.items():
+            have = counts[name]
+            missing = total - have
+            line = (
+                f'{name:<{name_width}}  {spec:<{spec_width}}  '
+                f'{have:>6}  {missing:>7}  {have / total:>8.1%}'
+            )
+            if missing:
+                all_complete = False
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+
+        self.stdout.write('')
+        if all_complete:
+            self.stdout.write(self.style.SUCCESS(f'All {total} images are fully covered.'))
+        else:
+            self.stdout.write(
+                'Run "manage.py generate_renditions" to fill in missing renditions.'
+            )
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand
+
+from housegallery.images.models import CustomImage
+from housegallery.images.similarity import SIMILAR_DISTANCE, find_similar_clusters
+
+
+class Command(BaseCommand):
+    help = 'Report groups of near-duplicate images (resized or re-exported copies of the same photo)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-distance',
+            type=int,
+            default=SIMILAR_DISTANCE,
+            help=f'Largest perceptual hash distance treated as a duplicate (default: {SIMILAR_DISTANCE})',
+        )
+
+    def handle(self, *args, **options):
+        unhashed = (
+            CustomImage.objects.exclude(file__iendswith='.svg')
+            .filter(perceptual_hash='')
+            .count()
+        )
+        if unhashed:
+            self.stdout.write(self.style.WARNING(
+                f'{unhashed} images have no perceptual hash and are not compared. '
+                'Run backfill_image_placeholders first.'
+            ))
+
+        rows = CustomImage.objects.exclude(perceptual_hash='').values_list('pk', 'perceptual_hash')
+        clusters = find_similar_clusters(rows, max_distance=options['max_distance'])
+
+        if not clusters:
+            self.stdout.write(self.style.SUCCESS('No near-duplicate images found.'))
+            return
+
+        images = CustomImage.objects.in_bulk([pk for cluster in clusters for pk in cluster])
+
+        self.stdout.write(f'Found {len(clusters)} groups of near-duplicate images:')
+        duplicate_count = 0
+        for cluster in clusters:
+            group = [images[pk] for pk in cluster if pk in images]
+            canonical = self.get_canonical_image(group)
+
+            self.stdout.write(f'\n  Group of {len(group)}:')
+            for image in group:
+                self.stdout.write(
+                    f'    - #{image.pk} "{image.title}" '
+                    f'({image.width}x{image.height}, uploaded {image.created_at:%Y-%m-%d})'
+                )
+            self.stdout.write(f'    → Suggested keeper: #{canonical.pk} "{canonical.title}"')
+            duplicate_count += len(group) - 1
+
+        self.stdout.write(
+            self.style.WARNING(f'\n{duplicate_count} images could be replaced by their keeper.')
+        )
+
+    def get_canonical_image(self, images):
+        """
+        Determine which image of a group to keep.
+        Prefers the largest original, falling back to the earliest upload.
+        """
+        return min(images, key=lambda image: (-(image.width * image.height), image.created_at, image.pk))
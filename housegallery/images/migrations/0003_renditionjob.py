@@ -0,0 +1,37 @@
+# Generated by Django 5.0.10 on 2026-10-17 00:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0002_remove_customimage_preserve_original'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenditionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filter_spec', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('image', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rendition_jobs', to='images.customimage')),
+            ],
+            options={
+                'verbose_name': 'Rendition Job',
+                'verbose_name_plural': 'Rendition Jobs',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='rendition_job_queue_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='renditionjob',
+            constraint=models.UniqueConstraint(fields=('image', 'filter_spec'), name='unique_rendition_job'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0003_renditionjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customimage',
+            name='dominant_color',
+            field=models.CharField(blank=True, editable=False, max_length=7),
+        ),
+        migrations.AddField(
+            model_name='customimage',
+            name='placeholder',
+            field=models.TextField(blank=True, editable=False, help_text='Tiny base64 WebP shown while the image loads'),
+        ),
+    ]
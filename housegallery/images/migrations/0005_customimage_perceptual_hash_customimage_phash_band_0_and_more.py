@@ -0,0 +1,38 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0004_customimage_dominant_color_customimage_placeholder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customimage',
+            name='perceptual_hash',
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+        migrations.AddField(
+            model_name='customimage',
+            name='phash_band_0',
+            field=models.IntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='customimage',
+            name='phash_band_1',
+            field=models.IntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='customimage',
+            name='phash_band_2',
+            field=models.IntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='customimage',
+            name='phash_band_3',
+            field=models.IntegerField(db_index=True, editable=False, null=True),
+        ),
+    ]
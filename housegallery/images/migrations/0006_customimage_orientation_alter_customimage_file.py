@@ -0,0 +1,25 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:25
+
+import housegallery.images.models
+import wagtail.images.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0005_customimage_perceptual_hash_customimage_phash_band_0_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customimage',
+            name='orientation',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='customimage',
+            name='file',
+            field=housegallery.images.models.OrientedImageField(height_field='height', upload_to=wagtail.images.models.get_upload_to, verbose_name='file', width_field='width'),
+        ),
+    ]
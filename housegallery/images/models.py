@@ -1,23 +1,56 @@
-import io
 import logging
+from contextlib import contextmanager
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.conf import settings
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from PIL import Image as PILImage
-from PIL import ImageOps
 from wagtail.images.models import AbstractImage
 from wagtail.images.models import AbstractRendition
+from wagtail.images.models import SourceImageIOError
+from wagtail.images.models import WagtailImageField
+from wagtail.images.models import WagtailImageFieldFile
+from wagtail.images.models import get_upload_to
 
 from taggit.managers import TaggableManager
 
+from .original_cache import get_original_cache
+from .placeholders import open_reduced
+from .placeholders import placeholder_from
+from .similarity import BAND_FIELDS
+from .similarity import dhash
+from .similarity import find_similar_images
+from .similarity import format_hash
+from .similarity import hash_bands
+from .renditions import profile_spec
+from .renditions import standard_specs
+from .uploads import read_header
+from .uploads import upright_size
+
 logger = logging.getLogger(__name__)
 
 
+class OrientedImageFieldFile(WagtailImageFieldFile):
+    """Reports the upright size of originals stored with an EXIF rotation."""
+
+    def get_image_dimensions(self):
+        size = super().get_image_dimensions()
+        return upright_size(size, getattr(self.instance, "orientation", 1))
+
+
+class OrientedImageField(WagtailImageField):
+    attr_class = OrientedImageFieldFile
+
+
 # We define our own custom image class to replace wagtailimages.Image,
 # providing various additional data fields
 class CustomImage(AbstractImage):
+    file = OrientedImageField(
+        verbose_name="file",
+        upload_to=get_upload_to,
+        width_field="width",
+        height_field="height",
+    )
     alt = models.CharField(
         max_length=510, help_text="Max length: 510 characters", blank=True,
     )
@@ -28,6 +61,26 @@ class CustomImage(AbstractImage):
     )
     tags = TaggableManager(blank=True)
 
+    # Computed from the file on upload (see placeholders.py)
+    placeholder = models.TextField(
+        blank=True, editable=False,
+        help_text="Tiny base64 WebP shown while the image loads",
+    )
+    dominant_color = models.CharField(max_length=7, blank=True, editable=False)
+
+    # 64-bit dHash as hex, plus its bands for the near-duplicate index
+    # (see similarity.py)
+    perceptual_hash = models.CharField(max_length=16, blank=True, editable=False)
+    phash_band_0 = models.IntegerField(null=True, editable=False, db_index=True)
+    phash_band_1 = models.IntegerField(null=True, editable=False, db_index=True)
+    phash_band_2 = models.IntegerField(null=True, editable=False, db_index=True)
+    phash_band_3 = models.IntegerField(null=True, editable=False, db_index=True)
+
+    # EXIF orientation of the stored original (1 = upright). The original is
+    # kept as uploaded; width/height are the upright size and renditions are
+    # rotated when they are generated (see uploads.py)
+    orientation = models.PositiveSmallIntegerField(default=1, editable=False)
+
     admin_form_fields = ("title", "file", "collection", "alt", "credit", "tags", "description")
 
 
@@ -37,15 +90,19 @@ class CustomImage(AbstractImage):
         if not self.alt:
             self.alt = self.title
 
-        is_new_upload = bool(
-            self.file and
-            (not self.pk or not hasattr(self, "_file_processed")),
-        )
+        # A file that has not been written to storage yet is a new upload
+        # or a replacement
+        is_new_upload = bool(self.file and not getattr(self.file, "_committed", True))
 
         if is_new_upload:
-            self._validate_uploaded_image()
-            self._apply_exif_transpose()
-            self._file_processed = True
+            header = self._validate_uploaded_image()
+            if header:
+                self._apply_orientation(header)
+
+        if self.file and not self.is_svg() and (
+            is_new_upload or not self.placeholder or not self.perceptual_hash
+        ):
+            self._compute_fingerprints()
 
         super().save(*args, **kwargs)
 
@@ -75,8 +132,32 @@ class CustomImage(AbstractImage):
     def get_display_optimized(self):
         """Get the best rendition for display based on image dimensions."""
         # Default to max-2560 for large originals, which is the common case now
-        filter_spec = "max-2560x2560|format-webp|webpquality-85"
-        return self.get_rendition(filter_spec)
+        return self.get_rendition(profile_spec("display"))
+
+    @contextmanager
+    def open_file(self):
+        """
+        Open the original for reading, through the local originals cache
+        when it is enabled, so generating several renditions one after
+        another downloads the file once.
+        """
+        cache = None
+        if self.file and self.file.closed and self.file_hash:
+            cache = get_original_cache(self._meta.get_field("file").storage)
+        if cache is None:
+            with super().open_file() as image_file:
+                yield image_file
+            return
+
+        try:
+            image_file = cache.open(self.file.name, "rb", version=self.file_hash)
+        except OSError as e:
+            # Same error Wagtail raises, so callers can tell a missing original
+            raise SourceImageIOError(str(e)) from e
+        try:
+            yield image_file
+        finally:
+            image_file.close()
 
     def get_original(self):
         """
@@ -87,37 +168,21 @@ class CustomImage(AbstractImage):
 
     def _validate_uploaded_image(self):
         """
-        Validate uploaded images without modifying the original:
-        - Check file size (max 20MB input)
-        - Verify it's a valid image format
+        Validate uploaded images from their header, without decoding them:
+        - Check file size (WAGTAILIMAGES_MAX_UPLOAD_SIZE)
+        - Check the pixel count, so a small file that would decode to
+          gigabytes is rejected (WAGTAILIMAGES_MAX_IMAGE_PIXELS)
         - Log info about the uploaded image
+        Returns the ImageHeader, or None if it could not be read.
         """
-        # Validate file size (20MB limit)
-        max_upload_size = 20 * 1024 * 1024  # 20MB
+        max_upload_size = settings.WAGTAILIMAGES_MAX_UPLOAD_SIZE
         if self.file.size > max_upload_size:
             max_size_mb = max_upload_size / (1024 * 1024)
             msg = f"Image file too large. Maximum size is {max_size_mb:.0f}MB"
             raise ValueError(msg)
 
         try:
-            # Validate that the file is a valid image
-            self.file.seek(0)  # Reset file pointer
-            image = PILImage.open(self.file)
-            image.verify()  # Verify it's a valid image
-
-            # Reset file pointer after verification
-            self.file.seek(0)
-
-            # Log successful validation (re-open to get dimensions)
-            with PILImage.open(self.file) as img:
-                logger.info(
-                    "Valid image uploaded: %s (%dx%d, %.2fMB)",
-                    self.file.name,
-                    img.width,
-                    img.height,
-                    self.file.size / (1024 * 1024),
-                )
-
+            header = read_header(self.file)
         except OSError as e:
             # Handle image format/corruption errors
             logger.exception(
@@ -126,7 +191,7 @@ class CustomImage(AbstractImage):
             msg = f"Invalid image file: {e!s}"
             raise ValueError(msg) from e
         except ValueError:
-            # Re-raise validation errors (file size, etc.)
+            # Re-raise validation errors (pixel count)
             logger.exception("Image validation failed for %s", self.file.name)
             raise
         except Exception:
@@ -135,56 +200,47 @@ class CustomImage(AbstractImage):
                 "Unexpected error validating image %s", self.file.name,
             )
             # Continue with original file for unexpected errors only
+            return None
+
+        logger.info(
+            "Valid image uploaded: %s (%dx%d, %.2fMB)",
+            self.file.name,
+            header.width,
+            header.height,
+            self.file.size / (1024 * 1024),
+        )
+        return header
 
-    def _apply_exif_transpose(self):
-        """Apply EXIF rotation to ensure width/height match visual orientation."""
-        try:
-            self.file.seek(0)
-            image = PILImage.open(self.file)
-
-            # Check if EXIF transpose is needed
-            exif = image.getexif()
-            orientation = exif.get(0x0112)  # EXIF orientation tag
-            if orientation is None or orientation == 1:
-                # No rotation needed
-                return
-
-            # Apply EXIF transpose
-            transposed = ImageOps.exif_transpose(image)
-
-            # Save back in original format
-            output = io.BytesIO()
-            img_format = image.format or "JPEG"
-
-            save_kwargs = {"format": img_format}
-            if img_format.upper() == "JPEG":
-                save_kwargs["quality"] = 95
-            elif img_format.upper() == "WEBP":
-                save_kwargs["quality"] = 95
-
-            transposed.save(output, **save_kwargs)
-
-            # Replace the file
-            file_size = output.tell()
-            output.seek(0)
-
-            from pathlib import Path
-
-            original_name = Path(self.file.name).name
-
-            self.file = InMemoryUploadedFile(
-                output,
-                "ImageField",
-                original_name,
-                f"image/{img_format.lower()}",
-                file_size,
-                None,
-            )
-            self.file_size = file_size
+    def _compute_fingerprints(self):
+        """Store the placeholder, dominant colour and perceptual hash.
 
+        All three come from one reduced decode of the file.
+        """
+        try:
+            small = open_reduced(self.file)
+            self.placeholder, self.dominant_color = placeholder_from(small)
+            self.set_perceptual_hash(dhash(small))
         except Exception:
-            logger.exception("Failed to apply EXIF transpose to %s", self.file.name)
-            # Continue with original file
+            logger.exception("Failed to compute placeholder for %s", self.file.name)
+            # Leave the previous values; the backfill command retries blanks
+
+    def set_perceptual_hash(self, value):
+        """Store a dHash and its index bands."""
+        self.perceptual_hash = format_hash(value)
+        for field, band in zip(BAND_FIELDS, hash_bands(value)):
+            setattr(self, field, band)
+
+    def get_similar_images(self, queryset=None):
+        """Return ``[(image, distance)]`` for near-duplicates, closest first."""
+        return find_similar_images(self, queryset)
+
+    def _apply_orientation(self, header):
+        """Record the EXIF orientation and the upright width/height.
+
+        The original is not re-encoded; renditions apply the rotation.
+        """
+        self.orientation = header.orientation
+        self.width, self.height = header.upright_size
 
 
 class Rendition(AbstractRendition):
@@ -204,39 +260,76 @@ class Rendition(AbstractRendition):
         )
 
 
+class RenditionJob(models.Model):
+    """A queued request to generate one rendition of an image.
+
+    Jobs are unique per (image, filter spec), so enqueueing the same work
+    twice is a no-op. They are picked up by the ``process_rendition_jobs``
+    management command; see ``housegallery.images.rendition_queue``.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    image = models.ForeignKey(
+        "CustomImage",
+        related_name="rendition_jobs",
+        on_delete=models.CASCADE,
+    )
+    filter_spec = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Rendition Job"
+        verbose_name_plural = "Rendition Jobs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "filter_spec"], name="unique_rendition_job",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="rendition_job_queue_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.image_id}: {self.filter_spec} ({self.status})"
+
+
+# Renditions pre-generated for every upload, so templates rarely have to
+# render one on the fly. See housegallery.images.renditions for the profiles.
+STANDARD_RENDITION_SPECS = tuple(standard_specs())
+
+
 @receiver(post_save, sender=CustomImage)
 def generate_standard_renditions(sender, instance, created, **kwargs):
     """
-    Generate standard renditions when an image is uploaded.
-    This pre-generates the common sizes used in templates to avoid
-    template-time image processing.
+    Queue the standard renditions when an image is uploaded.
+    Generating them inline kept multi-uploads blocked for minutes; the
+    ``process_rendition_jobs`` worker builds them in the background.
     """
     if created:
+        from .rendition_queue import enqueue_renditions
+
         try:
-            # Legacy template tag renditions ({% image ... width-400 %} etc.)
-            instance.get_rendition('width-400')
-            instance.get_rendition('width-400|format-webp')
-            instance.get_rendition('width-1200')
-            instance.get_rendition('width-1200|format-webp')
-
-            # Medium size for srcset
-            instance.get_rendition('width-800|format-webp')
-
-            # New helper method renditions
-            # get_web_optimized() - used for smaller/medium display
-            instance.get_rendition('width-1440|format-webp|webpquality-85')
-            # get_display_optimized() - analyzes image and picks best spec
-            instance.get_display_optimized()
-            # get_thumbnail() - admin and card thumbnails
-            instance.get_rendition('fill-300x300|format-webp|webpquality-90')
-
-            logger.info(
-                "Generated standard renditions for image: %s",
-                instance.title
-            )
+            enqueue_renditions(instance, STANDARD_RENDITION_SPECS)
         except Exception as e:
             logger.error(
-                "Failed to generate renditions for image %s: %s",
+                "Failed to queue renditions for image %s: %s",
                 instance.title,
                 str(e)
             )
@@ -0,0 +1,174 @@
+"""Bounded on-disk cache of original image files.
+
+Originals live in the GCS-backed default storage, and every rendition
+generated outside the batch pipeline (Wagtail's ``get_rendition``, queue
+retries, AVIF alternatives, one-off custom renditions) downloads the
+whole file again. ``CachedOriginalStorage`` wraps a storage and keeps
+recently read originals in a local directory, capped at ``max_bytes``
+and evicted least recently used first.
+
+Entries are keyed by file name *and* a content version (the image's
+``file_hash``), so a name reused after a delete never serves stale bytes.
+The directory can be shared by every worker process on the instance:
+files are written under a temporary name and renamed into place, and
+recency is the file's mtime, refreshed on each hit.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+
+# Downloads in progress; ignored by eviction and stats
+TEMP_PREFIX = ".partial-"
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class CachedOriginalStorage:
+    """Read-through wrapper around a storage, for opening files to read.
+
+    Everything except ``open`` is passed to the wrapped storage unchanged.
+    """
+
+    def __init__(self, storage, cache_dir, max_bytes):
+        self.storage = storage
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "uncacheable": 0}
+
+    def __getattr__(self, name):
+        return getattr(self.storage, name)
+
+    def open(self, name, mode="rb", version=""):
+        """Open ``name`` for reading from the local copy, downloading it on a miss.
+
+        ``version`` identifies the content (e.g. a hash of the file), so a
+        replaced file under the same name is fetched again.
+        """
+        if "r" not in mode or "+" in mode:
+            return self.storage.open(name, mode)
+
+        path = self._path_for(name, version)
+        try:
+            local = open(path, "rb")  # noqa: SIM115 - returned to the caller
+        except FileNotFoundError:
+            return self._fetch(name, path)
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return File(local, name=name)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        entries = self._entries()
+        stats["entries"] = len(entries)
+        stats["bytes"] = sum(size for _path, _mtime, size in entries)
+        return stats
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _path_for(self, name, version):
+        key = hashlib.sha256(f"{name}\0{version}".encode()).hexdigest()
+        return self.cache_dir / (key + Path(name).suffix.lower())
+
+    def _fetch(self, name, path):
+        self._count("misses")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, partial = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as out, self.storage.open(name, "rb") as source:
+                for chunk in source.chunks(COPY_CHUNK_SIZE):
+                    out.write(chunk)
+            local = open(partial, "rb")  # noqa: SIM115 - returned to the caller
+        except BaseException:
+            os.unlink(partial)
+            raise
+
+        size = os.fstat(local.fileno()).st_size
+        if size > self.max_bytes:
+            # Too big to keep; the open handle outlives the unlinked file
+            self._count("uncacheable")
+            os.unlink(partial)
+        else:
+            os.replace(partial, path)
+            self._evict(keep=path)
+        return File(local, name=name)
+
+    def _entries(self):
+        """``[(path, mtime, size)]`` of the cached files."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(TEMP_PREFIX) or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, stat.st_mtime, stat.st_size))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _evict(self, keep):
+        entries = self._entries()
+        total = sum(size for _path, _mtime, size in entries)
+        if total <= self.max_bytes:
+            return
+        # Oldest first; never the file being handed out
+        for path, _mtime, size in sorted(entries, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            if path == str(keep):
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            self._count("evictions")
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_original_cache(storage):
+    """Return ``storage`` wrapped in the process-wide cache, or ``None`` if disabled.
+
+    Rebuilt when the storage or cache settings change, so tests can
+    override them.
+    """
+    global _cache
+    cache_dir = Path(settings.IMAGES_ORIGINAL_CACHE_DIR)
+    max_bytes = settings.IMAGES_ORIGINAL_CACHE_MAX_BYTES
+    if not max_bytes:
+        return None
+    with _cache_lock:
+        if (
+            _cache is None
+            or _cache.storage is not storage
+            or _cache.cache_dir != cache_dir
+            or _cache.max_bytes != max_bytes
+        ):
+            _cache = CachedOriginalStorage(storage, cache_dir, max_bytes)
+        return _cache
@@ -0,0 +1,83 @@
+"""Low-quality image placeholders (LQIP) computed when an image is uploaded.
+
+Each image stores a 16px WebP as a base64 data URI and its dominant
+colour, so galleries, the kiosk carousel and API clients can paint
+something the right shape and colour before the real thumbnail arrives.
+Both come from one heavily reduced decode of the original: JPEGs are
+decoded at 1/8 scale by libjpeg itself, so even very large uploads cost
+a few milliseconds.
+"""
+
+import base64
+import io
+import logging
+
+from PIL import Image as PILImage
+from PIL import ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Longest edge of the placeholder image
+PLACEHOLDER_SIZE = 16
+
+# Low quality is fine: the placeholder is shown blurred and stretched
+PLACEHOLDER_QUALITY = 40
+
+# Palette size used to pick the dominant colour
+DOMINANT_COLOR_PALETTE = 5
+
+# Longest edge of the reduced decode that placeholders and perceptual
+# hashes are computed from
+REDUCED_SIZE = 64
+
+
+def open_reduced(file):
+    """Decode an image file into a small, upright RGB image.
+
+    Raises whatever Pillow raises if the file cannot be decoded.
+    """
+    file.seek(0)
+    with PILImage.open(file) as image:
+        # Let the JPEG decoder do most of the downscaling
+        image.draft("RGB", (REDUCED_SIZE, REDUCED_SIZE))
+        small = ImageOps.exif_transpose(image)
+        if small.mode != "RGB":
+            small = _flatten(small)
+        small.thumbnail((REDUCED_SIZE, REDUCED_SIZE), PILImage.Resampling.BOX)
+    file.seek(0)
+    return small
+
+
+def compute_placeholder(file):
+    """Return ``(placeholder data URI, "#rrggbb")`` for an image file."""
+    return placeholder_from(open_reduced(file))
+
+
+def placeholder_from(image):
+    """Return ``(placeholder data URI, "#rrggbb")`` for a decoded image."""
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), PILImage.Resampling.BOX)
+
+    buf = io.BytesIO()
+    small.save(buf, format="WEBP", quality=PLACEHOLDER_QUALITY, method=6)
+    data_uri = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return data_uri, dominant_color(small)
+
+
+def dominant_color(image):
+    """Return the most common colour of a small RGB image as ``#rrggbb``."""
+    quantized = image.quantize(colors=DOMINANT_COLOR_PALETTE)
+    palette = quantized.getpalette()
+    _count, index = max(quantized.getcolors())
+    r, g, b = palette[index * 3:index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _flatten(image):
+    """Convert to RGB, compositing any transparency onto white."""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = PILImage.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
@@ -0,0 +1,235 @@
+"""Generate several renditions of an image from a single decode of the original.
+
+``AbstractImage.get_rendition`` downloads and decodes the full original for
+every spec; for the standard set that is eight reads of a file of up to
+20MB. ``generate_renditions`` instead:
+
+1. downloads the original once,
+2. decodes it once, letting Pillow's JPEG ``draft()`` mode skip detail that
+   no requested size needs (DCT scaling to 1/2, 1/4 or 1/8),
+3. walks the specs from largest to smallest, halving the working image with
+   ``Image.reduce`` whenever it is still at least twice the next size, and
+4. hands each pre-sized image to Wagtail's own ``Filter.run`` for the
+   format, quality and encoding steps, so output matches ``get_rendition``,
+5. saves all new ``Rendition`` rows in one transaction.
+
+Crop rectangles are computed by Wagtail against the full-size original, so
+``fill-`` specs still respect focal points.
+"""
+
+import logging
+import math
+from contextlib import contextmanager
+from io import BytesIO
+
+from django.db import transaction
+from django.db.models import Q
+from PIL import Image as PILImage
+from PIL import ImageOps
+from wagtail.images.image_operations import ImageTransform
+from wagtail.images.models import Filter
+from willow.plugins.pillow import PillowImage
+
+from .uploads import exif_orientation
+from .uploads import upright_size
+
+logger = logging.getLogger(__name__)
+
+# Pillow format names that Wagtail knows under another name
+_FORMAT_ALIASES = {"mpo": "jpeg"}
+
+
+class _DecodedImage(PillowImage):
+    """Willow image that remembers the format of the original file."""
+
+    def __init__(self, image, format_name):
+        super().__init__(image)
+        self._format_name = format_name
+
+    @property
+    def format_name(self):
+        return self._format_name
+
+
+class _PreparedFilter(Filter):
+    """Filter whose source is already cropped and resized.
+
+    Wagtail's ``Filter.run`` then only applies the filter operations
+    (format, quality, background colour) and encodes the output.
+    """
+
+    def __init__(self, spec, willow_image):
+        super().__init__(spec)
+        self._willow_image = willow_image
+
+    @contextmanager
+    def get_willow_image(self, image, source=None):
+        yield self._willow_image
+
+    def get_transform(self, image, size=None):
+        return ImageTransform(size)
+
+
+def _open_original(data):
+    """Return ``(pil_image, format_name, oriented_size, orientation)`` without decoding."""
+    pil_image = PILImage.open(BytesIO(data))
+    format_name = (pil_image.format or "").lower()
+    format_name = _FORMAT_ALIASES.get(format_name, format_name)
+    orientation = exif_orientation(pil_image)
+    return pil_image, format_name, upright_size(pil_image.size, orientation), orientation
+
+
+def _decode(pil_image, format_name, orientation, scale):
+    """Decode ``pil_image`` at no less than ``scale`` of its full size."""
+    if format_name == "jpeg" and scale < 1:
+        width, height = pil_image.size
+        pil_image.draft(
+            pil_image.mode,
+            (math.ceil(width * scale), math.ceil(height * scale)),
+        )
+    pil_image.load()
+    if orientation != 1:
+        pil_image = ImageOps.exif_transpose(pil_image)
+    if pil_image.mode in ("1", "P"):
+        # Palette images aren't antialiased when resized
+        has_alpha = "transparency" in pil_image.info
+        pil_image = pil_image.convert("RGBA" if has_alpha else "RGB")
+    return pil_image
+
+
+def _scale_of(transform):
+    """Output pixels per original pixel for a transform."""
+    rect = transform.get_rect()
+    return min(transform.size[0] / rect.width, 1.0)
+
+
+def _render_from(working, full_size, transform):
+    """Crop and resize ``working`` (a downscaled original) to ``transform``."""
+    x_factor = working.width / full_size[0]
+    y_factor = working.height / full_size[1]
+    left, top, right, bottom = transform.get_rect()
+    box = (left * x_factor, top * y_factor, right * x_factor, bottom * y_factor)
+    return working.resize(
+        tuple(int(v) for v in transform.size), PILImage.LANCZOS, box=box,
+    )
+
+
+def _fallback(image, filters, renditions, errors):
+    """Generate ``filters`` one at a time with Wagtail's default path."""
+    for filter in filters:
+        try:
+            renditions[filter.spec] = image.get_rendition(filter)
+        except Exception as e:
+            errors[filter.spec] = e
+
+
+def generate_renditions(image, specs):
+    """Create any missing renditions of ``image`` for ``specs``.
+
+    Returns ``(renditions, errors)``: renditions keyed by spec (existing
+    ones included), and the exception for each spec that failed.
+    """
+    errors = {}
+    filters = []
+    for spec in dict.fromkeys(specs):
+        filter = Filter(spec)
+        try:
+            filter.operations  # noqa: B018 - parses and validates the spec
+        except Exception as e:
+            errors[spec] = e
+        else:
+            filters.append(filter)
+
+    found = image.find_existing_renditions(*filters) if filters else {}
+    renditions = {filter.spec: rendition for filter, rendition in found.items()}
+
+    missing = [filter for filter in filters if filter not in found]
+    if not missing:
+        return renditions, errors
+    if image.is_svg():
+        _fallback(image, missing, renditions, errors)
+        return renditions, errors
+
+    # One download of the original for every spec
+    with image.open_file() as file:
+        data = file.read()
+
+    try:
+        pil_image, format_name, full_size, orientation = _open_original(data)
+    except Exception:
+        logger.exception("Could not open original of image %s", image.pk)
+        _fallback(image, missing, renditions, errors)
+        return renditions, errors
+
+    transforms = []
+    for filter in missing:
+        try:
+            transforms.append((filter, filter.get_transform(image, full_size)))
+        except Exception as e:
+            errors[filter.spec] = e
+    if not transforms:
+        return renditions, errors
+
+    # Largest output first, so each smaller one can start from a halving
+    transforms.sort(key=lambda item: _scale_of(item[1]), reverse=True)
+    try:
+        working = _decode(pil_image, format_name, orientation, _scale_of(transforms[0][1]))
+    except Exception:
+        logger.exception("Could not decode original of image %s", image.pk)
+        _fallback(image, [filter for filter, _transform in transforms], renditions, errors)
+        return renditions, errors
+
+    Rendition = image.get_rendition_model()
+    to_create = []
+    for filter, transform in transforms:
+        target_scale = _scale_of(transform)
+        while working.width // 2 >= 1 and working.width / 2 / full_size[0] >= target_scale:
+            working = working.reduce(2)
+        try:
+            output = _render_from(working, full_size, transform)
+            prepared = _PreparedFilter(filter.spec, _DecodedImage(output, format_name))
+            to_create.append(Rendition(
+                image=image,
+                filter_spec=filter.spec,
+                focal_point_key=filter.get_cache_key(image),
+                file=image.generate_rendition_file(prepared),
+            ))
+        except Exception as e:
+            errors[filter.spec] = e
+
+    if not to_create:
+        return renditions, errors
+
+    with transaction.atomic():
+        # Another worker may have created some of these in the meantime
+        clashes = Q()
+        for rendition in to_create:
+            clashes |= Q(
+                filter_spec=rendition.filter_spec,
+                focal_point_key=rendition.focal_point_key,
+            )
+        for existing in image.renditions.filter(clashes):
+            renditions[existing.filter_spec] = existing
+        to_create = [
+            rendition for rendition in to_create
+            if rendition.filter_spec not in renditions
+        ]
+        if not to_create:
+            return renditions, errors
+        # Ignored conflicts leave no way to tell which rows were inserted
+        # (and no pks on Postgres), so read back what was actually stored
+        Rendition.objects.bulk_create(to_create, ignore_conflicts=True)
+        stored = {
+            (rendition.filter_spec, rendition.focal_point_key): rendition
+            for rendition in image.renditions.filter(clashes)
+        }
+
+    for rendition in to_create:
+        saved = stored.get((rendition.filter_spec, rendition.focal_point_key))
+        if saved is not None:
+            renditions[rendition.filter_spec] = saved
+        if saved is None or saved.file.name != rendition.file.name:
+            # Lost the race to another worker; its file is the one in use
+            rendition.file.delete(save=False)
+
+    return renditions, errors
@@ -0,0 +1,200 @@
+"""Database-backed queue for background rendition generation.
+
+Uploads enqueue one ``RenditionJob`` per (image, filter spec) and return
+straight away; the ``process_rendition_jobs`` management command claims
+jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` so several workers can
+drain the queue without stepping on each other.
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from housegallery.core.cache_dependencies import IMAGE, invalidate_dependents
+from .models import CustomImage, RenditionJob
+from .rendition_pipeline import generate_renditions
+
+logger = logging.getLogger(__name__)
+
+# Failed jobs are retried until they have been attempted this many times
+MAX_ATTEMPTS = 3
+
+# A running job not finished after this long is assumed to belong to a
+# crashed worker and is handed out again
+STALE_AFTER = datetime.timedelta(minutes=10)
+
+_ACTIVE_STATUSES = (RenditionJob.STATUS_PENDING, RenditionJob.STATUS_RUNNING)
+
+
+def enqueue_renditions(image, specs):
+    """Queue ``specs`` for ``image``; returns the number of new jobs.
+
+    Idempotent: existing pending or running jobs are left alone, and
+    finished or failed ones are put back in the queue.
+    """
+    specs = list(dict.fromkeys(specs))
+    with transaction.atomic():
+        existing = set(
+            RenditionJob.objects.filter(image=image, filter_spec__in=specs)
+            .values_list("filter_spec", flat=True)
+        )
+        RenditionJob.objects.bulk_create(
+            [
+                RenditionJob(image=image, filter_spec=spec)
+                for spec in specs if spec not in existing
+            ],
+            ignore_conflicts=True,
+        )
+        RenditionJob.objects.filter(
+            image=image, filter_spec__in=existing,
+        ).exclude(status__in=_ACTIVE_STATUSES).update(
+            status=RenditionJob.STATUS_PENDING,
+            attempts=0,
+            last_error="",
+            claimed_at=None,
+            finished_at=None,
+        )
+    return len(specs) - len(existing)
+
+
+def enqueue_missing_renditions(images, spec):
+    """Queue ``spec`` for each of ``images`` (a queryset) that does not
+    have it yet; returns the number of images missing it.
+
+    For building one rendition across many images at once, e.g. a kiosk's
+    screen size when it is published. As with ``enqueue_renditions``,
+    pending or running jobs are left alone and finished or failed ones are
+    put back in the queue.
+    """
+    rendition_model = CustomImage.get_rendition_model()
+    missing = list(
+        images.exclude(
+            pk__in=rendition_model.objects.filter(filter_spec=spec).values("image_id"),
+        ).values_list("pk", flat=True).distinct()
+    )
+    if not missing:
+        return 0
+    with transaction.atomic():
+        RenditionJob.objects.bulk_create(
+            [RenditionJob(image_id=image_id, filter_spec=spec) for image_id in missing],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        RenditionJob.objects.filter(
+            image_id__in=missing, filter_spec=spec,
+        ).exclude(status__in=_ACTIVE_STATUSES).update(
+            status=RenditionJob.STATUS_PENDING,
+            attempts=0,
+            last_error="",
+            claimed_at=None,
+            finished_at=None,
+        )
+    return len(missing)
+
+
+def is_rendition_queued(image, filter_spec):
+    """Return True if a rendition is waiting for (or being built by) a worker."""
+    return RenditionJob.objects.filter(
+        image_id=image.pk, filter_spec=filter_spec, status__in=_ACTIVE_STATUSES,
+    ).exists()
+
+
+def claim_jobs(limit):
+    """Mark up to ``limit`` jobs as running and return them, oldest first."""
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            RenditionJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=RenditionJob.STATUS_PENDING)
+                | Q(status=RenditionJob.STATUS_RUNNING, claimed_at__lt=now - STALE_AFTER)
+            )
+            .order_by("created_at", "pk")[:limit]
+        )
+        RenditionJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=RenditionJob.STATUS_RUNNING,
+            claimed_at=now,
+            attempts=F("attempts") + 1,
+        )
+    for job in jobs:
+        job.status = RenditionJob.STATUS_RUNNING
+        job.claimed_at = now
+        job.attempts += 1
+    return jobs
+
+
+def run_jobs(jobs):
+    """Generate the renditions for claimed ``jobs``, one decode per image.
+
+    Returns ``(done, failed)`` counts. Images that gained renditions have
+    their cached galleries and carousels invalidated, since those may have
+    been built with the original file as a stand-in.
+    """
+    images = CustomImage.objects.in_bulk({job.image_id for job in jobs})
+    by_image = defaultdict(list)
+    for job in jobs:
+        by_image[job.image_id].append(job)
+
+    done = failed = 0
+    updated_images = []
+    for image_id, image_jobs in by_image.items():
+        image = images.get(image_id)
+        if image is None:
+            renditions = {}
+            errors = {
+                job.filter_spec: CustomImage.DoesNotExist(f"Image {image_id} no longer exists")
+                for job in image_jobs
+            }
+        else:
+            try:
+                renditions, errors = generate_renditions(
+                    image, [job.filter_spec for job in image_jobs],
+                )
+            except Exception as e:
+                renditions, errors = {}, {job.filter_spec: e for job in image_jobs}
+
+        for job in image_jobs:
+            if job.filter_spec in renditions:
+                done += 1
+                RenditionJob.objects.filter(pk=job.pk).update(
+                    status=RenditionJob.STATUS_DONE,
+                    last_error="",
+                    finished_at=timezone.now(),
+                )
+            else:
+                failed += 1
+                _mark_failed(job, errors.get(job.filter_spec, "rendition was not created"))
+        if renditions:
+            updated_images.append(image_id)
+
+    if updated_images:
+        invalidate_dependents(IMAGE, updated_images)
+    return done, failed
+
+
+def _mark_failed(job, error):
+    logger.warning(
+        "Rendition job %s (image %s, %s) failed on attempt %d: %s",
+        job.pk, job.image_id, job.filter_spec, job.attempts, error,
+    )
+    status = (
+        RenditionJob.STATUS_FAILED if job.attempts >= MAX_ATTEMPTS
+        else RenditionJob.STATUS_PENDING
+    )
+    RenditionJob.objects.filter(pk=job.pk).update(
+        status=status,
+        last_error=str(error),
+        finished_at=timezone.now() if status == RenditionJob.STATUS_FAILED else None,
+    )
+
+
+def process_jobs(limit):
+    """Claim and run one batch of jobs; returns ``(done, failed)`` counts."""
+    jobs = claim_jobs(limit)
+    if not jobs:
+        return 0, 0
+    return run_jobs(jobs)
@@ -0,0 +1,126 @@
+"""Named rendition profiles shared by every part of the site that asks for one.
+
+The upload signal, the rendition commands, ``get_image_urls``, the API and
+the kiosk all pick their filter specs from here, so every spec they request
+is one that is pre-generated for each upload. Add a profile here (and run
+``generate_renditions`` to backfill it) rather than writing a spec inline.
+
+Kiosk screen profiles are the exception: they are only generated for the
+images a kiosk shows, in the background when the kiosk is published.
+
+The large profiles can also have AVIF alternatives, which are much smaller
+than the WebP at the same visual quality. They are only generated when
+``IMAGES_AVIF_RENDITIONS`` is on and Pillow can encode AVIF.
+"""
+
+import functools
+import io
+
+from django.conf import settings
+
+# Profile name -> Wagtail filter spec. Every profile is pre-generated.
+RENDITION_PROFILES = {
+    # {% image ... width-400 %} in templates, listing and catalog thumbnails,
+    # hero showcard (small)
+    "thumb": "width-400",
+    "thumb_webp": "width-400|format-webp",
+    # Hero showcard (large)
+    "medium": "width-800",
+    # get_image_urls() medium size and kiosk carousel thumbnails
+    "medium_webp": "width-800|format-webp",
+    "large": "width-1200",
+    "large_webp": "width-1200|format-webp",
+    # get_web_optimized() and get_image_urls() full size
+    "web_optimized": "width-1440|format-webp|webpquality-85",
+    # get_display_optimized() and the API's high quality rendition
+    "display": "max-2560x2560|format-webp|webpquality-85",
+    # get_thumbnail() - admin and card thumbnails
+    "square_thumb": "fill-300x300|format-webp|webpquality-90",
+    # Featured event cards (4:5 crop)
+    "event_card": "fill-400x500|format-webp",
+}
+
+# AVIF alternatives, pre-generated alongside the WebP when enabled
+AVIF_PROFILES = {
+    "web_optimized_avif": "width-1440|format-avif|avifquality-60",
+    "display_avif": "max-2560x2560|format-avif|avifquality-60",
+}
+
+# Full-size kiosk slides, one per screen size a kiosk can be set to. Not
+# pre-generated; queued for a kiosk's images when it is published
+KIOSK_SCREEN_PROFILES = {
+    "kiosk_1080p": "max-1920x1080|format-webp|webpquality-85",
+    "kiosk_2160p": "max-3840x2160|format-webp|webpquality-85",
+}
+
+# Profile -> its AVIF alternative
+AVIF_ALTERNATIVES = {
+    "web_optimized": "web_optimized_avif",
+    "display": "display_avif",
+}
+
+# Size name -> profile for get_image_urls() when no specs are given
+IMAGE_URL_PROFILES = {
+    "thumb": "thumb",
+    "medium": "medium_webp",
+    "full": "web_optimized",
+}
+
+
+def profile_spec(name):
+    """Return the filter spec for a rendition profile name."""
+    if name in AVIF_PROFILES:
+        return AVIF_PROFILES[name]
+    if name in KIOSK_SCREEN_PROFILES:
+        return KIOSK_SCREEN_PROFILES[name]
+    return RENDITION_PROFILES[name]
+
+
+def profile_specs(profiles):
+    """Map ``{key: profile name}`` to ``{key: filter spec}``."""
+    return {key: profile_spec(name) for key, name in profiles.items()}
+
+
+def standard_profiles():
+    """Return ``{profile name: filter spec}`` for every pre-generated profile."""
+    if avif_enabled():
+        return {**RENDITION_PROFILES, **AVIF_PROFILES}
+    return dict(RENDITION_PROFILES)
+
+
+def standard_specs():
+    """Return the filter specs pre-generated for every image."""
+    return list(standard_profiles().values())
+
+
+def avif_alternative_specs():
+    """Return ``{filter spec: AVIF filter spec}`` for the profiles that have one.
+
+    Empty when AVIF renditions are not enabled.
+    """
+    if not avif_enabled():
+        return {}
+    return {
+        RENDITION_PROFILES[name]: AVIF_PROFILES[avif_name]
+        for name, avif_name in AVIF_ALTERNATIVES.items()
+    }
+
+
+def avif_enabled():
+    """Return True if AVIF alternatives are switched on and can be encoded."""
+    return getattr(settings, "IMAGES_AVIF_RENDITIONS", False) and avif_supported()
+
+
+@functools.cache
+def avif_supported():
+    """Return True if Pillow (directly or through pillow-heif) can write AVIF."""
+    from PIL import Image as PILImage
+
+    # Registers pillow-heif's AVIF plugin where that is how AVIF is provided
+    import willow.plugins.pillow  # noqa: F401
+
+    try:
+        PILImage.new("RGB", (8, 8)).save(io.BytesIO(), format="AVIF")
+    except Exception:
+        return False
+    return True
@@ -0,0 +1,49 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from taggit.models import TaggedItem
+
+from housegallery.core.cache_dependencies import IMAGE, invalidate_dependents
+from housegallery.core.rendition_resolver import resolver
+from .models import CustomImage, Rendition
+
+
+# ============================================================================
+# Cache Invalidation Signals
+# ============================================================================
+
+@receiver(post_save, sender=CustomImage)
+@receiver(post_delete, sender=CustomImage)
+def invalidate_image_dependents(sender, instance, **kwargs):
+    """
+    Invalidate cached galleries and carousels built from an image when its
+    title, credit, alt text or file changes.
+    """
+    invalidate_dependents(IMAGE, [instance.pk])
+
+
+@receiver(post_save, sender=TaggedItem)
+@receiver(post_delete, sender=TaggedItem)
+def invalidate_image_dependents_on_tag_change(sender, instance, **kwargs):
+    """
+    Invalidate an image's dependents when it is tagged or untagged, since
+    tags decide which gallery section an exhibition photo appears in.
+    """
+    if instance.content_type_id == ContentType.objects.get_for_model(CustomImage).pk:
+        invalidate_dependents(IMAGE, [instance.object_id])
+
+
+@receiver(post_save, sender=CustomImage)
+@receiver(post_delete, sender=CustomImage)
+def invalidate_resolved_renditions(sender, instance, **kwargs):
+    """
+    Forget the rendition URLs resolved for an image when its file or focal
+    point may have changed.
+    """
+    resolver.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=Rendition)
+def invalidate_resolved_rendition(sender, instance, **kwargs):
+    """Forget the resolved URL of a deleted rendition."""
+    resolver.invalidate(instance.image_id, [instance.filter_spec])
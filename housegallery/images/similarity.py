@@ -0,0 +1,165 @@
+"""Perceptual hashing for spotting re-uploads of the same photograph.
+
+Each image stores a 64-bit difference hash (dHash) of its pixels, which
+survives re-encoding, resizing and small exposure tweaks that change the
+file's bytes (and so Wagtail's ``file_hash``). Two images are treated as
+near-duplicates when their hashes differ in at most ``SIMILAR_DISTANCE``
+bits.
+
+To avoid comparing an upload against every image, the hash is also stored
+split into ``HASH_BANDS`` bands in indexed columns. Two hashes within
+``HASH_BANDS - 1`` bits of each other must agree exactly on at least one
+band, so an OR of equality lookups finds every candidate and the exact
+Hamming distance is checked in Python on that handful of rows.
+
+Flat or smooth pictures (blank scans, plain backgrounds, gradients) have
+almost no brightness steps, so their hashes are all or nearly all zeros
+(or ones) whatever they show. They would all "match" each other and share
+band values with a large part of the library, so they are left out of
+matching altogether.
+"""
+
+from collections import defaultdict
+
+from django.db.models import Q
+
+from PIL import Image as PILImage
+
+HASH_BITS = 64
+HASH_BANDS = 4
+BAND_BITS = HASH_BITS // HASH_BANDS
+
+# Largest Hamming distance the band index is guaranteed to find
+SIMILAR_DISTANCE = HASH_BANDS - 1
+
+BAND_FIELDS = [f"phash_band_{i}" for i in range(HASH_BANDS)]
+
+# Hashes with fewer set (or unset) bits than this carry too little detail
+# to tell pictures apart
+MIN_DETAIL_BITS = 8
+
+# Most band matches fetched for one image; a popular band value must not
+# turn a duplicate check into a scan of the library
+MAX_CANDIDATES = 200
+
+
+def dhash(image):
+    """Return the 64-bit difference hash of a decoded image.
+
+    Each bit says whether a pixel of a 9x8 greyscale thumbnail is brighter
+    than its right-hand neighbour.
+    """
+    grey = image.convert("L").resize((9, 8), PILImage.Resampling.BOX)
+    pixels = list(grey.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hash_bands(value):
+    """Split a hash into ``HASH_BANDS`` integers, most significant first."""
+    mask = (1 << BAND_BITS) - 1
+    return [
+        (value >> (BAND_BITS * (HASH_BANDS - 1 - i))) & mask
+        for i in range(HASH_BANDS)
+    ]
+
+
+def hamming(a, b):
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def is_low_detail(value):
+    """Return True if a hash is too flat to identify a picture."""
+    set_bits = value.bit_count()
+    return min(set_bits, HASH_BITS - set_bits) < MIN_DETAIL_BITS
+
+
+def parse_hash(hex_value):
+    return int(hex_value, 16)
+
+
+def format_hash(value):
+    return f"{value:016x}"
+
+
+def find_similar_images(image, queryset=None, max_distance=SIMILAR_DISTANCE):
+    """Return ``[(other image, distance)]`` for near-duplicates of ``image``.
+
+    Closest first. ``queryset`` limits the candidates (e.g. to images the
+    user may choose); it defaults to every image. Low-detail images have
+    no matches, and at most ``MAX_CANDIDATES`` (the most recent) band
+    matches are compared.
+    """
+    if not image.perceptual_hash:
+        return []
+    value = parse_hash(image.perceptual_hash)
+    if is_low_detail(value):
+        return []
+    if queryset is None:
+        queryset = type(image).objects.all()
+
+    any_band = Q()
+    for field, band in zip(BAND_FIELDS, hash_bands(value)):
+        any_band |= Q(**{field: band})
+
+    candidates = queryset.filter(any_band).exclude(pk=image.pk).order_by("-pk")
+    matches = []
+    for other in candidates[:MAX_CANDIDATES]:
+        distance = hamming(value, parse_hash(other.perceptual_hash))
+        if distance <= max_distance:
+            matches.append((other, distance))
+    matches.sort(key=lambda match: (match[1], match[0].pk))
+    return matches
+
+
+def find_similar_clusters(rows, max_distance=SIMILAR_DISTANCE):
+    """Group near-duplicate images.
+
+    Args:
+        rows: Iterable of ``(image id, hex hash)``.
+        max_distance: Largest Hamming distance that links two images.
+
+    Returns:
+        List of clusters (sorted lists of image ids) with more than one
+        image. Near-duplication is transitive here: A~B and B~C puts all
+        three in one cluster. Low-detail images are never clustered.
+    """
+    hashes = {image_id: parse_hash(value) for image_id, value in rows if value}
+    hashes = {
+        image_id: value for image_id, value in hashes.items()
+        if not is_low_detail(value)
+    }
+
+    # Only images sharing a band value can be within range
+    buckets = defaultdict(list)
+    for image_id, value in hashes.items():
+        for i, band in enumerate(hash_bands(value)):
+            buckets[(i, band)].append(image_id)
+
+    parent = {image_id: image_id for image_id in hashes}
+
+    def find(image_id):
+        while parent[image_id] != image_id:
+            parent[image_id] = parent[parent[image_id]]
+            image_id = parent[image_id]
+        return image_id
+
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if find(a) != find(b) and hamming(hashes[a], hashes[b]) <= max_distance:
+                    parent[find(a)] = find(b)
+
+    clusters = defaultdict(list)
+    for image_id in hashes:
+        clusters[find(image_id)].append(image_id)
+    return sorted(
+        (sorted(members) for members in clusters.values() if len(members) > 1),
+        key=lambda members: members[0],
+    )
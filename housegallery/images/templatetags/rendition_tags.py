@@ -0,0 +1,28 @@
+from django import template
+
+from housegallery.core.rendition_resolver import resolver
+from housegallery.images.renditions import profile_spec
+
+register = template.Library()
+
+
+@register.simple_tag
+def rendition(image, profile):
+    """
+    Resolve a named rendition profile through the shared rendition cache.
+    Returns a dict with url, width and height, or None.
+    Usage: {% rendition image "web_optimized" as img %}{{ img.url }}
+    """
+    if not image:
+        return None
+    return resolver.resolve_one(image, profile_spec(profile))
+
+
+@register.simple_tag
+def rendition_url(image, profile):
+    """
+    Output the URL of a named rendition profile, or an empty string.
+    Usage: <img src="{% rendition_url image "thumb" %}">
+    """
+    data = rendition(image, profile)
+    return data["url"] if data else ""
@@ -0,0 +1,89 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from housegallery.core.image_utils import get_image_urls
+from housegallery.images.models import CustomImage
+from housegallery.images.renditions import (
+    AVIF_PROFILES,
+    RENDITION_PROFILES,
+    profile_spec,
+    standard_specs,
+)
+
+
+@pytest.fixture
+def avif_on(settings):
+    settings.IMAGES_AVIF_RENDITIONS = True
+    with patch("housegallery.images.renditions.avif_supported", return_value=True):
+        yield
+
+
+class TestAvifProfiles:
+    def test_off_by_default(self):
+        assert standard_specs() == list(RENDITION_PROFILES.values())
+
+    def test_needs_an_encoder(self, settings):
+        settings.IMAGES_AVIF_RENDITIONS = True
+        with patch("housegallery.images.renditions.avif_supported", return_value=False):
+            assert standard_specs() == list(RENDITION_PROFILES.values())
+
+    def test_pre_generated_when_enabled(self, avif_on):
+        assert set(standard_specs()) == {
+            *RENDITION_PROFILES.values(), *AVIF_PROFILES.values(),
+        }
+
+
+@pytest.mark.django_db
+class TestAvifImageUrls:
+    def test_avif_srcset_uses_existing_avif(self, avif_on, make_image, make_image_with_renditions):
+        image = make_image()
+        make_image_with_renditions(image, [
+            {"url": "/t.jpg", "width": 400, "height": 300, "filter_spec": profile_spec("thumb")},
+            {"url": "/m.webp", "width": 800, "height": 600, "filter_spec": profile_spec("medium_webp")},
+            {"url": "/f.webp", "width": 1440, "height": 1080, "filter_spec": profile_spec("web_optimized")},
+            {"url": "/f.avif", "width": 1440, "height": 1080,
+             "filter_spec": profile_spec("web_optimized_avif")},
+        ])
+
+        urls = get_image_urls(image)
+
+        assert urls["full_avif_url"] == "/f.avif"
+        assert urls["avif_srcset"] == "/t.jpg 400w, /m.webp 800w, /f.avif 1440w"
+        assert urls["srcset"] == "/t.jpg 400w, /m.webp 800w, /f.webp 1440w"
+
+    def test_missing_avif_is_not_rendered_in_request(
+        self, avif_on, make_image, make_image_with_renditions,
+    ):
+        image = make_image()
+        make_image_with_renditions(image, [
+            {"url": "/t.jpg", "width": 400, "height": 300, "filter_spec": profile_spec("thumb")},
+            {"url": "/f.webp", "width": 1440, "height": 1080, "filter_spec": profile_spec("web_optimized")},
+        ])
+
+        with patch.object(CustomImage, "get_rendition") as get_rendition:
+            urls = get_image_urls(image)
+
+        assert profile_spec("web_optimized_avif") not in [
+            call.args[0] for call in get_rendition.call_args_list
+        ]
+        assert urls["avif_srcset"] == ""
+
+
+@pytest.mark.django_db
+class TestBenchmarkCommand:
+    def test_reports_each_variant(self, make_image):
+        make_image()
+        out = io.StringIO()
+
+        with patch(
+            "housegallery.images.management.commands.benchmark_image_formats.avif_supported",
+            return_value=False,
+        ):
+            call_command("benchmark_image_formats", "--webp-quality", "80", "90", stdout=out)
+
+        output = out.getvalue()
+        assert "Encoded 1 images" in output
+        assert output.count("WEBP") == 4  # two qualities at two sizes
@@ -0,0 +1,88 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from housegallery.images.management.commands.generate_renditions import (
+    STANDARD_RENDITIONS,
+    Command,
+    get_missing_renditions,
+)
+from housegallery.images.models import CustomImage
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture(autouse=True)
+def _use_locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHE
+    cache.clear()
+
+
+def _run(**options):
+    out = StringIO()
+    call_command("generate_renditions", stdout=out, **options)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestGetMissingRenditions:
+    def test_finds_specific_missing_spec(self, make_image):
+        image = make_image()
+        image.get_rendition("width-400")
+        image.get_rendition("width-1600")  # not a standard spec
+
+        missing = get_missing_renditions(CustomImage.objects.all(), ["width-400", "width-800"])
+        assert missing == [(image.pk, ["width-800"])]
+
+    def test_complete_images_are_skipped(self, make_image, django_assert_num_queries):
+        image = make_image()
+        image.get_rendition("width-400")
+
+        with django_assert_num_queries(1):
+            assert get_missing_renditions(CustomImage.objects.all(), ["width-400"]) == []
+
+
+@pytest.mark.django_db
+class TestGenerateRenditionsCommand:
+    def test_generates_every_missing_spec(self, make_image):
+        image = make_image()
+
+        output = _run()
+
+        assert set(image.renditions.values_list("filter_spec", flat=True)) == set(
+            STANDARD_RENDITIONS
+        )
+        assert "images/s" in output
+        assert get_missing_renditions(CustomImage.objects.all(), STANDARD_RENDITIONS) == []
+
+    def test_dry_run_reports_per_spec(self, make_image):
+        make_image()
+
+        output = _run(dry_run=True)
+
+        assert f"Would generate {len(STANDARD_RENDITIONS)} renditions for 1 images" in output
+        assert not CustomImage.objects.get().renditions.exists()
+
+    def test_resumes_from_checkpoint(self, make_image):
+        first = make_image(title="First")
+        second = make_image(title="Second")
+        cache.set(Command()._checkpoint_key(None), first.pk, None)
+
+        output = _run()
+
+        assert f"Resuming after image {first.pk}" in output
+        assert not first.renditions.exists()
+        assert second.renditions.count() == len(STANDARD_RENDITIONS)
+        assert cache.get(Command()._checkpoint_key(None)) is None
+
+    def test_restart_ignores_checkpoint(self, make_image):
+        image = make_image()
+        cache.set(Command()._checkpoint_key(None), image.pk, None)
+
+        _run(restart=True)
+
+        assert image.renditions.count() == len(STANDARD_RENDITIONS)
+
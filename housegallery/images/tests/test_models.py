@@ -4,10 +4,15 @@ import pytest
 from PIL import Image as PILImage
 from unittest.mock import patch, MagicMock
 
-from django.core.files.uploadedfile import SimpleUploadedFile, InMemoryUploadedFile
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models.signals import post_save
 
-from housegallery.images.models import CustomImage, generate_standard_renditions
+from housegallery.images.models import (
+    STANDARD_RENDITION_SPECS,
+    CustomImage,
+    RenditionJob,
+    generate_standard_renditions,
+)
 
 
 def _create_1x1_png():
@@ -51,144 +56,150 @@ class TestCustomImageSave:
         image = make_image(title="My Image", alt="Custom alt")
         assert image.alt == "Custom alt"
 
-    def test_calls_exif_transpose_on_new_upload(self):
+    def test_validates_new_upload(self):
         with patch.object(
-            CustomImage, "_apply_exif_transpose"
-        ) as mock_transpose, patch.object(
-            CustomImage, "_validate_uploaded_image"
-        ):
+            CustomImage, "_validate_uploaded_image", return_value=None,
+        ) as mock_validate:
             png_data = _create_1x1_png()
             uploaded_file = SimpleUploadedFile(
                 name="test.png", content=png_data, content_type="image/png",
             )
             image = CustomImage(title="New Upload", file=uploaded_file)
             image.save()
-            mock_transpose.assert_called_once()
+            mock_validate.assert_called_once()
 
     def test_skips_processing_on_existing_save(self, make_image):
-        image = make_image(title="Existing Image")
+        image = CustomImage.objects.get(pk=make_image(title="Existing Image").pk)
         with patch.object(
-            CustomImage, "_apply_exif_transpose"
-        ) as mock_transpose, patch.object(
             CustomImage, "_validate_uploaded_image"
-        ):
+        ) as mock_validate:
             image.save()
-            mock_transpose.assert_not_called()
+            mock_validate.assert_not_called()
 
 
 @pytest.mark.django_db
-class TestExifTranspose:
-    def test_noop_when_orientation_is_1(self):
-        buf = _create_jpeg_with_orientation(1)
-        uploaded_file = SimpleUploadedFile(
-            "test.jpg", buf.read(), content_type="image/jpeg",
-        )
-        image = CustomImage(title="Test", file=uploaded_file)
-        original_file = image.file
-        image._apply_exif_transpose()
-        # File should remain unchanged — no rotation needed
-        assert image.file is original_file
-
-    def test_noop_when_no_exif(self):
-        png_data = _create_1x1_png()
-        uploaded_file = SimpleUploadedFile(
-            "test.png", png_data, content_type="image/png",
+class TestUploadValidation:
+    def test_rejects_oversized_file(self, settings):
+        settings.WAGTAILIMAGES_MAX_UPLOAD_SIZE = 10
+        image = CustomImage(
+            title="Big", file=SimpleUploadedFile("big.png", _create_1x1_png()),
         )
-        image = CustomImage(title="Test", file=uploaded_file)
-        original_file = image.file
-        image._apply_exif_transpose()
-        # File should remain unchanged — no EXIF orientation tag
-        assert image.file is original_file
-
-    def test_applies_rotation_when_orientation_set(self):
-        buf = _create_jpeg_with_orientation(6)  # 90 deg CW
-        uploaded_file = SimpleUploadedFile(
-            "rotated.jpg", buf.read(), content_type="image/jpeg",
+        with pytest.raises(ValueError, match="too large"):
+            image.save()
+
+    def test_rejects_too_many_pixels(self, settings):
+        settings.WAGTAILIMAGES_MAX_IMAGE_PIXELS = 1000
+        buf = _create_jpeg_with_orientation(1)  # 5000 pixels
+        image = CustomImage(
+            title="Bomb", file=SimpleUploadedFile("bomb.jpg", buf.read()),
         )
-        image = CustomImage(title="Rotated", file=uploaded_file)
-        image._apply_exif_transpose()
-        # File should have been replaced (EXIF orientation removed)
-        image.file.seek(0)
-        result = PILImage.open(image.file)
-        orientation = result.getexif().get(0x0112)
-        assert orientation is None or orientation == 1
-
-    def test_preserves_jpeg_format(self):
+        with pytest.raises(ValueError, match="too many pixels"):
+            image.save()
+
+    def test_rejects_non_image(self):
+        image = CustomImage(title="Text")
+        image.file = MagicMock(size=12, name="notes.jpg")
+        with patch(
+            "housegallery.images.models.read_header", side_effect=OSError("cannot identify"),
+        ), pytest.raises(ValueError, match="Invalid image file"):
+            image._validate_uploaded_image()
+
+    def test_does_not_decode_pixels(self):
         buf = _create_jpeg_with_orientation(6)
-        uploaded_file = SimpleUploadedFile(
-            "test.jpg", buf.read(), content_type="image/jpeg",
+        image = CustomImage(
+            title="Test", file=SimpleUploadedFile("test.jpg", buf.read()),
+        )
+        with patch.object(PILImage.Image, "load") as mock_load:
+            header = image._validate_uploaded_image()
+        mock_load.assert_not_called()
+        assert (header.width, header.height, header.orientation) == (100, 50, 6)
+
+
+@pytest.mark.django_db
+class TestOrientation:
+    def test_original_is_stored_unchanged(self):
+        data = _create_jpeg_with_orientation(6).read()
+        image = CustomImage(
+            title="Rotated", file=SimpleUploadedFile("rotated.jpg", data),
         )
-        image = CustomImage(title="Test", file=uploaded_file)
-        image._apply_exif_transpose()
-        # Verify the result is still a JPEG by reading it with PIL
-        image.file.seek(0)
-        result_img = PILImage.open(image.file)
-        assert result_img.format == "JPEG"
-
-    def test_handles_exception_gracefully(self):
+        image.save()
+
+        with image.open_file() as f:
+            assert f.read() == data
+
+    def test_records_orientation_and_upright_size(self):
+        buf = _create_jpeg_with_orientation(6)  # 90 deg CW, stored 100w x 50h
+        image = CustomImage(
+            title="Rotated", file=SimpleUploadedFile("rotated.jpg", buf.read()),
+        )
+        image.save()
+
+        image.refresh_from_db()
+        assert image.orientation == 6
+        assert (image.width, image.height) == (50, 100)
+
+    def test_upright_image(self):
+        buf = _create_jpeg_with_orientation(1)
+        image = CustomImage(
+            title="Upright", file=SimpleUploadedFile("upright.jpg", buf.read()),
+        )
+        image.save()
+
+        image.refresh_from_db()
+        assert image.orientation == 1
+        assert (image.width, image.height) == (100, 50)
+
+    def test_rendition_is_rotated(self):
         buf = _create_jpeg_with_orientation(6)
-        uploaded_file = SimpleUploadedFile(
-            "test.jpg", buf.read(), content_type="image/jpeg",
+        image = CustomImage(
+            title="Rotated", file=SimpleUploadedFile("rotated.jpg", buf.read()),
         )
-        image = CustomImage(title="Test", file=uploaded_file)
-        original_file = image.file
-        with patch("housegallery.images.models.ImageOps.exif_transpose", side_effect=Exception("boom")):
-            image._apply_exif_transpose()
-        # Should not raise, file should remain unchanged
-        assert image.file is original_file
+        image.save()
+
+        rendition = image.get_rendition("width-20")
+
+        assert (rendition.width, rendition.height) == (20, 40)
 
 
 @pytest.mark.django_db
 class TestGenerateStandardRenditions:
-    def test_generates_renditions_on_create(self, make_image, enable_rendition_signal):
-        with patch.object(
-            CustomImage, "get_rendition", return_value=MagicMock()
-        ) as mock_rendition, patch.object(
-            CustomImage, "get_display_optimized", return_value=MagicMock()
-        ) as mock_display:
-            make_image(title="Signal Test")
-            mock_rendition.assert_called()
-            mock_display.assert_called()
+    def test_queues_renditions_on_create(self, make_image, enable_rendition_signal):
+        with patch.object(CustomImage, "get_rendition") as mock_rendition:
+            image = make_image(title="Signal Test")
+            mock_rendition.assert_not_called()
+        assert image.rendition_jobs.filter(status=RenditionJob.STATUS_PENDING).count() == len(
+            STANDARD_RENDITION_SPECS
+        )
 
     def test_skips_on_update(self, make_image, enable_rendition_signal):
-        with patch.object(
-            CustomImage, "get_rendition", return_value=MagicMock()
-        ) as mock_rendition, patch.object(
-            CustomImage, "get_display_optimized", return_value=MagicMock()
-        ):
-            image = make_image(title="Update Test")
-            mock_rendition.reset_mock()
-            image.title = "Updated Title"
-            image.save()
-            mock_rendition.assert_not_called()
+        image = make_image(title="Update Test")
+        image.rendition_jobs.all().delete()
+        image.title = "Updated Title"
+        image.save()
+        assert not image.rendition_jobs.exists()
 
     def test_handles_failure_gracefully(self, make_image, enable_rendition_signal):
-        with patch.object(
-            CustomImage, "get_rendition", side_effect=Exception("rendition error")
-        ), patch.object(
-            CustomImage, "get_display_optimized", side_effect=Exception("display error")
+        with patch(
+            "housegallery.images.rendition_queue.enqueue_renditions",
+            side_effect=Exception("queue error"),
         ):
-            # Should not raise despite get_rendition failing
+            # Should not raise despite enqueueing failing
             image = make_image(title="Failure Test")
             assert image.pk is not None
 
-    def test_generates_all_expected_specs(self, make_image, enable_rendition_signal):
+    def test_queues_all_expected_specs(self, make_image, enable_rendition_signal):
         expected_specs = {
             "width-400",
             "width-400|format-webp",
             "width-1200",
             "width-1200|format-webp",
+            "width-800",
             "width-800|format-webp",
             "width-1440|format-webp|webpquality-85",
+            "max-2560x2560|format-webp|webpquality-85",
             "fill-300x300|format-webp|webpquality-90",
+            "fill-400x500|format-webp",
         }
-        with patch.object(
-            CustomImage, "get_rendition", return_value=MagicMock()
-        ) as mock_rendition, patch.object(
-            CustomImage, "get_display_optimized", return_value=MagicMock()
-        ):
-            make_image(title="Spec Test")
-            called_specs = {
-                call.args[0] for call in mock_rendition.call_args_list
-            }
-            assert expected_specs.issubset(called_specs)
+        image = make_image(title="Spec Test")
+        queued_specs = set(image.rendition_jobs.values_list("filter_spec", flat=True))
+        assert queued_specs == expected_specs
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+
+from housegallery.images.models import CustomImage
+from housegallery.images.original_cache import CachedOriginalStorage, get_original_cache
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """Filesystem storage standing in for the GCS bucket."""
+    storage = FileSystemStorage(location=tmp_path / "bucket")
+    for name, size in (("a.jpg", 100), ("b.jpg", 100), ("c.jpg", 100), ("big.jpg", 1000)):
+        storage.save(name, ContentFile(name.encode() * (size // len(name) + 1)))
+    return storage
+
+
+def _read(cache, name, version=""):
+    with cache.open(name, version=version) as f:
+        return f.read()
+
+
+def _age(cache, seconds):
+    """Make every cached file look ``seconds`` older."""
+    for entry in os.scandir(cache.cache_dir):
+        mtime = entry.stat().st_mtime - seconds
+        os.utime(entry.path, (mtime, mtime))
+
+
+class TestCachedOriginalStorage:
+    def test_downloads_once(self, remote, tmp_path):
+        cache = CachedOriginalStorage(remote, tmp_path / "cache", max_bytes=10_000)
+
+        first = _read(cache, "a.jpg")
+        second = _read(cache, "a.jpg")
+
+        with remote.open("a.jpg") as f:
+            assert first == second == f.read()
+        stats = cache.stats()
+        assert (stats["misses"], stats["hits"], stats["entries"]) == (1, 1, 1)
+
+    def test_new_version_is_downloaded_again(self, remote, tmp_path):
+        cache = CachedOriginalStorage(remote, tmp_path / "cache", max_bytes=10_000)
+        _read(cache, "a.jpg", version="v1")
+
+        remote.delete("a.jpg")
+        remote.save("a.jpg", ContentFile(b"replacement"))
+
+        assert _read(cache, "a.jpg", version="v2") == b"replacement"
+        assert cache.stats()["misses"] == 2
+
+    def test_evicts_least_recently_used(self, remote, tmp_path):
+        cache = CachedOriginalStorage(remote, tmp_path / "cache", max_bytes=250)
+        _read(cache, "a.jpg")
+        _age(cache, 20)
+        _read(cache, "b.jpg")
+        _age(cache, 10)
+        _read(cache, "a.jpg")  # a is now more recent than b
+
+        _read(cache, "c.jpg")
+
+        _read(cache, "a.jpg")
+        _read(cache, "b.jpg")
+        stats = cache.stats()
+        assert stats["evictions"] >= 1
+        assert stats["hits"] == 2  # a twice; b was evicted and fetched again
+        assert stats["bytes"] <= 250
+
+    def test_file_larger_than_cap_is_not_kept(self, remote, tmp_path):
+        cache = CachedOriginalStorage(remote, tmp_path / "cache", max_bytes=250)
+
+        with remote.open("big.jpg") as f:
+            assert _read(cache, "big.jpg") == f.read()
+        stats = cache.stats()
+        assert stats["uncacheable"] == 1
+        assert stats["entries"] == 0
+
+    def test_other_methods_reach_the_storage(self, remote, tmp_path):
+        cache = CachedOriginalStorage(remote, tmp_path / "cache", max_bytes=250)
+
+        assert cache.exists("a.jpg")
+        assert cache.url("a.jpg") == remote.url("a.jpg")
+
+
+@pytest.mark.django_db
+class TestCustomImageOpenFile:
+    @pytest.fixture
+    def original_cache(self, settings, tmp_path):
+        settings.IMAGES_ORIGINAL_CACHE_DIR = str(tmp_path / "originals")
+        settings.IMAGES_ORIGINAL_CACHE_MAX_BYTES = 10_000_000
+        return get_original_cache(CustomImage._meta.get_field("file").storage)
+
+    def test_renditions_share_one_download(self, make_image, original_cache):
+        image = make_image()
+        image._set_file_hash()
+        image.save()
+        image = CustomImage.objects.get(pk=image.pk)
+
+        image.get_rendition("width-10")
+        image.get_rendition("width-20")
+
+        stats = original_cache.stats()
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+
+    def test_disabled_by_default(self, make_image):
+        assert get_original_cache(CustomImage._meta.get_field("file").storage) is None
@@ -0,0 +1,99 @@
+import base64
+import io
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image as PILImage
+
+from housegallery.core.image_utils import get_image_urls
+from housegallery.images.models import CustomImage
+from housegallery.images.placeholders import PLACEHOLDER_SIZE, compute_placeholder
+
+
+def _image_file(size=(640, 480), color=(200, 30, 30), fmt="JPEG", mode="RGB"):
+    buf = io.BytesIO()
+    PILImage.new(mode, size, color=color).save(buf, format=fmt)
+    buf.seek(0)
+    return buf
+
+
+def _decode(data_uri):
+    header, encoded = data_uri.split(",", 1)
+    assert header == "data:image/webp;base64"
+    return PILImage.open(io.BytesIO(base64.b64decode(encoded)))
+
+
+class TestComputePlaceholder:
+    def test_tiny_webp_with_aspect_ratio(self):
+        placeholder, _color = compute_placeholder(_image_file(size=(640, 480)))
+
+        with _decode(placeholder) as image:
+            assert image.format == "WEBP"
+            assert image.size == (PLACEHOLDER_SIZE, 12)
+        assert len(placeholder) < 500
+
+    def test_dominant_color(self):
+        _placeholder, color = compute_placeholder(_image_file(color=(200, 30, 30), fmt="PNG"))
+
+        assert color == "#c81e1e"
+
+    def test_transparency_is_flattened_onto_white(self):
+        _placeholder, color = compute_placeholder(
+            _image_file(color=(0, 0, 0, 0), fmt="PNG", mode="RGBA"),
+        )
+
+        assert color == "#ffffff"
+
+
+@pytest.mark.django_db
+class TestCustomImagePlaceholder:
+    def test_computed_on_upload(self):
+        image = CustomImage(
+            title="Upload",
+            file=SimpleUploadedFile("upload.jpg", _image_file().getvalue()),
+        )
+        image.save()
+
+        image.refresh_from_db()
+        assert image.placeholder.startswith("data:image/webp;base64,")
+        assert image.dominant_color.startswith("#")
+
+    def test_not_recomputed_on_metadata_edit(self, make_image):
+        image = CustomImage.objects.get(pk=make_image().pk)
+
+        with patch("housegallery.images.models.open_reduced") as decode:
+            image.title = "Renamed"
+            image.save()
+
+        decode.assert_not_called()
+
+    def test_exposed_by_get_image_urls(self, make_image):
+        image = make_image()
+
+        urls = get_image_urls(image, specs={})
+
+        assert urls["placeholder"] == image.placeholder
+        assert urls["dominant_color"] == image.dominant_color == "#ff0000"
+
+
+@pytest.mark.django_db
+class TestBackfillCommand:
+    def test_fills_missing_placeholders(self, make_image):
+        image = make_image()
+        CustomImage.objects.filter(pk=image.pk).update(placeholder="", dominant_color="")
+
+        call_command("backfill_image_placeholders", stdout=io.StringIO())
+
+        image.refresh_from_db()
+        assert image.placeholder.startswith("data:image/webp;base64,")
+        assert image.dominant_color == "#ff0000"
+
+    def test_skips_images_that_have_one(self, make_image):
+        make_image()
+        out = io.StringIO()
+
+        call_command("backfill_image_placeholders", stdout=out)
+
+        assert "All images have placeholders" in out.getvalue()
@@ -0,0 +1,118 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image as PILImage
+from PIL.JpegImagePlugin import JpegImageFile
+
+from housegallery.images.models import CustomImage
+from housegallery.images.rendition_pipeline import generate_renditions
+
+
+def _make_jpeg_image(size=(1600, 1200), title="Large JPEG"):
+    buf = io.BytesIO()
+    PILImage.new("RGB", size, color="blue").save(buf, format="JPEG")
+    image = CustomImage(
+        title=title,
+        file=SimpleUploadedFile("large.jpg", buf.getvalue(), content_type="image/jpeg"),
+    )
+    image.save()
+    return image
+
+
+@pytest.mark.django_db
+class TestGenerateRenditions:
+    def test_matches_wagtail_sizes_and_formats(self):
+        image = _make_jpeg_image()
+        reference = _make_jpeg_image(title="Reference")
+        specs = [
+            "width-400",
+            "width-800|format-webp",
+            "fill-300x300|format-webp|webpquality-90",
+            "max-2560x2560|format-webp|webpquality-85",
+        ]
+
+        renditions, errors = generate_renditions(image, specs)
+
+        assert errors == {}
+        for spec in specs:
+            expected = reference.get_rendition(spec)
+            assert (renditions[spec].width, renditions[spec].height) == (
+                expected.width, expected.height,
+            )
+            assert renditions[spec].file.name.rsplit(".", 1)[1] == (
+                expected.file.name.rsplit(".", 1)[1]
+            )
+        assert image.renditions.count() == len(specs)
+
+    def test_opens_original_once(self):
+        image = _make_jpeg_image()
+
+        with patch.object(CustomImage, "open_file", autospec=True,
+                          side_effect=CustomImage.open_file) as open_file:
+            generate_renditions(image, ["width-400", "width-800", "width-1200"])
+
+        assert open_file.call_count == 1
+
+    def test_uses_reduced_jpeg_decoding(self):
+        image = _make_jpeg_image(size=(3200, 2400))
+
+        with patch.object(JpegImageFile, "draft", autospec=True,
+                          side_effect=JpegImageFile.draft) as draft:
+            renditions, _errors = generate_renditions(image, ["width-800", "width-400"])
+
+        # Largest output is a quarter of the original, so it is decoded at 1/4
+        assert draft.call_args.args[2] == (800, 600)
+        assert renditions["width-400"].width == 400
+
+    def test_reuses_existing_and_reports_invalid_specs(self):
+        image = _make_jpeg_image()
+        existing = image.get_rendition("width-400")
+
+        renditions, errors = generate_renditions(image, ["width-400", "not-a-spec"])
+
+        assert renditions["width-400"].pk == existing.pk
+        assert list(errors) == ["not-a-spec"]
+        assert image.renditions.count() == 1
+
+    def test_returns_stored_renditions(self):
+        image = _make_jpeg_image()
+
+        renditions, _errors = generate_renditions(image, ["width-400", "width-800"])
+
+        assert all(rendition.pk for rendition in renditions.values())
+        assert {r.pk for r in renditions.values()} == set(image.renditions.values_list("pk", flat=True))
+
+    def test_lost_race_returns_winner_and_deletes_own_file(self):
+        from django.core.files.base import ContentFile
+
+        image = _make_jpeg_image()
+        Rendition = image.get_rendition_model()
+        bulk_create = Rendition.objects.bulk_create
+        created = []
+
+        buf = io.BytesIO()
+        PILImage.new("RGB", (400, 300), color="red").save(buf, format="JPEG")
+
+        def other_worker_first(objs, **kwargs):
+            # Another worker stores the same rendition just before this insert
+            Rendition.objects.create(
+                image=image,
+                filter_spec=objs[0].filter_spec,
+                focal_point_key=objs[0].focal_point_key,
+                file=ContentFile(buf.getvalue(), name="winner.jpg"),
+            )
+            result = bulk_create(objs, **kwargs)
+            created.extend(rendition.file.name for rendition in objs)
+            return result
+
+        with patch.object(Rendition.objects, "bulk_create", side_effect=other_worker_first):
+            renditions, _errors = generate_renditions(image, ["width-400"])
+
+        stored = image.renditions.get(filter_spec="width-400")
+        assert renditions["width-400"].pk == stored.pk
+        assert renditions["width-400"].file.name == stored.file.name
+        assert created[0] != stored.file.name
+        assert not stored.file.storage.exists(created[0])
+        assert stored.file.storage.exists(stored.file.name)
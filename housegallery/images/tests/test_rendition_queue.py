@@ -0,0 +1,105 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from housegallery.core.image_utils import get_rendition_data
+from housegallery.images import rendition_queue
+from housegallery.images.models import RenditionJob
+from housegallery.images.rendition_queue import (
+    claim_jobs,
+    enqueue_missing_renditions,
+    enqueue_renditions,
+    process_jobs,
+)
+
+
+@pytest.mark.django_db
+class TestRenditionQueue:
+    def test_enqueue_is_idempotent(self, make_image):
+        image = make_image()
+
+        assert enqueue_renditions(image, ["width-400", "width-800"]) == 2
+        assert enqueue_renditions(image, ["width-400", "width-800"]) == 0
+        assert image.rendition_jobs.count() == 2
+
+    def test_enqueue_requeues_finished_jobs(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["width-400"])
+        image.rendition_jobs.update(status=RenditionJob.STATUS_DONE, attempts=1)
+
+        enqueue_renditions(image, ["width-400"])
+        job = image.rendition_jobs.get()
+        assert (job.status, job.attempts) == (RenditionJob.STATUS_PENDING, 0)
+
+    def test_enqueue_missing_skips_existing_renditions(self, make_image):
+        from housegallery.images.models import CustomImage
+
+        built, finished, new = make_image(), make_image(), make_image()
+        built.get_rendition("width-640")
+        enqueue_renditions(finished, ["width-640"])
+        finished.rendition_jobs.update(status=RenditionJob.STATUS_DONE, attempts=1)
+
+        queued = enqueue_missing_renditions(
+            CustomImage.objects.filter(pk__in=[built.pk, finished.pk, new.pk]), "width-640",
+        )
+
+        assert queued == 2
+        jobs = RenditionJob.objects.filter(filter_spec="width-640")
+        assert {job.image_id for job in jobs} == {finished.pk, new.pk}
+        assert {job.status for job in jobs} == {RenditionJob.STATUS_PENDING}
+
+    def test_claimed_jobs_are_not_handed_out_twice(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["width-400", "width-800"])
+
+        first = claim_jobs(1)
+        second = claim_jobs(5)
+        assert len(first) == 1
+        assert [job.pk for job in second] != [job.pk for job in first]
+        assert len(second) == 1
+        assert claim_jobs(5) == []
+
+    def test_process_generates_renditions(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["width-400"])
+
+        with patch.object(rendition_queue, "invalidate_dependents") as invalidate:
+            assert process_jobs(10) == (1, 0)
+
+        assert image.renditions.filter(filter_spec="width-400").exists()
+        assert image.rendition_jobs.get().status == RenditionJob.STATUS_DONE
+        invalidate.assert_called_once_with("image", [image.pk])
+
+    def test_failed_job_is_retried_then_given_up(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["not-a-spec"])
+
+        for _ in range(rendition_queue.MAX_ATTEMPTS - 1):
+            assert process_jobs(10) == (0, 1)
+            assert image.rendition_jobs.get().status == RenditionJob.STATUS_PENDING
+
+        assert process_jobs(10) == (0, 1)
+        job = image.rendition_jobs.get()
+        assert job.status == RenditionJob.STATUS_FAILED
+        assert job.last_error
+        assert process_jobs(10) == (0, 0)
+
+    def test_worker_command_drains_queue(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["width-400", "fill-300x300|format-webp|webpquality-90"])
+        out = StringIO()
+
+        call_command("process_rendition_jobs", once=True, stdout=out)
+
+        assert "2 renditions created" in out.getvalue()
+        assert image.renditions.count() == 2
+
+    def test_queued_rendition_falls_back_to_original(self, make_image):
+        image = make_image()
+        enqueue_renditions(image, ["width-400"])
+
+        data = get_rendition_data(image, "width-400")
+        assert data["url"] == image.file.url
+        assert not image.renditions.exists()
@@ -0,0 +1,78 @@
+import re
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+from housegallery.core.image_utils import get_image_urls
+from housegallery.images.management.commands.rendition_coverage import get_rendition_coverage
+from housegallery.images.models import STANDARD_RENDITION_SPECS
+from housegallery.images.renditions import (
+    IMAGE_URL_PROFILES,
+    RENDITION_PROFILES,
+    profile_spec,
+    profile_specs,
+)
+
+
+class TestRenditionProfiles:
+    def test_every_profile_is_pre_generated(self):
+        assert set(STANDARD_RENDITION_SPECS) == set(RENDITION_PROFILES.values())
+
+    def test_image_url_defaults_use_profiles(self):
+        assert set(profile_specs(IMAGE_URL_PROFILES).values()) <= set(STANDARD_RENDITION_SPECS)
+
+    def test_templates_only_request_registered_specs(self):
+        # {% image %} tags outside the admin must use pre-generated specs;
+        # prefer {% rendition %} with a profile name
+        tag = re.compile(r"{%\s*image\s+\S+\s+(.*?)(?:\s+as\s+\w+)?\s*%}")
+        templates = Path(settings.BASE_DIR) / "housegallery" / "templates"
+        unregistered = {
+            f"{path.relative_to(templates)}: {spec}"
+            for path in templates.rglob("*.html")
+            if "wagtailimages" not in path.parts
+            for match in tag.finditer(path.read_text())
+            for spec in ["|".join(match.group(1).split())]
+            if spec not in RENDITION_PROFILES.values()
+        }
+        assert not unregistered
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(KeyError):
+            profile_spec("nope")
+
+
+@pytest.mark.django_db
+class TestRenditionCoverage:
+    def test_counts_per_profile(self, make_image, django_assert_num_queries):
+        complete = make_image(title="Complete")
+        make_image(title="Bare")
+        complete.get_rendition(profile_spec("thumb"))
+
+        with django_assert_num_queries(1):
+            total, counts = get_rendition_coverage()
+
+        assert total == 2
+        assert counts["thumb"] == 1
+        assert counts["display"] == 0
+
+    def test_command_reports_missing(self, make_image):
+        make_image()
+        out = StringIO()
+
+        call_command("rendition_coverage", stdout=out)
+
+        output = out.getvalue()
+        assert profile_spec("web_optimized") in output
+        assert "generate_renditions" in output
+
+    def test_default_image_urls_hit_pre_generated_renditions(self, make_image):
+        image = make_image()
+        call_command("generate_renditions", stdout=StringIO())
+
+        urls = get_image_urls(image)
+
+        assert urls["thumb_url"] and urls["medium_url"] and urls["full_url"]
+        assert image.renditions.count() == len(RENDITION_PROFILES)
@@ -0,0 +1,180 @@
+import io
+import json
+import random
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from PIL import Image as PILImage
+from PIL import ImageDraw
+
+from housegallery.images.models import CustomImage
+from housegallery.images.similarity import (
+    dhash,
+    find_similar_clusters,
+    find_similar_images,
+    format_hash,
+    hamming,
+    hash_bands,
+    is_low_detail,
+)
+
+
+def _photo(seed=1, size=(800, 600)):
+    """A busy picture, so different seeds give clearly different hashes."""
+    rng = random.Random(seed)
+    image = PILImage.new("RGB", size, (128, 128, 128))
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x0, y0 = rng.randrange(size[0]), rng.randrange(size[1])
+        x1, y1 = x0 + rng.randrange(50, 300), y0 + rng.randrange(50, 300)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.rectangle((x0, y0, x1, y1), fill=color)
+    return image
+
+
+def _encode(image, fmt="JPEG", **params):
+    buf = io.BytesIO()
+    image.save(buf, format=fmt, **params)
+    return buf.getvalue()
+
+
+def _upload(image, title="Upload", name="upload.jpg", **params):
+    instance = CustomImage(
+        title=title,
+        file=SimpleUploadedFile(name, _encode(image, **params)),
+    )
+    instance.save()
+    return instance
+
+
+class TestDhash:
+    def test_stable_under_resize_and_reencode(self):
+        original = _photo()
+        copy = original.resize((400, 300))
+        reencoded = PILImage.open(io.BytesIO(_encode(copy, quality=60)))
+
+        assert hamming(dhash(original), dhash(reencoded)) <= 3
+
+    def test_different_pictures_are_far_apart(self):
+        assert hamming(dhash(_photo(seed=1)), dhash(_photo(seed=2))) > 10
+
+    def test_bands_cover_every_bit(self):
+        value = 0x0123456789ABCDEF
+
+        assert hash_bands(value) == [0x0123, 0x4567, 0x89AB, 0xCDEF]
+
+
+class TestFindSimilarClusters:
+    def test_groups_transitively(self):
+        base = 0x0F0F_3C3C_5A5A_A5A5
+        rows = [
+            (1, format_hash(base)),
+            (2, format_hash(base ^ 0b0011)),
+            (3, format_hash(base ^ 0b1111)),
+            (4, format_hash(base ^ 0xFFFF_FFFF_0000_0000)),
+        ]
+
+        assert find_similar_clusters(rows, max_distance=2) == [[1, 2, 3]]
+
+    def test_ignores_missing_hashes(self):
+        assert find_similar_clusters([(1, ""), (2, "")]) == []
+
+    def test_ignores_low_detail_hashes(self):
+        rows = [(1, format_hash(0)), (2, format_hash(0b0011)), (3, format_hash(2**64 - 1))]
+
+        assert find_similar_clusters(rows) == []
+
+
+@pytest.mark.django_db
+class TestFindSimilarImages:
+    def test_finds_reexported_copy(self):
+        original = _upload(_photo(seed=1), title="Original")
+        _upload(_photo(seed=2), title="Other")
+        copy = _upload(_photo(seed=1).resize((640, 480)), title="Copy", quality=70)
+
+        matches = find_similar_images(copy)
+
+        assert [image.pk for image, _distance in matches] == [original.pk]
+
+    def test_flat_pictures_do_not_match(self):
+        white = _upload(PILImage.new("RGB", (800, 600), "white"), title="White")
+        black = _upload(PILImage.new("RGB", (800, 600), "black"), title="Black")
+
+        assert white.perceptual_hash == black.perceptual_hash
+        assert is_low_detail(int(black.perceptual_hash, 16))
+        assert find_similar_images(black) == []
+
+    def test_candidates_are_capped(self, make_image, monkeypatch):
+        monkeypatch.setattr("housegallery.images.similarity.MAX_CANDIDATES", 2)
+        value = dhash(_photo(seed=1))
+        images = []
+        for title in ("A", "B", "C", "D"):
+            image = make_image(title=title)
+            image.set_perceptual_hash(value)
+            image.save()
+            images.append(image)
+
+        matches = find_similar_images(images[0])
+
+        assert [image.pk for image, _distance in matches] == [images[2].pk, images[3].pk]
+
+    def test_unhashed_image_has_no_matches(self, make_image):
+        image = make_image()
+        image.perceptual_hash = ""
+
+        assert find_similar_images(image) == []
+
+
+@pytest.mark.django_db
+class TestReportCommand:
+    def test_reports_groups(self):
+        original = _upload(_photo(seed=1), title="Original")
+        _upload(_photo(seed=1).resize((400, 300)), title="Small copy", name="copy.png", fmt="PNG")
+        out = io.StringIO()
+
+        call_command("report_similar_images", stdout=out)
+
+        output = out.getvalue()
+        assert "Found 1 groups" in output
+        assert f'Suggested keeper: #{original.pk} "Original"' in output
+
+    def test_no_duplicates(self):
+        _upload(_photo(seed=1))
+        _upload(_photo(seed=2))
+        out = io.StringIO()
+
+        call_command("report_similar_images", stdout=out)
+
+        assert "No near-duplicate images found." in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestMultipleUploadPrompt:
+    def test_near_duplicate_offers_existing_image(self, admin_client):
+        existing = _upload(_photo(seed=1), title="Existing")
+
+        response = admin_client.post(
+            reverse("wagtailimages:add_multiple"),
+            {
+                "files[]": SimpleUploadedFile(
+                    "resized.jpg", _encode(_photo(seed=1).resize((400, 300)), quality=70),
+                ),
+            },
+        )
+
+        data = json.loads(response.content)
+        assert data["success"]
+        assert data["duplicate"]
+        assert existing.title in data["confirm_duplicate_upload"]
+
+    def test_unrelated_upload_is_not_flagged(self, admin_client):
+        _upload(_photo(seed=1))
+
+        response = admin_client.post(
+            reverse("wagtailimages:add_multiple"),
+            {"files[]": SimpleUploadedFile("other.jpg", _encode(_photo(seed=2)))},
+        )
+
+        assert not json.loads(response.content)["duplicate"]
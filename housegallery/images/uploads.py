@@ -0,0 +1,86 @@
+"""Header-only inspection of uploaded originals.
+
+Validating an upload used to decode it twice and, for rotated photos,
+re-encode the whole original at quality 95 just to bake the EXIF
+orientation into the pixels. ``read_header`` instead parses only the file
+header: format, stored size and orientation, which is enough to reject
+files that would decode to more than ``WAGTAILIMAGES_MAX_IMAGE_PIXELS``
+(decompression bombs) before any pixel data is touched.
+
+The original is then stored exactly as uploaded. Its orientation is kept
+on the image so ``width``/``height`` describe the upright picture, and
+renditions are rotated as they are generated.
+"""
+
+from typing import NamedTuple
+
+from django.conf import settings
+from PIL import Image as PILImage
+
+ORIENTATION_TAG = 0x0112
+
+# EXIF orientations that swap width and height (90 or 270 degree turns)
+ROTATED_ORIENTATIONS = (5, 6, 7, 8)
+
+# Wagtail's own default for WAGTAILIMAGES_MAX_IMAGE_PIXELS
+DEFAULT_MAX_IMAGE_PIXELS = 128_000_000
+
+
+class ImageHeader(NamedTuple):
+    format: str
+    width: int
+    height: int
+    orientation: int
+
+    @property
+    def upright_size(self):
+        """``(width, height)`` as displayed, after EXIF orientation."""
+        return upright_size((self.width, self.height), self.orientation)
+
+
+def upright_size(size, orientation):
+    width, height = size
+    if orientation in ROTATED_ORIENTATIONS:
+        return height, width
+    return width, height
+
+
+def exif_orientation(image):
+    """Return the EXIF orientation (1-8) of an opened, undecoded image."""
+    if image.format == "PNG" and "exif" not in image.info:
+        # PngImageFile.getexif() decodes the whole image looking for a
+        # trailing eXIf chunk; photos carrying a rotation are not PNGs
+        return 1
+    orientation = image.getexif().get(ORIENTATION_TAG, 1)
+    return orientation if orientation in range(1, 9) else 1
+
+
+def max_image_pixels():
+    return getattr(settings, "WAGTAILIMAGES_MAX_IMAGE_PIXELS", DEFAULT_MAX_IMAGE_PIXELS)
+
+
+def read_header(file):
+    """Return the ``ImageHeader`` of an image file without decoding it.
+
+    Raises ``ValueError`` if the image has more pixels than allowed, and
+    whatever Pillow raises (an ``OSError``) if the file is not an image.
+    """
+    file.seek(0)
+    try:
+        with PILImage.open(file) as image:
+            header = ImageHeader(
+                image.format or "", image.width, image.height, exif_orientation(image),
+            )
+    except PILImage.DecompressionBombError as e:
+        raise ValueError(f"Image has too many pixels: {e}") from e
+    finally:
+        file.seek(0)
+
+    limit = max_image_pixels()
+    if header.width * header.height > limit:
+        msg = (
+            f"Image has too many pixels ({header.width}x{header.height}). "
+            f"Maximum is {limit / 1_000_000:.0f} megapixels"
+        )
+        raise ValueError(msg)
+    return header
@@ -3,6 +3,8 @@ from wagtail.images.views.multiple import (
     CreateFromUploadedImageView as BaseCreateFromUploadedImageView,
 )
 
+from .similarity import find_similar_images
+
 
 class CustomAddView(BaseAddView):
     """
@@ -28,6 +30,28 @@ class CustomAddView(BaseAddView):
         # Continue with the standard multi-upload flow
         return super().post(request, *args, **kwargs)
 
+    def get_edit_object_response_data(self):
+        """
+        Offer to reuse an existing image when the upload is a near-duplicate
+        (a resized or re-exported copy), not only when the file is identical.
+        """
+        data = super().get_edit_object_response_data()
+        if not data.get("duplicate"):
+            similar = find_similar_images(
+                self.object,
+                self.permission_policy.instances_user_has_permission_for(
+                    self.request.user, "choose",
+                ),
+            )
+            if similar:
+                data.update(
+                    duplicate=True,
+                    confirm_duplicate_upload=self.get_confirm_duplicate_upload_response(
+                        [image for image, _distance in similar],
+                    ),
+                )
+        return data
+
     def save_object(self, form):
         """
         Override save_object to apply the batch preferences (title, alt_text,
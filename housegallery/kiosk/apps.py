@@ -5,3 +5,7 @@ class KioskConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "housegallery.kiosk"
     label = "kiosk"
+
+    def ready(self):
+        # Import signals to register handlers
+        from . import signals  # noqa: F401
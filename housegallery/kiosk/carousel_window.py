@@ -0,0 +1,86 @@
+"""Windowed carousels for kiosks showing large image sets.
+
+A kiosk with ``tagged_set`` or ``all_images`` blocks and a window size
+does not build a carousel item for every image. Displays fetch the images
+a page at a time from /display/<slug>/images.json, following a cursor.
+
+The images are ordered by ``(id * multiplier + offset) % ORDER_MODULUS``.
+The modulus is prime and larger than any image id, so this is a
+one-to-one mapping of ids. Following the key upwards visits every image
+exactly once per cycle. The multiplier and offset are drawn from a seed
+that includes the cycle number, so each pass through the library comes in
+a different order. The key is computed in SQL, so a page is one
+``WHERE key > last ORDER BY key LIMIT n`` query. Images added mid-cycle
+are picked up if their key is still ahead of the cursor; deleted ones
+are skipped.
+"""
+
+import random
+
+from django.db.models import BigIntegerField
+from django.db.models import Value
+from django.db.models.functions import Cast
+from django.db.models.functions import Mod
+
+# Prime above any image id (and the largest 32-bit id), so the ordering
+# maps ids one-to-one
+ORDER_MODULUS = 2_147_483_647
+
+
+def ordering(seed):
+    """``(multiplier, offset)`` of the image ordering for ``seed``."""
+    rng = random.Random(seed)
+    return rng.randrange(1, ORDER_MODULUS), rng.randrange(ORDER_MODULUS)
+
+
+def order_key(seed):
+    """Expression giving each image's position in the ordering for ``seed``."""
+    multiplier, offset = ordering(seed)
+    return Mod(
+        Cast("pk", BigIntegerField()) * Value(multiplier, output_field=BigIntegerField())
+        + Value(offset, output_field=BigIntegerField()),
+        Value(ORDER_MODULUS, output_field=BigIntegerField()),
+        output_field=BigIntegerField(),
+    )
+
+
+def encode_cursor(cycle, after):
+    return f"{cycle}.{after}"
+
+
+def decode_cursor(cursor):
+    """Return ``(cycle, key of the last image shown)`` for a cursor.
+
+    An empty cursor starts the first cycle. Raises ``ValueError`` for
+    anything that is not a cursor from ``encode_cursor``.
+    """
+    if not cursor:
+        return 0, -1
+    cycle, _, after = cursor.partition(".")
+    cycle, after = int(cycle), int(after)
+    if cycle < 0 or not -1 <= after < ORDER_MODULUS:
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return cycle, after
+
+
+def window_page(queryset, seed, cursor, size):
+    """Return ``(images, next cursor)`` for one page of ``queryset``.
+
+    The last page of a cycle may be short; the cursor after it starts the
+    next cycle, in a new order. A cursor at the very end of a cycle (when
+    the image count is a multiple of ``size``, or the rest of the cycle
+    was deleted) gets the first page of the next cycle rather than an
+    empty one. Only an empty ``queryset`` gives an empty page.
+    """
+    cycle, after = decode_cursor(cursor)
+    images = list(
+        queryset
+        .annotate(window_key=order_key(f"{seed}:{cycle}"))
+        .filter(window_key__gt=after)
+        .order_by("window_key")[:size]
+    )
+    if not images and after != -1:
+        return window_page(queryset, seed, encode_cursor(cycle + 1, -1), size)
+    if len(images) < size:
+        return images, encode_cursor(cycle + 1, -1)
+    return images, encode_cursor(cycle, images[-1].window_key)
@@ -0,0 +1,157 @@
+"""Push notifications telling kiosk displays to refetch their manifest.
+
+Each display keeps one server-sent events connection open at
+/display/<slug>/events instead of polling manifest.json. ``KioskEventHub``
+is the per-process pub/sub behind those connections: subscribers get an
+``asyncio.Queue`` for a kiosk slug and receive the kiosk's new manifest
+ETag whenever it changes.
+
+The ETag is already stored in the database (the kiosk's publish time and
+content version, see ``manifest_etag``), so the database is the channel
+between processes: while anyone is subscribed, the hub reads the ETags of
+the subscribed kiosks in one query every ``POLL_INTERVAL`` seconds, no
+matter how many screens are connected. Publishes in the same process call
+``notify()`` after commit, which wakes the hub straight away.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+
+# Seconds between checks for changes made by other processes
+POLL_INTERVAL = 2
+
+# Seconds between comments that keep idle connections from being dropped
+KEEPALIVE_INTERVAL = 25
+
+# Milliseconds a disconnected display waits before reconnecting
+RECONNECT_DELAY = 5000
+
+
+def live_manifest_etags(slugs):
+    """``{slug: manifest ETag}`` of the live kiosks among ``slugs``."""
+    from .models import KioskPage, manifest_etag
+
+    rows = (
+        KioskPage.objects.live()
+        .filter(slug__in=slugs)
+        .values_list("slug", "pk", "last_published_at", "content_version")
+    )
+    return {slug: manifest_etag(*row) for slug, *row in rows}
+
+
+class KioskEventHub:
+    """Fan out kiosk manifest changes to the subscribers in this process.
+
+    Runs on the event loop of the first subscriber and stops checking when
+    the last one unsubscribes.
+    """
+
+    def __init__(self, poll_interval=POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._queues = defaultdict(set)
+        self._etags = {}
+        self._loop = None
+        self._wake = None
+        self._task = None
+
+    def subscribe(self, slug):
+        """Return a queue receiving each new ETag of ``slug``.
+
+        ``None`` is sent when the kiosk is unpublished or deleted.
+        """
+        queue = asyncio.Queue()
+        self._queues[slug].add(queue)
+        self._start()
+        return queue
+
+    def unsubscribe(self, slug, queue):
+        queues = self._queues.get(slug)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[slug]
+            self._etags.pop(slug, None)
+
+    def notify(self):
+        """Check for changes now. Safe to call from any thread."""
+        loop, wake = self._loop, self._wake
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # The loop closed in the meantime
+            pass
+
+    async def check(self):
+        """Send the current ETag to subscribers of kiosks whose ETag changed."""
+        slugs = list(self._queues)
+        if not slugs:
+            return
+        etags = await sync_to_async(live_manifest_etags)(slugs)
+        for slug in slugs:
+            etag = etags.get(slug)
+            if slug in self._etags and self._etags[slug] == etag:
+                continue
+            self._etags[slug] = etag
+            for queue in self._queues.get(slug, ()):
+                queue.put_nowait(etag)
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while self._queues:
+            self._wake.clear()
+            try:
+                await self.check()
+            except Exception:
+                # A failed check is retried on the next tick
+                pass
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+hub = KioskEventHub()
+
+
+def format_event(event, data):
+    """One server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def kiosk_event_stream(slug, etag, events=None):
+    """Server-sent events for one display of the kiosk ``slug``.
+
+    Starts with the current ``etag``, then sends a ``manifest`` event for
+    each change, or an ``unpublished`` event and ends if the kiosk goes
+    away.
+    """
+    events = events or hub
+    yield f"retry: {RECONNECT_DELAY}\n" + format_event("manifest", {"etag": etag})
+
+    queue = events.subscribe(slug)
+    try:
+        while True:
+            try:
+                etag = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if etag is None:
+                yield format_event("unpublished", {})
+                return
+            yield format_event("manifest", {"etag": etag})
+    finally:
+        events.unsubscribe(slug, queue)
@@ -0,0 +1,99 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from PIL import Image as PILImage
+
+from housegallery.kiosk.models import KioskPage
+
+
+def decode(data):
+    """Return ``((width, height), seconds)`` to fully decode encoded ``data``."""
+    start = time.perf_counter()
+    with PILImage.open(io.BytesIO(data)) as image:
+        image.load()
+        size = image.size
+    return size, time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = "Compare a kiosk's full-size slides at its screen size against the originals"
+
+    def add_arguments(self, parser):
+        parser.add_argument('slug', help='Slug of the kiosk page')
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=20,
+            help='Number of slide images to measure (default: 20, most recent first)',
+        )
+        parser.add_argument(
+            '--generate',
+            action='store_true',
+            help='Build missing screen renditions instead of skipping those images',
+        )
+
+    def handle(self, *args, **options):
+        page = KioskPage.objects.filter(slug=options['slug']).first()
+        if page is None:
+            raise CommandError(f'No kiosk with slug {options["slug"]!r}')
+        spec = page.screen_spec
+        rendition_model = page.get_slide_images().model.get_rendition_model()
+
+        images = (
+            page.get_slide_images().exclude(file__iendswith='.svg')
+            .order_by('-pk')[:options['sample']]
+        )
+
+        # [bytes, decode seconds, decoded pixels] for originals and renditions
+        original = [0, 0.0, 0]
+        screen = [0, 0.0, 0]
+        measured = missing = 0
+        for image in images:
+            if options['generate']:
+                rendition = image.get_rendition(spec)
+            else:
+                rendition = rendition_model.objects.filter(image=image, filter_spec=spec).first()
+                if rendition is None:
+                    missing += 1
+                    continue
+            try:
+                with image.open_file() as f:
+                    original_data = f.read()
+                with rendition.file.open('rb') as f:
+                    screen_data = f.read()
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Skipping image {image.pk}: {e}'))
+                continue
+            measured += 1
+
+            for total, data in ((original, original_data), (screen, screen_data)):
+                (width, height), seconds = decode(data)
+                total[0] += len(data)
+                total[1] += seconds
+                total[2] += width * height
+
+        if missing:
+            self.stdout.write(self.style.WARNING(
+                f'{missing} images have no {spec} rendition yet; run '
+                f'process_rendition_jobs or pass --generate.'
+            ))
+        if not measured:
+            self.stdout.write('No images to measure.')
+            return
+
+        self.stdout.write(f'Measured {measured} slides of {page.title} ({page.screen_size}, {spec})\n')
+        self.stdout.write(
+            f'{"":<10}  {"total MB":>9}  {"avg KB":>8}  {"avg MP":>7}  {"decode ms":>9}'
+        )
+        for label, (size, seconds, pixels) in (('original', original), ('screen', screen)):
+            self.stdout.write(
+                f'{label:<10}  {size / (1024 * 1024):>9.1f}  {size / measured / 1024:>8.0f}  '
+                f'{pixels / measured / 1_000_000:>7.1f}  {seconds / measured * 1000:>9.1f}'
+            )
+        self.stdout.write('')
+        self.stdout.write(
+            f'Screen renditions are {screen[0] / original[0]:.0%} of the bytes and take '
+            f'{screen[1] / original[1]:.0%} of the decode time of the originals.'
+        )
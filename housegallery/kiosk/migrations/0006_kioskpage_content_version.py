@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kiosk', '0005_kioskpage_carousel_randomize_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kioskpage',
+            name='content_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kiosk', '0006_kioskpage_content_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kioskpage',
+            name='carousel_window_size',
+            field=models.PositiveIntegerField(blank=True, help_text='Show Tagged Image Set and All Images blocks this many images at a time, cycling through every image in a new order each pass, instead of loading them all at once (leave blank to load them all; block limits are ignored when set)', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kiosk', '0007_kioskpage_carousel_window_size'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='kioskpage',
+            name='carousel_randomize',
+            field=models.BooleanField(default=False, help_text='Show carousel items in a random order, different on each page load'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-17 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kiosk', '0008_alter_kioskpage_carousel_randomize'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kioskpage',
+            name='screen_size',
+            field=models.CharField(choices=[('1920x1080', '1920 × 1080 (Full HD)'), ('3840x2160', '3840 × 2160 (4K)')], default='1920x1080', help_text='Resolution of the screen this kiosk runs on. Slides are resized to fit it in the background after publishing; until then a standard 2560px rendition is shown.', max_length=9),
+        ),
+    ]
@@ -1,15 +1,79 @@
-from django.core.cache import cache
+from django.conf import settings
 from django.db import models
+from django.urls import reverse
 from django.utils.html import strip_tags
 from wagtail.admin.panels import FieldPanel
 from wagtail.admin.panels import MultiFieldPanel
 from wagtail.fields import StreamField
 from wagtail.search import index
 
+from housegallery.core.cache_dependencies import ANY
+from housegallery.core.cache_dependencies import ARTIST
+from housegallery.core.cache_dependencies import ARTWORK
+from housegallery.core.cache_dependencies import EXHIBITION
+from housegallery.core.cache_dependencies import IMAGE
+from housegallery.core.cache_dependencies import TAG
+from housegallery.core.cache_dependencies import record_dependencies
+from housegallery.core.cache_utils import get_or_compute
+from housegallery.core.image_utils import rendition_prefetch
 from housegallery.core.mixins import Page
 from housegallery.kiosk.blocks import KioskBodyBlock
 from housegallery.kiosk.blocks import KioskFeaturedItemsBlock
+from housegallery.images.renditions import profile_spec
+from housegallery.images.renditions import profile_specs
 from housegallery.kiosk.blocks import KioskImageSourceBlock
+from housegallery.kiosk.carousel_window import window_page
+from housegallery.kiosk.offline import build_asset_manifest
+from housegallery.kiosk.shuffle import new_seed
+from housegallery.kiosk.shuffle import parse_seed
+from housegallery.kiosk.shuffle import shuffled
+
+# Slide thumbnails, generated on demand if missing
+CAROUSEL_IMAGE_SPECS = profile_specs({"thumb": "medium_webp"})
+
+# Full-size slides use the kiosk's screen rendition (see SCREEN_SIZE_PROFILES),
+# then the display rendition every upload pre-generates, then the original.
+# None of them is rendered inside the request.
+CAROUSEL_FULL_SPEC = profile_spec("display")
+
+SCREEN_SIZE_CHOICES = [
+    ("1920x1080", "1920 × 1080 (Full HD)"),
+    ("3840x2160", "3840 × 2160 (4K)"),
+]
+
+# Screen size -> rendition profile of its full-size slides
+SCREEN_SIZE_PROFILES = {
+    "1920x1080": "kiosk_1080p",
+    "3840x2160": "kiosk_2160p",
+}
+
+# Bump when the manifest JSON changes shape, so displays refetch it
+KIOSK_MANIFEST_VERSION = 2
+
+CAROUSEL_CACHE_PREFIX = "kiosk_carousel_"
+
+# Carousels are invalidated explicitly; the TTL only clears out versions
+# from earlier publishes that nobody asks for any more
+CAROUSEL_CACHE_TIMEOUT = 60 * 60 * 24
+
+IMAGE_SET_BLOCK_TYPES = ("tagged_set", "all_images")
+
+# Rendition each background block's template shows (non-scattered layout)
+BACKGROUND_BLOCK_PROFILES = {
+    "single_image": "display",
+    "tagged_set": "web_optimized",
+    "all_images": "display",
+}
+
+
+def manifest_etag(page_pk, last_published_at, content_version):
+    """Strong ETag for a kiosk's manifest.
+
+    Changes when the kiosk is published (``last_published_at``) or when
+    content its carousel was built from changes (``content_version``).
+    """
+    published = int(last_published_at.timestamp() * 1_000_000) if last_published_at else 0
+    return f'"kiosk-{page_pk}-{published}-{content_version}-{KIOSK_MANIFEST_VERSION}"'
 
 CAROUSEL_TRANSITION_CHOICES = [
     ("crossfade", "Crossfade"),
@@ -47,6 +111,14 @@ class KioskPage(Page):
         default="split",
         help_text="Controls the layout and positioning of content",
     )
+    screen_size = models.CharField(
+        max_length=9,
+        choices=SCREEN_SIZE_CHOICES,
+        default="1920x1080",
+        help_text="Resolution of the screen this kiosk runs on. Slides are "
+                  "resized to fit it in the background after publishing; "
+                  "until then a standard 2560px rendition is shown.",
+    )
 
     # --- Featured Items (replaces display_images for split template) ---
     featured_items = StreamField(KioskFeaturedItemsBlock(), blank=True)
@@ -107,8 +179,21 @@ class KioskPage(Page):
     )
     carousel_randomize = models.BooleanField(
         default=False,
-        help_text="Shuffle carousel items into a random order on each page load",
+        help_text="Show carousel items in a random order, different on each page load",
     )
+    carousel_window_size = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Show Tagged Image Set and All Images blocks this many images "
+                  "at a time, cycling through every image in a new order each "
+                  "pass, instead of loading them all at once (leave blank to "
+                  "load them all; block limits are ignored when set)",
+    )
+
+    # Bumped whenever an image, artwork, artist, tag or exhibition the
+    # carousel was built from changes (see signals.py); part of the
+    # manifest ETag
+    content_version = models.PositiveIntegerField(default=0, editable=False)
 
     parent_page_types = ["home.HomePage"]
     subpage_types = []
@@ -124,21 +209,260 @@ class KioskPage(Page):
             "pages/kiosk/kiosk_split.html",
         )
 
-    def get_carousel_items(self):
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        # A display reloading with ?seed= keeps its order
+        seed = parse_seed(request.GET.get("seed"))
+        if seed is None:
+            seed = new_seed()
+        items = self.get_carousel_items(seed=seed)
+        window = None
+        if self.has_carousel_window:
+            # The first page is rendered with the page; displays fetch the rest
+            first_page = self.get_carousel_window()
+            window = {
+                "url": reverse("kiosk:kiosk_images", args=[self.slug]),
+                "start": len(items),
+                "next": first_page["next"],
+            }
+            items = [*items, *first_page["items"]]
+        context["carousel_items"] = items
+        context["carousel_window"] = window
+        context["carousel_seed"] = seed
+        return context
+
+    @property
+    def events_url(self):
+        """URL of the kiosk's event stream, on the ASGI service if it has its own origin."""
+        return settings.KIOSK_EVENTS_ORIGIN + reverse("kiosk:kiosk_events", args=[self.slug])
+
+    @property
+    def has_carousel_window(self):
+        """Whether image sets are shown a page at a time (see carousel_window.py)."""
+        if not self.carousel_window_size:
+            return False
+        stream = self.featured_items if self.featured_items else self.display_images
+        return any(block.block_type in IMAGE_SET_BLOCK_TYPES for block in stream)
+
+    @property
+    def screen_spec(self):
+        """Filter spec of the full-size slides for this kiosk's screen size."""
+        return profile_spec(SCREEN_SIZE_PROFILES.get(self.screen_size, "kiosk_1080p"))
+
+    @property
+    def carousel_prefetch_specs(self):
+        return [*CAROUSEL_IMAGE_SPECS.values(), self.screen_spec, CAROUSEL_FULL_SPEC]
+
+    def get_carousel_items(self, seed=None, allow_stale=True):
         """Normalize all featured item block types into a uniform list of dicts
-        for carousel rendering with lightbox data attributes."""
+        for carousel rendering with lightbox data attributes.
+
+        Randomized kiosks return the items in the order for ``seed``, or in
+        their canonical order when no seed is given. With ``allow_stale``
+        False the previous carousel is never returned while another worker
+        rebuilds; this waits for (or repeats) the rebuild instead.
+        """
 
         # --- Cache layer ---
+        # Entries are invalidated through housegallery.core.cache_dependencies
+        # when any image, artwork, artist, tag or exhibition used here changes.
+        # The cached list is never shuffled; see shuffle.py.
+        # While one worker rebuilds, others serve the previous carousel.
         timestamp = int(self.last_published_at.timestamp()) if self.last_published_at else 0
-        cache_key = f"kiosk_carousel_{self.pk}_{timestamp}"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
+        cache_key = f"{CAROUSEL_CACHE_PREFIX}{self.pk}_{timestamp}"
+        items = get_or_compute(
+            cache_key,
+            lambda: self._build_carousel_items(cache_key),
+            timeout=CAROUSEL_CACHE_TIMEOUT,
+            stale_key=self._carousel_stale_key,
+            allow_stale=allow_stale,
+        )
+        if self.carousel_randomize and seed is not None:
+            items = shuffled(items, seed)
+        return items
+
+    def get_manifest_etag(self):
+        return manifest_etag(self.pk, self.last_published_at, self.content_version)
+
+    def get_manifest(self):
+        """Carousel items and animation settings for polling displays,
+        served at /display/<slug>/manifest.json.
+
+        Items are in canonical order; displays of randomized kiosks apply
+        their own seeded order. The manifest is cached under its ETag, so
+        the items are never the previous carousel served during a rebuild.
+        """
+        window = None
+        if self.has_carousel_window:
+            window = {
+                "url": reverse("kiosk:kiosk_images", args=[self.slug]),
+                "size": self.carousel_window_size,
+            }
+        return {
+            "version": KIOSK_MANIFEST_VERSION,
+            "settings": {
+                "interval": self.carousel_interval,
+                "transition": self.carousel_transition,
+                "transition_duration": self.carousel_transition_duration,
+                "randomize": self.carousel_randomize,
+            },
+            "items": self.get_carousel_items(allow_stale=False),
+            "window": window,
+        }
+
+    def get_offline_manifest(self):
+        """Versioned list of the files a display needs to run offline,
+        served at /display/<slug>/offline.json (see offline.py).
+
+        Cached under its ETag like the manifest, so it is never built from
+        the previous carousel served during a rebuild.
+        """
+        media_urls = []
+        for item in self.get_carousel_items(allow_stale=False):
+            media_urls.extend((item["thumb_url"], item["full_url"]))
+        media_urls.extend(self.get_background_image_urls())
+        return build_asset_manifest(media_urls)
+
+    def get_background_image_urls(self):
+        """URLs of the images shown behind the kiosk content.
+
+        Renditions are looked up without rendering, as the background can
+        cover every image in the library. Missing ones are queued for the
+        rendition worker and the original file is listed until they exist.
+        """
+        from housegallery.core.rendition_resolver import resolver
+        from housegallery.images.models import CustomImage
+        from housegallery.images.rendition_queue import enqueue_missing_renditions
+
+        if self.background_style == "particles":
+            stream = self.display_images
+        elif self.background_style == "static_image":
+            stream = self.background_gallery
+        else:
+            return []
+
+        urls = []
+        missing = {}
+        for block in stream:
+            spec = profile_spec(BACKGROUND_BLOCK_PROFILES.get(block.block_type, "display"))
+            if block.block_type == "single_image":
+                images = [block.value["image"]] if block.value.get("image") else []
+            elif block.block_type == "tagged_set":
+                tag = block.value.get("tag", "")
+                images = CustomImage.objects.filter(tags__name__iexact=tag).distinct() if tag else []
+            elif block.block_type == "all_images":
+                images = CustomImage.objects.all()
+                if block.value.get("limit"):
+                    images = images[:block.value["limit"]]
+            else:
+                continue
+            images = list(images)
+            for image, data in zip(images, resolver.resolve_each(images, {"url": spec}, generate=False)):
+                if data["url"]:
+                    urls.append(data["url"]["url"])
+                    continue
+                missing.setdefault(spec, []).append(image.pk)
+                try:
+                    urls.append(image.file.url)
+                except Exception:
+                    pass
+
+        for spec, image_pks in missing.items():
+            enqueue_missing_renditions(CustomImage.objects.filter(pk__in=image_pks), spec)
+        return urls
+
+    def get_carousel_window(self, cursor=""):
+        """One page of the kiosk's image sets and the cursor of the next.
+
+        Raises ``ValueError`` for an invalid cursor.
+        """
+        images, next_cursor = window_page(
+            self.get_image_set_images().prefetch_related(
+                rendition_prefetch(specs=self.carousel_prefetch_specs),
+            ),
+            seed=self.pk,
+            cursor=cursor,
+            size=self.carousel_window_size,
+        )
+        urls = self._resolve_image_urls(images)
+        return {
+            "items": [self._image_set_item(image, urls) for image in images],
+            "next": next_cursor,
+        }
+
+    def get_image_set_images(self):
+        """Every image shown by the kiosk's tagged_set and all_images blocks."""
+        from django.db.models import Q
+        from housegallery.images.models import CustomImage
+
+        stream = self.featured_items if self.featured_items else self.display_images
+        tagged = Q()
+        for block in stream:
+            if block.block_type == "all_images":
+                return CustomImage.objects.all()
+            if block.block_type == "tagged_set" and block.value.get("tag"):
+                tagged |= Q(tags__name__iexact=block.value["tag"])
+        if not tagged:
+            return CustomImage.objects.none()
+        return CustomImage.objects.filter(
+            pk__in=CustomImage.objects.filter(tagged).values("pk"),
+        )
+
+    def get_slide_images(self):
+        """Every image the carousel shows full size, except exhibition
+        photos, whose URLs come from the gallery manifest."""
+        from django.db.models import Q
+        from housegallery.artworks.models import Artwork, ArtworkImage
+        from housegallery.images.models import CustomImage
+
+        stream = self.featured_items if self.featured_items else self.display_images
+        image_pks = []
+        artwork_pks = []
+        artist_pks = []
+        artworks = Q(pk__in=[])
+        for block in stream:
+            if block.block_type == "artwork" and block.value.get("artwork"):
+                artwork_pks.append(block.value["artwork"].pk)
+            elif block.block_type == "artist" and block.value.get("artist"):
+                artist_pks.append(block.value["artist"].pk)
+            elif block.block_type == "all_artwork":
+                qs = Artwork.objects.filter(live=True).order_by("-date", "title")
+                if block.value.get("limit"):
+                    qs = qs[:block.value["limit"]]
+                artworks |= Q(pk__in=qs.values("pk"))
+            elif block.block_type == "single_image" and block.value.get("image"):
+                image_pks.append(block.value["image"].pk)
+
+        artworks |= Q(pk__in=artwork_pks) | Q(artists__in=artist_pks)
+        artwork_images = ArtworkImage.objects.filter(
+            artwork__in=Artwork.objects.filter(artworks).values("pk"),
+        )
+        # Block limits aside, image sets are shown whole
+        return CustomImage.objects.filter(
+            Q(pk__in=image_pks)
+            | Q(pk__in=artwork_images.values("image_id"))
+            | Q(pk__in=self.get_image_set_images().values("pk")),
+        )
+
+    @classmethod
+    def bump_content_version(cls, page_pk):
+        """Change the manifest ETag of a kiosk whose carousel content changed."""
+        cls.objects.filter(pk=page_pk).update(
+            content_version=models.F("content_version") + 1,
+        )
+
+    @property
+    def _carousel_stale_key(self):
+        """Carousel key shared by every publish; see ``get_carousel_items``."""
+        return f"{CAROUSEL_CACHE_PREFIX}{self.pk}_stale"
 
+    def _build_carousel_items(self, cache_key):
+        """Build the carousel items and record what they depend on under
+        ``cache_key``, superseding the carousels of earlier publishes."""
         # Use featured_items if populated, fall back to display_images
         stream = self.featured_items if self.featured_items else self.display_images
         if not stream:
-            cache.set(cache_key, [], 3600)
+            record_dependencies(cache_key, {}, family=self._carousel_stale_key)
             return []
 
         # --- First pass: collect all referenced PKs from stream blocks ---
@@ -175,7 +499,7 @@ class KioskPage(Page):
             Prefetch(
                 "artwork_images",
                 queryset=ArtworkImage.objects.select_related("image").prefetch_related(
-                    "image__renditions",
+                    rendition_prefetch("image__renditions", self.carousel_prefetch_specs),
                 ),
             ),
             "artists",
@@ -201,15 +525,11 @@ class KioskPage(Page):
             )
             artists_by_pk = {a.pk: a for a in qs}
 
-        # Prefetch exhibitions using optimized loader
-        exhibitions_by_pk = {}
-        for ex_pk in exhibition_pks:
-            try:
-                ex = ExhibitionPage.get_optimized_exhibition_detail(ex_pk)
-                if ex:
-                    exhibitions_by_pk[ex_pk] = ex
-            except Exception:
-                pass
+        # Prefetch exhibitions in one batch. Their images come from the
+        # gallery manifest, so the photo relations are not loaded.
+        exhibitions_by_pk = ExhibitionPage.get_optimized_exhibitions_detail(
+            exhibition_pks, include_photos=False,
+        )
 
         # Prefetch all artworks if needed
         all_artworks = None
@@ -219,6 +539,23 @@ class KioskPage(Page):
                 qs = qs[:all_artwork_limit]
             all_artworks = list(qs.prefetch_related(*artwork_prefetches))
 
+        # --- Resolve every artwork and single image's URLs in one batch ---
+        carousel_artworks = [*artworks_by_pk.values(), *(all_artworks or [])]
+        for artist in artists_by_pk.values():
+            carousel_artworks.extend(artist.artwork_list.all())
+        urls = self._resolve_image_urls([
+            *(
+                artwork_image.image
+                for artwork in carousel_artworks
+                for artwork_image in artwork.artwork_images.all()
+            ),
+            *(
+                block.value["image"]
+                for block in stream
+                if block.block_type == "single_image" and block.value.get("image")
+            ),
+        ])
+
         # --- Second pass: build carousel items using prefetched objects ---
         items = []
 
@@ -227,7 +564,7 @@ class KioskPage(Page):
                 artwork = block.value.get("artwork")
                 if artwork and artwork.pk in artworks_by_pk:
                     items.extend(self._artwork_to_carousel_items(
-                        {"artwork": artworks_by_pk[artwork.pk]},
+                        {"artwork": artworks_by_pk[artwork.pk]}, urls,
                     ))
             elif block.block_type == "exhibition":
                 exhibition = block.value.get("exhibition")
@@ -239,34 +576,78 @@ class KioskPage(Page):
                 artist = block.value.get("artist")
                 if artist and artist.pk in artists_by_pk:
                     items.extend(self._artist_to_carousel_items(
-                        {"artist": artists_by_pk[artist.pk]},
+                        {"artist": artists_by_pk[artist.pk]}, urls,
                     ))
             elif block.block_type == "all_artwork":
                 if all_artworks is not None:
                     for artwork in all_artworks:
                         items.extend(self._artwork_to_carousel_items(
-                            {"artwork": artwork},
+                            {"artwork": artwork}, urls,
                         ))
             elif block.block_type == "single_image":
-                item = self._image_to_carousel_item(block.value)
+                item = self._image_to_carousel_item(block.value, urls)
                 if item:
                     items.append(item)
-            elif block.block_type in ("tagged_set", "all_images"):
-                items.extend(self._imageset_to_carousel_items(block))
+            elif block.block_type in IMAGE_SET_BLOCK_TYPES:
+                # Windowed image sets are fetched a page at a time instead
+                if not self.has_carousel_window:
+                    items.extend(self._imageset_to_carousel_items(block))
+
+        record_dependencies(cache_key, self._get_carousel_dependencies(
+            stream,
+            artworks=[*artworks_by_pk.values(), *(all_artworks or [])],
+            artists=artists_by_pk.values(),
+            exhibition_pks=exhibitions_by_pk.keys(),
+            all_artwork=has_all_artwork,
+        ), family=self._carousel_stale_key)
+        return items
 
-        if self.carousel_randomize:
-            import random
-            random.shuffle(items)
+    def _get_carousel_dependencies(self, stream, artworks, artists, exhibition_pks, all_artwork):
+        """Return the objects a carousel is built from, for cache invalidation."""
+        artworks = list(artworks)
+        for artist in artists:
+            artworks.extend(artist.artwork_list.all())
+
+        dependencies = {
+            EXHIBITION: list(exhibition_pks),
+            ARTWORK: [artwork.pk for artwork in artworks],
+            ARTIST: [artist.pk for artwork in artworks for artist in artwork.artists.all()],
+            TAG: [tag.pk for artwork in artworks for tag in artwork.materials.all()],
+            IMAGE: [
+                artwork_image.image_id
+                for artwork in artworks
+                for artwork_image in artwork.artwork_images.all()
+            ],
+        }
+        if all_artwork:
+            dependencies[ARTWORK].append(ANY)
 
-        cache.set(cache_key, items, 3600)  # 1 hour
-        return items
+        for block in stream:
+            if block.block_type == "single_image" and block.value.get("image"):
+                dependencies[IMAGE].append(block.value["image"].pk)
+            elif block.block_type in IMAGE_SET_BLOCK_TYPES:
+                # Any upload, edit or retag can change these sets
+                dependencies[IMAGE].append(ANY)
+                dependencies[TAG].append(ANY)
+
+        return dependencies
 
-    def _artwork_to_carousel_items(self, value):
-        """Convert an artwork block to carousel items with full metadata."""
+    def _artwork_to_carousel_items(self, value, urls=None):
+        """Convert an artwork block to carousel items with full metadata.
+
+        ``urls`` is the ``_resolve_image_urls`` result for a whole build;
+        without it the artwork's images are resolved here.
+        """
         artwork = value.get("artwork")
         if not artwork:
             return []
 
+        artwork_images = list(artwork.artwork_images.all())
+        if urls is None:
+            urls = self._resolve_image_urls(
+                artwork_image.image for artwork_image in artwork_images
+            )
+
         items = []
         title = strip_tags(artwork.title) if artwork.title else ""
         artist_names = artwork.artist_names
@@ -274,9 +655,9 @@ class KioskPage(Page):
         materials = artwork.materials_list if artwork.materials_list != "-" else ""
         size = artwork.size_display
 
-        for artwork_image in artwork.artwork_images.all():
+        for artwork_image in artwork_images:
             image_obj = artwork_image.image
-            thumb_url, full_url, srcset, sizes = self._get_image_urls(image_obj)
+            thumb_url, full_url, srcset, sizes = urls[image_obj.pk]
             items.append({
                 "thumb_url": thumb_url,
                 "full_url": full_url,
@@ -292,6 +673,8 @@ class KioskPage(Page):
                 "exhibition_title": "",
                 "exhibition_date": "",
                 "image_credit": getattr(image_obj, "credit", "") or "",
+                "placeholder": getattr(image_obj, "placeholder", "") or "",
+                "dominant_color": getattr(image_obj, "dominant_color", "") or "",
             })
 
         return items
@@ -347,20 +730,29 @@ class KioskPage(Page):
                 "exhibition_title": ex_title,
                 "exhibition_date": ex_date,
                 "image_credit": img_data.get("credit", ""),
+                "placeholder": img_data.get("placeholder", ""),
+                "dominant_color": img_data.get("dominant_color", ""),
             }
             for img_data in all_images
         ]
 
-    def _artist_to_carousel_items(self, value):
+    def _artist_to_carousel_items(self, value, urls=None):
         """Convert an artist block to carousel items from their artworks."""
         artist = value.get("artist")
         if not artist:
             return []
 
+        artworks = list(artist.artwork_list.all())
+        if urls is None:
+            urls = self._resolve_image_urls(
+                artwork_image.image
+                for artwork in artworks
+                for artwork_image in artwork.artwork_images.all()
+            )
         items = []
-        for artwork in artist.artwork_list.all():
+        for artwork in artworks:
             items.extend(
-                self._artwork_to_carousel_items({"artwork": artwork}),
+                self._artwork_to_carousel_items({"artwork": artwork}, urls),
             )
 
         return items
@@ -373,19 +765,27 @@ class KioskPage(Page):
         limit = value.get("limit")
         if limit:
             artworks = artworks[:limit]
+        artworks = list(artworks.prefetch_related("artwork_images__image"))
 
+        urls = self._resolve_image_urls(
+            artwork_image.image
+            for artwork in artworks
+            for artwork_image in artwork.artwork_images.all()
+        )
         items = []
         for artwork in artworks:
-            items.extend(self._artwork_to_carousel_items({"artwork": artwork}))
+            items.extend(self._artwork_to_carousel_items({"artwork": artwork}, urls))
         return items
 
-    def _image_to_carousel_item(self, value):
+    def _image_to_carousel_item(self, value, urls=None):
         """Convert a single image block to a carousel item."""
         image = value.get("image")
         if not image:
             return None
 
-        thumb_url, full_url, srcset, sizes = self._get_image_urls(image)
+        if urls is None:
+            urls = self._resolve_image_urls([image])
+        thumb_url, full_url, srcset, sizes = urls[image.pk]
         return {
             "thumb_url": thumb_url,
             "full_url": full_url,
@@ -401,60 +801,107 @@ class KioskPage(Page):
             "exhibition_title": "",
             "exhibition_date": "",
             "image_credit": getattr(image, "credit", "") or "",
+            "placeholder": getattr(image, "placeholder", "") or "",
+            "dominant_color": getattr(image, "dominant_color", "") or "",
         }
 
     def _imageset_to_carousel_items(self, block):
         """Convert a tagged_set or all_images block to carousel items."""
         from housegallery.images.models import CustomImage
 
-        items = []
         if block.block_type == "tagged_set":
             tag = block.value.get("tag", "")
             if not tag:
-                return items
+                return []
             images = CustomImage.objects.filter(
                 tags__name__iexact=tag,
-            ).distinct().prefetch_related("renditions")
+            ).distinct().prefetch_related(
+                rendition_prefetch(specs=self.carousel_prefetch_specs),
+            )
         else:
             limit = block.value.get("limit")
-            images = CustomImage.objects.all().prefetch_related("renditions")
+            images = CustomImage.objects.all().prefetch_related(
+                rendition_prefetch(specs=self.carousel_prefetch_specs),
+            )
             if limit:
                 images = images[:limit]
 
-        for image in images:
-            thumb_url, full_url, srcset, sizes = self._get_image_urls(image)
-            items.append({
-                "thumb_url": thumb_url,
-                "full_url": full_url,
-                "srcset": srcset,
-                "sizes": sizes,
-                "caption": image.title or "",
-                "image_type": "",
-                "artwork_title": "",
-                "artwork_artist": "",
-                "artwork_date": "",
-                "artwork_materials": "",
-                "artwork_size": "",
-                "exhibition_title": "",
-                "exhibition_date": "",
-                "image_credit": getattr(image, "credit", "") or "",
-            })
+        images = list(images)
+        urls = self._resolve_image_urls(images)
+        return [self._image_set_item(image, urls) for image in images]
 
-        return items
+    def _image_set_item(self, image, urls=None):
+        """Carousel item for an image from a tagged_set or all_images block."""
+        if urls is None:
+            urls = self._resolve_image_urls([image])
+        thumb_url, full_url, srcset, sizes = urls[image.pk]
+        return {
+            "thumb_url": thumb_url,
+            "full_url": full_url,
+            "srcset": srcset,
+            "sizes": sizes,
+            "caption": image.title or "",
+            "image_type": "",
+            "artwork_title": "",
+            "artwork_artist": "",
+            "artwork_date": "",
+            "artwork_materials": "",
+            "artwork_size": "",
+            "exhibition_title": "",
+            "exhibition_date": "",
+            "image_credit": getattr(image, "credit", "") or "",
+            "placeholder": getattr(image, "placeholder", "") or "",
+            "dominant_color": getattr(image, "dominant_color", "") or "",
+        }
 
     def _get_image_urls(self, image_obj):
-        """Return (thumb_url, full_url, srcset, sizes) for an image object.
-
-        Only generates a single thumbnail rendition. The full-size URL uses
-        the original file to avoid generating expensive large renditions
-        for 100+ images on the kiosk page.
+        """Return (thumb_url, full_url, srcset, sizes) for an image object."""
+        return self._resolve_image_urls([image_obj])[image_obj.pk]
+
+    def _resolve_image_urls(self, images):
+        """Return ``{image pk: (thumb_url, full_url, srcset, sizes)}``.
+
+        Every rendition is looked up in one resolver pass over ``images``.
+        Only thumbnails are generated here if missing, in a second pass for
+        just those images. The full-size URL is the rendition for the
+        kiosk's screen size, queued when the kiosk is published, so
+        displays do not download and decode multi-megabyte originals.
+        Rendering it for 100+ images inside the request would be too slow,
+        so until it exists the display rendition is used, and the original
+        file if that is missing too.
         """
-        from housegallery.core.image_utils import get_image_urls
+        from housegallery.core.rendition_resolver import resolver
+
+        images = list({image.pk: image for image in images}.values())
+        resolved = resolver.resolve_each(
+            images,
+            {**CAROUSEL_IMAGE_SPECS, "screen": self.screen_spec, "display": CAROUSEL_FULL_SPEC},
+            generate=False,
+        )
+        missing_thumbs = [data for data in resolved if not data["thumb"]]
+        if missing_thumbs:
+            thumbs = resolver.resolve_each(
+                [image for image, data in zip(images, resolved) if not data["thumb"]],
+                CAROUSEL_IMAGE_SPECS,
+            )
+            for data, thumb in zip(missing_thumbs, thumbs):
+                data.update(thumb)
 
-        urls = get_image_urls(image_obj, specs={"thumb": "width-800|format-webp"})
-        thumb = urls["thumb_url"] or urls["original_url"]
-        original = urls["original_url"]
-        return (thumb, original, "", "")
+        urls = {}
+        for image, data in zip(images, resolved):
+            try:
+                original_url = image.file.url
+            except Exception:
+                original_url = ""
+            thumb = data["thumb"]
+            full = data["screen"] or data["display"]
+            urls[image.pk] = (
+                thumb["url"] if thumb else original_url,
+                full["url"] if full else original_url,
+                "",
+                "",
+            )
+        return urls
 
     search_fields = [
         *Page.search_fields,
@@ -467,6 +914,7 @@ class KioskPage(Page):
         *Page.content_panels,
         MultiFieldPanel([
             FieldPanel("display_template"),
+            FieldPanel("screen_size"),
             FieldPanel("featured_items"),
         ], heading="Display Template"),
         MultiFieldPanel([
@@ -485,6 +933,7 @@ class KioskPage(Page):
             FieldPanel("carousel_transition_duration"),
             FieldPanel("carousel_transition"),
             FieldPanel("carousel_randomize"),
+            FieldPanel("carousel_window_size"),
         ], heading="Carousel Animation Settings", classname="collapsible collapsed"),
     ]
 
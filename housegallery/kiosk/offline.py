@@ -0,0 +1,108 @@
+"""Asset manifests that let kiosk displays keep running offline.
+
+Kiosks sit on venue Wi-Fi that comes and goes. Each kiosk publishes a
+versioned list of the files it needs at /display/<slug>/offline.json:
+
+- carousel thumbnails and full-size slides at the kiosk's screen size;
+- background gallery images;
+- the webpack bundles and fonts.
+
+The service worker at /display/sw.js precaches the list. Each entry has a
+revision: a content hash for static files, and a hash of the URL for
+media. Media URLs are immutable in production, because files are never
+overwritten. When the list changes, only entries whose revision changed
+are downloaded, and entries that were dropped are deleted.
+"""
+
+import functools
+import hashlib
+
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import ImproperlyConfigured
+from django.templatetags.static import static
+
+# Webpack bundles loaded by the kiosk templates
+KIOSK_BUNDLES = ("vendors", "project", "styles", "kiosk-carousel", "kiosk-gallery")
+
+# Emitted by webpack from css/abstracts/font-files.css
+KIOSK_STATIC_FILES = (
+    "webpack_bundles/fonts/SourceCodePro-VariableFont_wght.ttf",
+    "webpack_bundles/fonts/SourceCodePro-Italic-VariableFont_wght.ttf",
+    "images/favicons/house-favicon.jpg",
+)
+
+REVISION_LENGTH = 16
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(f):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()[:REVISION_LENGTH]
+
+
+@functools.cache
+def static_revision(path):
+    """Content hash of a static file, or ``""`` if it cannot be found.
+
+    Cached for the life of the process; static files only change on deploy.
+    """
+    try:
+        with staticfiles_storage.open(path) as f:
+            return _hash_file(f)
+    except (OSError, ValueError, ImproperlyConfigured):
+        # Not collected (e.g. in development); read it where it is found
+        pass
+    located = finders.find(path)
+    if not located:
+        return ""
+    with open(located, "rb") as f:
+        return _hash_file(f)
+
+
+def url_revision(url):
+    return hashlib.sha256(url.encode()).hexdigest()[:REVISION_LENGTH]
+
+
+def static_assets():
+    """``[{"url", "revision"}]`` for the kiosk's bundles and fonts."""
+    from webpack_loader.utils import get_files
+
+    assets = []
+    for bundle in KIOSK_BUNDLES:
+        for chunk in get_files(bundle):
+            path = f"webpack_bundles/{chunk['name']}"
+            assets.append({
+                "url": chunk["url"],
+                "revision": static_revision(path) or url_revision(chunk["url"]),
+            })
+    for path in KIOSK_STATIC_FILES:
+        url = static(path)
+        assets.append({"url": url, "revision": static_revision(path) or url_revision(url)})
+    return assets
+
+
+def static_assets_version():
+    """Changes when any of the static assets changes, e.g. after a deploy."""
+    return asset_manifest_version(static_assets())
+
+
+def asset_manifest_version(assets):
+    digest = hashlib.sha256()
+    for asset in sorted(assets, key=lambda asset: asset["url"]):
+        digest.update(f"{asset['url']}\0{asset['revision']}\n".encode())
+    return digest.hexdigest()[:REVISION_LENGTH]
+
+
+def build_asset_manifest(media_urls):
+    """The offline manifest for a kiosk showing ``media_urls``."""
+    assets = list(static_assets())
+    seen = {asset["url"] for asset in assets}
+    for url in media_urls:
+        if url and url not in seen:
+            seen.add(url)
+            assets.append({"url": url, "revision": url_revision(url)})
+    return {"version": asset_manifest_version(assets), "assets": assets}
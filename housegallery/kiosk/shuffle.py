@@ -0,0 +1,52 @@
+"""Seeded shuffling of cached kiosk carousels.
+
+The cached carousel is kept in its canonical order, shared by every
+display and never rebuilt to change the order. Randomized kiosks show it
+in the order given by ``permutation(len(items), seed)``. That is a
+Fisher-Yates shuffle of an index array, driven by a 32-bit xorshift
+generator, so it is O(n) integer work and never copies or touches the
+item dicts.
+
+Each page load draws a seed and passes it to the display. The carousel
+script has the same generator (``_permutation`` in kiosk-carousel.js),
+so items from a refetched manifest keep that display's order.
+"""
+
+import secrets
+from array import array
+
+MASK_32 = 0xFFFFFFFF
+
+# xorshift32 has no zero state; seeds of 0 start here instead
+ZERO_SEED_STATE = 0x9E3779B9
+
+
+def new_seed():
+    return secrets.randbelow(MASK_32) + 1
+
+
+def parse_seed(value):
+    """Seed from a query string value, or ``None`` if it is not one."""
+    try:
+        seed = int(value)
+    except (TypeError, ValueError):
+        return None
+    return seed if 0 <= seed <= MASK_32 else None
+
+
+def permutation(n, seed):
+    """Indexes ``0..n-1`` in the order for ``seed``."""
+    order = array("I", range(n))
+    state = (seed & MASK_32) or ZERO_SEED_STATE
+    for i in range(n - 1, 0, -1):
+        state ^= (state << 13) & MASK_32
+        state ^= state >> 17
+        state ^= (state << 5) & MASK_32
+        j = state % (i + 1)
+        order[i], order[j] = order[j], order[i]
+    return order
+
+
+def shuffled(items, seed):
+    """``items`` in the order for ``seed``."""
+    return [items[i] for i in permutation(len(items), seed)]
@@ -0,0 +1,60 @@
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.dispatch import receiver
+from wagtail.signals import page_published, page_unpublished
+
+from housegallery.core.cache_dependencies import register_invalidator
+from housegallery.images.rendition_queue import enqueue_missing_renditions
+
+from .events import hub
+from .models import CAROUSEL_CACHE_PREFIX, KioskPage
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_kiosk_carousel(cache_key):
+    """
+    Drop a cached carousel whose images, artworks, artists, tags or
+    exhibitions changed, and bump its kiosk's content version so displays
+    see a new manifest ETag.
+    """
+    cache.delete(cache_key)
+    page_id = cache_key[len(CAROUSEL_CACHE_PREFIX):].split("_", 1)[0]
+    if page_id.isdigit():
+        KioskPage.bump_content_version(int(page_id))
+        transaction.on_commit(hub.notify)
+
+
+register_invalidator(CAROUSEL_CACHE_PREFIX, invalidate_kiosk_carousel)
+
+
+@receiver(page_published, sender=KioskPage)
+@receiver(page_unpublished, sender=KioskPage)
+def notify_kiosk_displays(sender, instance, **kwargs):
+    """Tell connected displays to refetch the manifest once the publish commits."""
+    transaction.on_commit(hub.notify)
+
+
+@receiver(page_published, sender=KioskPage)
+def queue_kiosk_screen_renditions(sender, instance, **kwargs):
+    """
+    Queue the slide rendition for the kiosk's screen size for every image
+    it shows. ``process_rendition_jobs`` builds them, and the carousel is
+    rebuilt with them as they finish.
+    """
+    def enqueue():
+        try:
+            queued = enqueue_missing_renditions(instance.get_slide_images(), instance.screen_spec)
+        except Exception as e:
+            logger.error(
+                "Failed to queue screen renditions for kiosk %s: %s", instance.pk, str(e),
+            )
+            return
+        if queued:
+            logger.info(
+                "Queued %s for %d images of kiosk %s", instance.screen_spec, queued, instance.pk,
+            )
+
+    transaction.on_commit(enqueue)
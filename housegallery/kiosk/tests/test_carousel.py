@@ -23,6 +23,8 @@ CAROUSEL_ITEM_KEYS = {
     "exhibition_title",
     "exhibition_date",
     "image_credit",
+    "placeholder",
+    "dominant_color",
 }
 
 DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
@@ -30,6 +32,10 @@ DUMMY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCac
 MOCK_URLS_TUPLE = ("/media/thumb.jpg", "/media/full.jpg", "/media/thumb.jpg 400w, /media/full.jpg 1440w", "(max-width: 600px) 400px, 1440px")
 
 
+def _mock_resolve_image_urls(images):
+    return {image.pk: MOCK_URLS_TUPLE for image in images}
+
+
 @pytest.fixture
 def kiosk_page(home_page):
     return home_page.add_child(
@@ -56,7 +62,7 @@ class TestArtworkToCarouselItems:
         ArtworkImage.objects.create(artwork=artwork, image=img1)
         ArtworkImage.objects.create(artwork=artwork, image=img2)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert len(result) == 2
@@ -67,7 +73,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Key Image")
         ArtworkImage.objects.create(artwork=artwork, image=img)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert len(result) == 1
@@ -79,7 +85,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Painting Image")
         ArtworkImage.objects.create(artwork=artwork, image=img)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert result[0]["artwork_title"] == "Painting A"
@@ -91,7 +97,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Some Image")
         ArtworkImage.objects.create(artwork=artwork, image=img, caption="")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert result[0]["caption"] == "Fallback Title"
@@ -102,7 +108,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Some Image")
         ArtworkImage.objects.create(artwork=artwork, image=img, caption="Explicit Caption")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert result[0]["caption"] == "Explicit Caption"
@@ -115,7 +121,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Collab Image")
         ArtworkImage.objects.create(artwork=artwork, image=img)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert result[0]["artwork_artist"] == "Jane Doe"
@@ -126,7 +132,7 @@ class TestArtworkToCarouselItems:
         img = make_image(title="Credited Image", credit="Photo by Alice")
         ArtworkImage.objects.create(artwork=artwork, image=img)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artwork_to_carousel_items({"artwork": artwork})
 
         assert result[0]["image_credit"] == "Photo by Alice"
@@ -232,7 +238,7 @@ class TestArtistToCarouselItems:
         ArtworkImage.objects.create(artwork=artwork1, image=img1)
         ArtworkImage.objects.create(artwork=artwork2, image=img2)
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._artist_to_carousel_items({"artist": artist})
 
         assert len(result) == 2
@@ -250,7 +256,7 @@ class TestImageToCarouselItem:
     def test_dict_has_all_keys(self, kiosk_page, make_image):
         img = make_image(title="Single Image")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._image_to_carousel_item({"image": img})
 
         assert result is not None
@@ -259,7 +265,7 @@ class TestImageToCarouselItem:
     def test_caption_from_value(self, kiosk_page, make_image):
         img = make_image(title="Ignored Title")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._image_to_carousel_item(
                 {"image": img, "caption": "My Caption"},
             )
@@ -269,7 +275,7 @@ class TestImageToCarouselItem:
     def test_caption_from_title(self, kiosk_page, make_image):
         img = make_image(title="Image Title")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._image_to_carousel_item({"image": img})
 
         assert result["caption"] == "Image Title"
@@ -277,7 +283,7 @@ class TestImageToCarouselItem:
     def test_image_credit_from_model(self, kiosk_page, make_image):
         img = make_image(title="Credited", credit="Photographer X")
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._image_to_carousel_item({"image": img})
 
         assert result["image_credit"] == "Photographer X"
@@ -289,48 +295,58 @@ class TestKioskGetImageUrls:
     def test_returns_four_element_tuple(self, kiosk_page, make_image):
         img = make_image(title="Tuple Test")
 
-        with patch("housegallery.core.image_utils.get_image_urls") as mock_urls:
-            mock_urls.return_value = {
-                "thumb_url": "/thumb.jpg", "medium_url": "/med.jpg",
-                "full_url": "/full.jpg", "original_url": "/orig.jpg",
-                "srcset": "srcset_val", "sizes": "sizes_val",
-                "width": 100, "height": 100,
-                "alt": "", "credit": "", "title": "",
-            }
-            result = kiosk_page._get_image_urls(img)
+        result = kiosk_page._get_image_urls(img)
 
         assert isinstance(result, tuple)
         assert len(result) == 4
 
-    def test_delegates_to_core_utility(self, kiosk_page, make_image):
-        img = make_image(title="Delegate Test")
-
-        with patch("housegallery.core.image_utils.get_image_urls") as mock_urls:
-            mock_urls.return_value = {
-                "thumb_url": "/thumb.jpg", "medium_url": "/med.jpg",
-                "full_url": "/full.jpg", "original_url": "/orig.jpg",
-                "srcset": "", "sizes": "",
-                "width": 100, "height": 100,
-                "alt": "", "credit": "", "title": "",
-            }
-            kiosk_page._get_image_urls(img)
-            mock_urls.assert_called_once_with(img)
-
     def test_falls_back_to_original_url(self, kiosk_page, make_image):
         img = make_image(title="Fallback Test")
 
-        with patch("housegallery.core.image_utils.get_image_urls") as mock_urls:
-            mock_urls.return_value = {
-                "thumb_url": "", "medium_url": "",
-                "full_url": "", "original_url": "/orig.jpg",
-                "srcset": "", "sizes": "",
-                "width": 100, "height": 100,
-                "alt": "", "credit": "", "title": "",
-            }
+        with patch(
+            "housegallery.core.rendition_resolver.resolver.resolve_each",
+            side_effect=lambda images, specs, generate=True: [
+                {key: None for key in specs} for _image in images
+            ],
+        ):
             thumb, full, srcset, sizes = kiosk_page._get_image_urls(img)
 
-        assert thumb == "/orig.jpg"
-        assert full == "/orig.jpg"
+        assert thumb == img.file.url
+        assert full == img.file.url
+
+    def test_one_resolver_pass_per_build(self, kiosk_page, make_image):
+        from housegallery.core.rendition_resolver import resolver
+        from housegallery.kiosk.models import CAROUSEL_IMAGE_SPECS
+
+        artworks = []
+        for n in range(3):
+            artwork = Artwork(title=f"Batch {n}")
+            artwork.save()
+            image = make_image(title=f"Batch Image {n}")
+            image.get_rendition(CAROUSEL_IMAGE_SPECS["thumb"])
+            ArtworkImage.objects.create(artwork=artwork, image=image)
+            artworks.append(("artwork", {"artwork": artwork}))
+        single = make_image(title="Single")
+        single.get_rendition(CAROUSEL_IMAGE_SPECS["thumb"])
+        kiosk_page.featured_items = [*artworks, ("single_image", {"image": single})]
+
+        with patch.object(resolver, "resolve_each", wraps=resolver.resolve_each) as resolve_each:
+            items = kiosk_page._build_carousel_items("test_one_resolver_pass_per_build")
+
+        assert len(items) == 4
+        assert resolve_each.call_count == 1
+        assert len(resolve_each.call_args.args[0]) == 4
+
+    def test_missing_thumbnails_are_generated_together(self, kiosk_page, make_image):
+        from housegallery.core.rendition_resolver import resolver
+
+        images = [make_image(title=f"No Thumb {n}") for n in range(3)]
+
+        with patch.object(resolver, "resolve_each", wraps=resolver.resolve_each) as resolve_each:
+            urls = kiosk_page._resolve_image_urls(images)
+
+        assert resolve_each.call_count == 2
+        assert all(urls[image.pk][0] != image.file.url for image in images)
 
 
 @pytest.mark.django_db
@@ -355,7 +371,7 @@ class TestImagesetToCarouselItems:
         block.block_type = "tagged_set"
         block.value = {"tag": "kiosk-display"}
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._imageset_to_carousel_items(block)
 
         assert len(result) == 2
@@ -368,7 +384,7 @@ class TestImagesetToCarouselItems:
         block.block_type = "all_images"
         block.value = {"limit": 2}
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._imageset_to_carousel_items(block)
 
         assert len(result) == 2
@@ -381,7 +397,7 @@ class TestImagesetToCarouselItems:
         block.block_type = "tagged_set"
         block.value = {"tag": "test-tag"}
 
-        with patch.object(kiosk_page, "_get_image_urls", return_value=MOCK_URLS_TUPLE):
+        with patch.object(kiosk_page, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
             result = kiosk_page._imageset_to_carousel_items(block)
 
         assert len(result) == 1
@@ -435,3 +451,341 @@ class TestGetCarouselItemsCache:
         cache_key = f"kiosk_carousel_{kiosk.pk}_{timestamp}"
         cached = cache.get(cache_key)
         assert cached is not None
+
+    def test_artwork_edit_invalidates_cached_carousel(self, home_page, make_image):
+        from django.core.cache import cache
+
+        artwork = Artwork(title="Before")
+        artwork.save()
+        ArtworkImage.objects.create(artwork=artwork, image=make_image(title="Artwork Image"))
+
+        kiosk = home_page.add_child(
+            instance=KioskPage(
+                title="Dependency Kiosk", slug="dependency-kiosk",
+                display_template="split",
+                featured_items=[("artwork", {"artwork": artwork})],
+            )
+        )
+        kiosk.save_revision().publish()
+        kiosk.refresh_from_db()
+
+        with patch.object(KioskPage, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
+            assert kiosk.get_carousel_items()[0]["artwork_title"] == "Before"
+
+            timestamp = int(kiosk.last_published_at.timestamp())
+            assert cache.get(f"kiosk_carousel_{kiosk.pk}_{timestamp}") is not None
+
+            artwork.title = "After"
+            artwork.save()
+
+            assert cache.get(f"kiosk_carousel_{kiosk.pk}_{timestamp}") is None
+            assert kiosk.get_carousel_items()[0]["artwork_title"] == "After"
+
+
+@pytest.mark.django_db
+class TestExhibitionCarouselQueries:
+    """Exhibition blocks are loaded in one batch, not once per exhibition."""
+
+    @pytest.fixture
+    def make_exhibition(self, exhibitions_index, make_image):
+        import datetime
+
+        from housegallery.exhibitions.models import ExhibitionPage, InstallationPhoto
+
+        def _factory(n):
+            page = exhibitions_index.add_child(
+                instance=ExhibitionPage(
+                    title=f"Show {n}", slug=f"show-{n}",
+                    start_date=datetime.date(2024, 3, 1),
+                )
+            )
+            page.save_revision().publish()
+            page.refresh_from_db()
+            InstallationPhoto.objects.create(page=page, image=make_image(title=f"Install {n}"))
+            page.get_gallery_manifest()  # built ahead, as on publish
+            return page
+        return _factory
+
+    def _count_build_queries(self, home_page, exhibitions, slug):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        kiosk = home_page.add_child(
+            instance=KioskPage(
+                title=slug, slug=slug, display_template="split",
+                featured_items=[("exhibition", {"exhibition": page}) for page in exhibitions],
+            )
+        )
+        kiosk = KioskPage.objects.get(pk=kiosk.pk)
+        with CaptureQueriesContext(connection) as queries:
+            items = kiosk._build_carousel_items(f"kiosk_carousel_test_{slug}")
+        assert len(items) == len(exhibitions)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_exhibitions(self, home_page, make_exhibition):
+        exhibitions = [make_exhibition(n) for n in range(4)]
+
+        one = self._count_build_queries(home_page, exhibitions[:1], "one-show")
+        four = self._count_build_queries(home_page, exhibitions, "four-shows")
+
+        assert four == one
+
+    def test_bulk_loader_returns_pages_by_pk(self, make_exhibition, django_assert_max_num_queries):
+        from housegallery.exhibitions.models import ExhibitionPage
+
+        exhibitions = [make_exhibition(n) for n in range(3)]
+        pks = [page.pk for page in exhibitions]
+
+        with django_assert_max_num_queries(12):
+            loaded = ExhibitionPage.get_optimized_exhibitions_detail([*pks, 999999])
+            for page in loaded.values():
+                page.get_all_gallery_images()
+                list(page.installation_photos.all())
+
+        assert sorted(loaded) == sorted(pks)
+
+
+@pytest.mark.django_db
+class TestCarouselWindow:
+    """Image sets paged through a seeded, SQL-computed ordering."""
+
+    @pytest.fixture(autouse=True)
+    def _use_dummy_cache(self, settings):
+        settings.CACHES = DUMMY_CACHE
+
+    @pytest.fixture
+    def windowed_kiosk(self, home_page, make_image):
+        images = [make_image(title=f"Image {n}") for n in range(7)]
+        kiosk = home_page.add_child(
+            instance=KioskPage(
+                title="Window Kiosk", slug="window-kiosk",
+                display_template="split",
+                carousel_window_size=3,
+                featured_items=[("all_images", {"limit": None})],
+            )
+        )
+        return kiosk, images
+
+    def _cycle(self, kiosk, cursor):
+        """Captions of one pass through the images, and the cursor after it."""
+        captions = []
+        while True:
+            page = kiosk.get_carousel_window(cursor)
+            captions.extend(item["caption"] for item in page["items"])
+            cursor = page["next"]
+            if len(page["items"]) < kiosk.carousel_window_size:
+                return captions, cursor
+
+    def test_each_cycle_shows_every_image_once(self, windowed_kiosk):
+        kiosk, images = windowed_kiosk
+
+        cycles, cursor = [], ""
+        for _ in range(4):
+            captions, cursor = self._cycle(kiosk, cursor)
+            cycles.append(captions)
+
+        titles = sorted(image.title for image in images)
+        assert all(sorted(captions) == titles for captions in cycles)
+        # Any one new order can match the last by chance
+        assert any(captions != cycles[0] for captions in cycles[1:])
+
+    def test_whole_pages_run_into_the_next_cycle(self, windowed_kiosk):
+        kiosk, images = windowed_kiosk
+        images[6].delete()  # six images, two full pages per cycle
+
+        pages, cursor = [], ""
+        for _ in range(4):
+            page = kiosk.get_carousel_window(cursor)
+            pages.append([item["caption"] for item in page["items"]])
+            cursor = page["next"]
+
+        titles = sorted(image.title for image in images[:6])
+        assert [len(page) for page in pages] == [3, 3, 3, 3]
+        assert sorted(pages[0] + pages[1]) == sorted(pages[2] + pages[3]) == titles
+
+    def test_pages_are_one_query_each(self, windowed_kiosk, django_assert_max_num_queries):
+        kiosk, _images = windowed_kiosk
+
+        with patch.object(KioskPage, "_resolve_image_urls", side_effect=_mock_resolve_image_urls):
+            with django_assert_max_num_queries(2):  # images and their renditions
+                page = kiosk.get_carousel_window("")
+
+        assert len(page["items"]) == 3
+
+    def test_image_sets_are_left_out_of_the_carousel(self, windowed_kiosk):
+        kiosk, _images = windowed_kiosk
+
+        assert kiosk.has_carousel_window
+        assert kiosk.get_carousel_items() == []
+
+    def test_tagged_sets(self, windowed_kiosk, make_image):
+        kiosk, images = windowed_kiosk
+        images[0].tags.add("Garden")
+        images[1].tags.add("garden", "night")
+        kiosk.featured_items = [("tagged_set", {"tag": "garden"}), ("tagged_set", {"tag": "night"})]
+
+        captions, _cursor = self._cycle(kiosk, "")
+
+        assert sorted(captions) == ["Image 0", "Image 1"]
+
+    def test_invalid_cursor(self, windowed_kiosk):
+        kiosk, _images = windowed_kiosk
+
+        with pytest.raises(ValueError):
+            kiosk.get_carousel_window("nonsense")
+
+
+@pytest.mark.django_db
+class TestCarouselShuffle:
+    """Randomized kiosks reorder the cached carousel per seed."""
+
+    @pytest.fixture(autouse=True)
+    def _use_locmem_cache(self):
+        from django.test.utils import override_settings
+        with override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        }):
+            yield
+
+    @pytest.fixture
+    def random_kiosk(self, home_page, make_image):
+        images = [make_image(title=f"Image {n}") for n in range(8)]
+        kiosk = home_page.add_child(
+            instance=KioskPage(
+                title="Random Kiosk", slug="random-kiosk",
+                display_template="split",
+                carousel_randomize=True,
+                featured_items=[("single_image", {"image": image}) for image in images],
+            )
+        )
+        kiosk.save_revision().publish()
+        kiosk.refresh_from_db()
+        return kiosk
+
+    def test_permutation_matches_carousel_script(self):
+        from housegallery.kiosk.shuffle import permutation
+
+        # The same sequence is produced by _permutation in kiosk-carousel.js
+        assert list(permutation(10, 123456789)) == [7, 6, 8, 4, 5, 2, 3, 9, 0, 1]
+        assert sorted(permutation(100, 42)) == list(range(100))
+
+    def test_seeds_reorder_without_rebuilding(self, random_kiosk):
+        with patch.object(
+            KioskPage, "_build_carousel_items", autospec=True,
+            side_effect=KioskPage._build_carousel_items,
+        ) as build:
+            canonical = random_kiosk.get_carousel_items()
+            first = random_kiosk.get_carousel_items(seed=1)
+            again = random_kiosk.get_carousel_items(seed=1)
+            other = random_kiosk.get_carousel_items(seed=2)
+
+        assert build.call_count == 1
+        assert [item["caption"] for item in canonical] == [f"Image {n}" for n in range(8)]
+        assert first == again
+        assert first != other
+        assert sorted(first, key=lambda item: item["caption"]) == canonical
+
+    def test_page_render_keeps_seed(self, client, random_kiosk):
+        first = client.get("/display/random-kiosk/", {"seed": "7"})
+        second = client.get("/display/random-kiosk/", {"seed": "7"})
+
+        assert first.context["carousel_seed"] == 7
+        assert first.context["carousel_items"] == second.context["carousel_items"]
+        assert b'data-carousel-seed="7"' in first.content
+
+
+@pytest.mark.django_db
+class TestCarouselFullUrl:
+    """Full-size slides use the display rendition, not the original."""
+
+    def test_uses_display_rendition(self, kiosk_page, make_image):
+        from housegallery.kiosk.models import CAROUSEL_FULL_SPEC
+
+        image = make_image()
+        display = image.get_rendition(CAROUSEL_FULL_SPEC)
+
+        _thumb, full, _srcset, _sizes = kiosk_page._get_image_urls(image)
+
+        assert full == display.url
+
+    def test_original_when_not_generated(self, kiosk_page, make_image):
+        image = make_image()
+
+        _thumb, full, _srcset, _sizes = kiosk_page._get_image_urls(image)
+
+        assert full == image.file.url
+
+    def test_uses_screen_rendition(self, kiosk_page, make_image):
+        from housegallery.kiosk.models import CAROUSEL_FULL_SPEC
+
+        image = make_image()
+        image.get_rendition(CAROUSEL_FULL_SPEC)
+        screen = image.get_rendition(kiosk_page.screen_spec)
+
+        _thumb, full, _srcset, _sizes = kiosk_page._get_image_urls(image)
+
+        assert full == screen.url
+
+
+@pytest.mark.django_db
+class TestScreenRenditions:
+    """Slides are built for the kiosk's screen size when it is published."""
+
+    def test_screen_size_profiles(self, kiosk_page):
+        assert kiosk_page.screen_spec == "max-1920x1080|format-webp|webpquality-85"
+
+        kiosk_page.screen_size = "3840x2160"
+        assert kiosk_page.screen_spec == "max-3840x2160|format-webp|webpquality-85"
+
+    def test_slide_images(self, kiosk_page, make_image):
+        artist = Artist.objects.create(name="Slide Artist")
+        by_artist = Artwork(title="By Artist")
+        by_artist.save()
+        ArtworkArtist.objects.create(artwork=by_artist, artist=artist)
+        featured = Artwork(title="Featured")
+        featured.save()
+        artist_image, artwork_image, single = make_image(), make_image(), make_image()
+        make_image()  # not shown
+        ArtworkImage.objects.create(artwork=by_artist, image=artist_image)
+        ArtworkImage.objects.create(artwork=featured, image=artwork_image)
+        kiosk_page.featured_items = [
+            ("artwork", {"artwork": featured}),
+            ("artist", {"artist": artist}),
+            ("single_image", {"image": single}),
+        ]
+
+        assert set(kiosk_page.get_slide_images()) == {artist_image, artwork_image, single}
+
+    def test_publish_queues_screen_renditions(
+        self, kiosk_page, make_image, django_capture_on_commit_callbacks,
+    ):
+        from housegallery.images.models import RenditionJob
+
+        built, missing = make_image(), make_image()
+        kiosk_page.screen_size = "3840x2160"
+        built.get_rendition(kiosk_page.screen_spec)
+        kiosk_page.featured_items = [
+            ("single_image", {"image": built}),
+            ("single_image", {"image": missing}),
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            kiosk_page.save_revision().publish()
+
+        jobs = RenditionJob.objects.filter(filter_spec=kiosk_page.screen_spec)
+        assert [job.image_id for job in jobs] == [missing.pk]
+
+    def test_measure_kiosk_payload(self, kiosk_page, make_image):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        kiosk_page.featured_items = [("single_image", {"image": make_image()})]
+        kiosk_page.save_revision().publish()
+
+        out = StringIO()
+        call_command("measure_kiosk_payload", "carousel-kiosk", "--generate", stdout=out)
+
+        output = out.getvalue()
+        assert "Measured 1 slides" in output
+        assert "of the decode time of the originals" in output
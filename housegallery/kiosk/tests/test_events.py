@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, Client
+
+from housegallery.artworks.models import Artwork, ArtworkImage
+from housegallery.kiosk.events import KioskEventHub, kiosk_event_stream
+from housegallery.kiosk.models import KioskPage
+
+
+@pytest.fixture
+def kiosk(home_page, make_image):
+    artwork = Artwork(title="Before")
+    artwork.save()
+    ArtworkImage.objects.create(artwork=artwork, image=make_image())
+    page = home_page.add_child(
+        instance=KioskPage(
+            title="Events Kiosk",
+            slug="events-kiosk",
+            featured_items=[("artwork", {"artwork": artwork})],
+        )
+    )
+    page.save_revision().publish()
+    page.refresh_from_db()
+    page.get_carousel_items()  # records the carousel's dependencies
+    return page, artwork
+
+
+def _next(queue):
+    return asyncio.wait_for(queue.get(), 1)
+
+
+@pytest.mark.django_db
+class TestKioskEventHub:
+    def test_change_is_pushed_to_subscribers(self, kiosk):
+        page, artwork = kiosk
+        hub = KioskEventHub(poll_interval=60)
+
+        async def scenario():
+            first = hub.subscribe(page.slug)
+            second = hub.subscribe(page.slug)
+            initial = await _next(first)
+            await _next(second)
+
+            artwork.title = "After"
+            await sync_to_async(artwork.save)()
+            hub.notify()
+
+            changed = (await _next(first), await _next(second))
+            hub.unsubscribe(page.slug, first)
+            hub.unsubscribe(page.slug, second)
+            return initial, changed
+
+        initial, changed = async_to_sync(scenario)()
+
+        page.refresh_from_db()
+        assert initial != changed[0]
+        assert changed == (page.get_manifest_etag(),) * 2
+
+    def test_unpublished_kiosk_sends_none(self, kiosk):
+        page, _artwork = kiosk
+        hub = KioskEventHub(poll_interval=60)
+
+        async def scenario():
+            queue = hub.subscribe(page.slug)
+            await _next(queue)
+            await sync_to_async(page.unpublish)()
+            hub.notify()
+            return await _next(queue)
+
+        assert async_to_sync(scenario)() is None
+
+    def test_stream_sends_events(self, kiosk):
+        page, _artwork = kiosk
+        hub = KioskEventHub(poll_interval=60)
+
+        async def scenario():
+            stream = kiosk_event_stream(page.slug, '"old"', events=hub)
+            events = [await anext(stream), await anext(stream)]
+            await stream.aclose()
+            return events
+
+        opening, update = async_to_sync(scenario)()
+
+        assert opening.startswith("retry: ")
+        assert 'event: manifest\ndata: {"etag": "\\"old\\""}' in opening
+        assert update.startswith("event: manifest\n")
+        assert page.get_manifest_etag().replace('"', '\\"') in update
+        assert not hub._queues
+
+
+@pytest.mark.django_db
+class TestKioskEventsView:
+    def test_streams_current_etag(self, kiosk):
+        page, _artwork = kiosk
+
+        async def scenario():
+            response = await AsyncClient().get("/display/events-kiosk/events")
+            first = await anext(response.streaming_content)
+            await response.streaming_content.aclose()
+            return response, first
+
+        response, first = async_to_sync(scenario)()
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["Access-Control-Allow-Origin"] == "*"
+        assert page.get_manifest_etag().replace('"', '\\"').encode() in first
+
+    def test_unknown_kiosk_is_404(self, db):
+        async def scenario():
+            return await AsyncClient().get("/display/missing/events")
+
+        assert async_to_sync(scenario)().status_code == 404
+
+    def test_not_streamed_under_wsgi(self, kiosk):
+        response = Client().get("/display/events-kiosk/events")
+
+        assert response.status_code == 501
+
+    def test_page_points_at_events_service(self, kiosk, settings):
+        _page, _artwork = kiosk
+        settings.KIOSK_EVENTS_ORIGIN = "https://events.example.com"
+
+        response = Client().get("/display/events-kiosk/")
+
+        assert b'data-events-url="https://events.example.com/display/events-kiosk/events"' in response.content
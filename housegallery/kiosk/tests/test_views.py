@@ -1,4 +1,7 @@
+from unittest import mock
+
 import pytest
+from django.core.cache import cache
 from django.test import Client
 from wagtail.models import Page as WagtailPage
 
@@ -118,3 +121,302 @@ class TestKioskListOrDefault:
         assert "Multiple kiosk displays" in content
         assert "Lobby Kiosk" in content
         assert "Bar Display" in content
+
+
+@pytest.mark.django_db
+class TestKioskManifest:
+    @pytest.fixture
+    def artwork_kiosk(self, home_page, make_image):
+        from housegallery.artworks.models import Artwork, ArtworkImage
+
+        artwork = Artwork(title="Before")
+        artwork.save()
+        ArtworkImage.objects.create(artwork=artwork, image=make_image(title="Artwork Image"))
+        page = home_page.add_child(
+            instance=KioskPage(
+                title="Manifest Kiosk",
+                slug="manifest-kiosk",
+                carousel_interval=7000,
+                featured_items=[("artwork", {"artwork": artwork})],
+            )
+        )
+        page.save_revision().publish()
+        page.refresh_from_db()
+        return page, artwork
+
+    def test_returns_items_and_settings(self, client, artwork_kiosk):
+        response = client.get("/display/manifest-kiosk/manifest.json")
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('"kiosk-')
+        data = response.json()
+        assert data["settings"]["interval"] == 7000
+        assert data["items"][0]["artwork_title"] == "Before"
+
+    def test_body_cache_expires(self, client, artwork_kiosk):
+        from housegallery.kiosk.views import MANIFEST_CACHE_TIMEOUT
+
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            client.get("/display/manifest-kiosk/manifest.json")
+
+        calls = [c for c in cache_set.call_args_list if c.args[0].startswith("kiosk_manifest_")]
+        assert [c.args[2] for c in calls] == [MANIFEST_CACHE_TIMEOUT]
+
+    def test_not_modified_with_one_query(self, client, artwork_kiosk, django_assert_num_queries):
+        etag = client.get("/display/manifest-kiosk/manifest.json")["ETag"]
+
+        with django_assert_num_queries(1):
+            response = client.get(
+                "/display/manifest-kiosk/manifest.json", HTTP_IF_NONE_MATCH=etag,
+            )
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_etag_changes_when_content_changes(self, client, artwork_kiosk):
+        _page, artwork = artwork_kiosk
+        etag = client.get("/display/manifest-kiosk/manifest.json")["ETag"]
+
+        artwork.title = "After"
+        artwork.save()
+
+        response = client.get(
+            "/display/manifest-kiosk/manifest.json", HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.json()["items"][0]["artwork_title"] == "After"
+
+    def test_not_built_from_stale_carousel(self, client, artwork_kiosk, hold_recompute_lock, monkeypatch):
+        from housegallery.core import cache_utils
+
+        monkeypatch.setattr(cache_utils, "WAIT_TIMEOUT", 0.05)
+        page, artwork = artwork_kiosk
+        # The carousel from before the edit, kept to serve during rebuilds
+        cache.set(page._carousel_stale_key, [{"artwork_title": "Before"}], None)
+
+        artwork.title = "After"
+        artwork.save()
+
+        # Another worker is rebuilding the carousel
+        timestamp = int(page.last_published_at.timestamp())
+        with hold_recompute_lock(f"kiosk_carousel_{page.pk}_{timestamp}"):
+            response = client.get("/display/manifest-kiosk/manifest.json")
+
+        assert response.json()["items"][0]["artwork_title"] == "After"
+        cached = client.get("/display/manifest-kiosk/manifest.json")
+        assert cached.json()["items"][0]["artwork_title"] == "After"
+
+    def test_etag_changes_when_republished(self, client, artwork_kiosk):
+        page, _artwork = artwork_kiosk
+        etag = client.get("/display/manifest-kiosk/manifest.json")["ETag"]
+
+        page.carousel_interval = 9000
+        page.save_revision().publish()
+
+        response = client.get(
+            "/display/manifest-kiosk/manifest.json", HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response.status_code == 200
+        assert response.json()["settings"]["interval"] == 9000
+
+    def test_unknown_slug(self, client, home_page):
+        response = client.get("/display/nonexistent/manifest.json")
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestKioskImages:
+    @pytest.fixture
+    def windowed_kiosk(self, home_page, make_image):
+        for n in range(5):
+            make_image(title=f"Image {n}")
+        page = home_page.add_child(
+            instance=KioskPage(
+                title="Window Kiosk",
+                slug="window-kiosk",
+                carousel_window_size=2,
+                featured_items=[("all_images", {"limit": None})],
+            )
+        )
+        page.save_revision().publish()
+        return page
+
+    def test_follows_cursor(self, client, windowed_kiosk):
+        first = client.get("/display/window-kiosk/images.json").json()
+        second = client.get(
+            "/display/window-kiosk/images.json", {"cursor": first["next"]},
+        ).json()
+
+        assert len(first["items"]) == len(second["items"]) == 2
+        assert not {item["caption"] for item in first["items"]} & {
+            item["caption"] for item in second["items"]
+        }
+
+    def _rename_images(self):
+        from housegallery.images.models import CustomImage
+
+        for image in CustomImage.objects.all():
+            image.title = f"Renamed {image.title}"
+            image.save()
+
+    def test_image_edits_start_fresh_pages(self, client, windowed_kiosk):
+        before = client.get("/display/window-kiosk/images.json").json()
+
+        self._rename_images()
+
+        after = client.get("/display/window-kiosk/images.json").json()
+        assert [item["caption"] for item in after["items"]] == [
+            f"Renamed {item['caption']}" for item in before["items"]
+        ]
+
+    def test_not_built_from_stale_carousel(self, client, windowed_kiosk, hold_recompute_lock, monkeypatch):
+        from housegallery.core import cache_utils
+
+        monkeypatch.setattr(cache_utils, "WAIT_TIMEOUT", 0.05)
+        page = windowed_kiosk
+        page.refresh_from_db()
+        carousel_key = f"kiosk_carousel_{page.pk}_{int(page.last_published_at.timestamp())}"
+        page._build_carousel_items(carousel_key)  # records what the carousel depends on
+        cache.set(page._carousel_stale_key, [{"caption": "Stale"}], None)
+        etag = page.get_manifest_etag()
+
+        self._rename_images()
+
+        # Another worker is rebuilding the carousel
+        with hold_recompute_lock(carousel_key):
+            after = client.get("/display/window-kiosk/images.json").json()
+
+        page.refresh_from_db()
+        assert page.get_manifest_etag() != etag
+        assert all(item["caption"].startswith("Renamed ") for item in after["items"])
+
+    def test_first_page_rendered_with_kiosk(self, client, windowed_kiosk):
+        response = client.get("/display/window-kiosk/")
+
+        assert response.context["carousel_window"]["start"] == 0
+        assert len(response.context["carousel_items"]) == 2
+        assert b'data-window-url="/display/window-kiosk/images.json"' in response.content
+
+    def test_manifest_points_at_window(self, client, windowed_kiosk):
+        data = client.get("/display/window-kiosk/manifest.json").json()
+
+        assert data["items"] == []
+        assert data["window"] == {"url": "/display/window-kiosk/images.json", "size": 2}
+
+    def test_invalid_cursor(self, client, windowed_kiosk):
+        response = client.get("/display/window-kiosk/images.json", {"cursor": "x.y"})
+        assert response.status_code == 400
+
+    def test_kiosk_without_window(self, client, windowed_kiosk):
+        windowed_kiosk.carousel_window_size = None
+        windowed_kiosk.save_revision().publish()
+
+        response = client.get("/display/window-kiosk/images.json")
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestKioskOffline:
+    @pytest.fixture
+    def artwork_kiosk(self, home_page, make_image):
+        from housegallery.artworks.models import Artwork, ArtworkImage
+
+        image = make_image(title="Artwork Image")
+        artwork = Artwork(title="Offline")
+        artwork.save()
+        ArtworkImage.objects.create(artwork=artwork, image=image)
+        page = home_page.add_child(
+            instance=KioskPage(
+                title="Offline Kiosk",
+                slug="offline-kiosk",
+                featured_items=[("artwork", {"artwork": artwork})],
+            )
+        )
+        page.save_revision().publish()
+        return page, image
+
+    def test_lists_carousel_images_and_static_files(self, client, artwork_kiosk):
+        page, _image = artwork_kiosk
+
+        data = client.get("/display/offline-kiosk/offline.json").json()
+
+        urls = {asset["url"] for asset in data["assets"]}
+        item = page.get_carousel_items()[0]
+        assert {item["thumb_url"], item["full_url"]} <= urls
+        assert "/static/images/favicons/house-favicon.jpg" in urls
+        assert all(asset["revision"] for asset in data["assets"])
+
+    def test_version_follows_content(self, client, artwork_kiosk):
+        _page, image = artwork_kiosk
+        first = client.get("/display/offline-kiosk/offline.json").json()
+        assert client.get("/display/offline-kiosk/offline.json").json() == first
+
+        from housegallery.kiosk.models import CAROUSEL_FULL_SPEC
+
+        image.get_rendition(CAROUSEL_FULL_SPEC)  # built in the background
+        image.save()
+
+        second = client.get("/display/offline-kiosk/offline.json").json()
+        assert second["version"] != first["version"]
+
+    def test_not_built_from_stale_carousel(self, client, artwork_kiosk, hold_recompute_lock, monkeypatch):
+        from housegallery.core import cache_utils
+
+        monkeypatch.setattr(cache_utils, "WAIT_TIMEOUT", 0.05)
+        page, _image = artwork_kiosk
+        page.refresh_from_db()
+        # The carousel from before the last edit, kept to serve during rebuilds
+        cache.set(
+            page._carousel_stale_key,
+            [{"thumb_url": "/media/before-thumb.jpg", "full_url": "/media/before.jpg"}],
+            None,
+        )
+
+        # Another worker is rebuilding the carousel
+        timestamp = int(page.last_published_at.timestamp())
+        with hold_recompute_lock(f"kiosk_carousel_{page.pk}_{timestamp}"):
+            data = client.get("/display/offline-kiosk/offline.json").json()
+
+        urls = {asset["url"] for asset in data["assets"]}
+        assert "/media/before.jpg" not in urls
+        item = page.get_carousel_items()[0]
+        assert {item["thumb_url"], item["full_url"]} <= urls
+
+    def test_background_renditions_are_queued(self, client, home_page, make_image):
+        from housegallery.images.renditions import profile_spec
+
+        image = make_image(title="Background")
+        page = home_page.add_child(
+            instance=KioskPage(
+                title="Photo Kiosk",
+                slug="photo-kiosk",
+                background_style="static_image",
+                background_gallery=[("all_images", {"limit": None})],
+            )
+        )
+        page.save_revision().publish()
+        spec = profile_spec("display")
+        image.rendition_jobs.all().delete()
+
+        data = client.get("/display/photo-kiosk/offline.json").json()
+
+        assert image.file.url in {asset["url"] for asset in data["assets"]}
+        assert not image.renditions.filter(filter_spec=spec).exists()
+        assert image.rendition_jobs.filter(filter_spec=spec).exists()
+
+    def test_body_cache_expires(self, client, artwork_kiosk):
+        from housegallery.kiosk.views import MANIFEST_CACHE_TIMEOUT
+
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            client.get("/display/offline-kiosk/offline.json")
+
+        calls = [c for c in cache_set.call_args_list if c.args[0].startswith("kiosk_offline_")]
+        assert [c.args[2] for c in calls] == [MANIFEST_CACHE_TIMEOUT]
+
+    def test_service_worker(self, client):
+        response = client.get("/display/sw.js")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/javascript"
+        assert b"offline.json" in response.content
@@ -6,5 +6,10 @@ app_name = "kiosk"
 
 urlpatterns = [
     path('', views.kiosk_list_or_default, name='kiosk_display'),
+    path('sw.js', views.kiosk_service_worker, name='kiosk_service_worker'),
     path('<slug:kiosk_slug>/', views.kiosk_display, name='kiosk_display_by_slug'),
+    path('<slug:kiosk_slug>/manifest.json', views.kiosk_manifest, name='kiosk_manifest'),
+    path('<slug:kiosk_slug>/images.json', views.kiosk_images, name='kiosk_images'),
+    path('<slug:kiosk_slug>/offline.json', views.kiosk_offline_manifest, name='kiosk_offline_manifest'),
+    path('<slug:kiosk_slug>/events', views.kiosk_events, name='kiosk_events'),
 ]
@@ -1,6 +1,28 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse
+from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response
+from django.views.decorators.http import require_GET
 
+from .carousel_window import decode_cursor
+from .carousel_window import encode_cursor
+from .events import kiosk_event_stream
+from .events import live_manifest_etags
 from .models import KioskPage
+from .models import manifest_etag
+from .offline import static_assets_version
+
+# Bodies are cached per ETag, so they never go stale; this only lets keys
+# for superseded ETags expire instead of filling the persistent cache
+MANIFEST_CACHE_TIMEOUT = 60 * 60
 
 
 def find_kiosk_by_slug(slug):
@@ -34,6 +56,153 @@ def kiosk_display(request, kiosk_slug):
         })
 
 
+def _manifest_row(slug):
+    """``(pk, last_published_at, content_version)`` of a live kiosk, or None."""
+    return (
+        KioskPage.objects.live()
+        .filter(slug=slug)
+        .values_list("pk", "last_published_at", "content_version")
+        .first()
+    )
+
+
+@require_GET
+@transaction.non_atomic_requests
+def kiosk_manifest(request, kiosk_slug):
+    """
+    Serve a kiosk's carousel items and animation settings as JSON at
+    /display/<slug>/manifest.json, for displays that poll for changes.
+
+    The ETag comes from one query for the kiosk's publish time and content
+    version, so an unchanged manifest is answered with a 304 without
+    loading the page or its carousel. The body for each ETag is cached, so
+    every display gets identical bytes for it.
+    """
+    row = _manifest_row(kiosk_slug)
+    if row is None:
+        return JsonResponse({"error": f'No kiosk display found for "{kiosk_slug}".'}, status=404)
+
+    etag = manifest_etag(*row)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        for header, value in headers.items():
+            not_modified[header] = value
+        return not_modified
+
+    cache_key = "kiosk_manifest_" + etag.strip('"')
+    body = cache.get(cache_key)
+    if body is None:
+        kiosk_page = KioskPage.objects.get(pk=row[0])
+        body = json.dumps(kiosk_page.get_manifest(), cls=DjangoJSONEncoder)
+        cache.set(cache_key, body, MANIFEST_CACHE_TIMEOUT)
+
+    return HttpResponse(body, content_type="application/json", headers=headers)
+
+
+@require_GET
+@transaction.non_atomic_requests
+def kiosk_images(request, kiosk_slug):
+    """
+    One page of a windowed kiosk's image sets at
+    /display/<slug>/images.json?cursor=..., with the cursor of the next page.
+
+    Pages are cached per manifest ETag and cursor, so displays that are
+    in step share them and content changes start fresh pages. Edits only
+    change the ETag while the carousel's dependencies are recorded, so the
+    carousel is brought up to date (never served stale) before a page is
+    built and cached.
+    """
+    row = _manifest_row(kiosk_slug)
+    if row is None:
+        return JsonResponse({"error": f'No kiosk display found for "{kiosk_slug}".'}, status=404)
+
+    try:
+        cursor = encode_cursor(*decode_cursor(request.GET.get("cursor", "")))
+    except ValueError:
+        return JsonResponse({"error": "Invalid cursor."}, status=400)
+
+    cache_key = "kiosk_images_" + manifest_etag(*row).strip('"') + "_" + cursor
+    body = cache.get(cache_key)
+    if body is None:
+        kiosk_page = KioskPage.objects.get(pk=row[0])
+        if not kiosk_page.has_carousel_window:
+            return JsonResponse({"error": "This kiosk does not page its images."}, status=404)
+        kiosk_page.get_carousel_items(allow_stale=False)
+        page = kiosk_page.get_carousel_window(cursor)
+        body = json.dumps(page, cls=DjangoJSONEncoder)
+        cache.set(cache_key, body, MANIFEST_CACHE_TIMEOUT)
+
+    return HttpResponse(body, content_type="application/json", headers={"Cache-Control": "no-cache"})
+
+
+@require_GET
+@transaction.non_atomic_requests
+def kiosk_offline_manifest(request, kiosk_slug):
+    """
+    The versioned list of files a display precaches to run offline, at
+    /display/<slug>/offline.json (see offline.py).
+
+    Cached per manifest ETag and static assets version, so it is rebuilt
+    when the carousel changes or after a deploy.
+    """
+    row = _manifest_row(kiosk_slug)
+    if row is None:
+        return JsonResponse({"error": f'No kiosk display found for "{kiosk_slug}".'}, status=404)
+
+    cache_key = "kiosk_offline_" + manifest_etag(*row).strip('"') + "_" + static_assets_version()
+    body = cache.get(cache_key)
+    if body is None:
+        kiosk_page = KioskPage.objects.get(pk=row[0])
+        body = json.dumps(kiosk_page.get_offline_manifest(), cls=DjangoJSONEncoder)
+        cache.set(cache_key, body, MANIFEST_CACHE_TIMEOUT)
+
+    return HttpResponse(body, content_type="application/json", headers={"Cache-Control": "no-cache"})
+
+
+@require_GET
+def kiosk_service_worker(request):
+    """
+    The kiosk service worker at /display/sw.js. Served from here rather
+    than /static/ so its scope covers every kiosk under /display/.
+    """
+    response = render(request, "pages/kiosk/service_worker.js", content_type="application/javascript")
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+@require_GET
+@transaction.non_atomic_requests
+async def kiosk_events(request, kiosk_slug):
+    """
+    Server-sent events at /display/<slug>/events telling a display when to
+    fetch the kiosk's manifest again, sent when the kiosk or anything its
+    carousel shows is published or changed.
+
+    The connection stays open, so this is only served by the ASGI
+    application, which production runs as a separate service (see
+    ``KIOSK_EVENTS_ORIGIN``); under WSGI it answers 501 and displays keep
+    polling. The events are public, and the kiosk page is on another
+    origin, so any origin may read them.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse("Kiosk events need the ASGI server.", status=501, content_type="text/plain")
+
+    etag = (await sync_to_async(live_manifest_etags)([kiosk_slug])).get(kiosk_slug)
+    if etag is None:
+        return HttpResponse(f'No kiosk display found for "{kiosk_slug}".', status=404, content_type="text/plain")
+
+    return StreamingHttpResponse(
+        kiosk_event_stream(kiosk_slug, etag),
+        content_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Access-Control-Allow-Origin": "*",
+        },
+    )
+
+
 def kiosk_list_or_default(request):
     """
     If exactly one live kiosk exists, serve it directly.
@@ -0,0 +1,66 @@
+/**
+ * Exhibitions Infinite Scroll
+ * Loads further exhibition cards from the index page's cards/ fragment
+ * endpoint as the visitor nears the end of the listing.
+ */
+
+const NEXT_SELECTOR = '[data-exhibition-cards-next]';
+
+function registerGalleries(container) {
+  const lightbox = window.unifiedGalleryLightbox;
+  if (!lightbox) return;
+
+  container.querySelectorAll('.exhibition-feature-gallery').forEach(gallery => {
+    lightbox.setupGallery(gallery);
+  });
+}
+
+function initInfiniteScroll() {
+  const listing = document.querySelector('[data-exhibition-cards]');
+  if (!listing || !('IntersectionObserver' in window)) return;
+
+  let loading = false;
+
+  const observer = new IntersectionObserver(entries => {
+    entries.forEach(entry => {
+      if (entry.isIntersecting) loadNext(entry.target);
+    });
+  }, { rootMargin: '800px 0px' });
+
+  async function loadNext(marker) {
+    if (loading) return;
+    loading = true;
+    observer.unobserve(marker);
+
+    try {
+      const response = await fetch(marker.dataset.exhibitionCardsNext, {
+        headers: { 'X-Requested-With': 'XMLHttpRequest' },
+      });
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+      const fragment = document.createElement('div');
+      fragment.innerHTML = await response.text();
+      registerGalleries(fragment);
+
+      marker.replaceWith(...fragment.childNodes);
+    } catch (error) {
+      console.error('Failed to load more exhibitions:', error);
+      // Leave the marker in place so the next scroll retries
+      observer.observe(marker);
+    } finally {
+      loading = false;
+    }
+
+    const next = listing.querySelector(NEXT_SELECTOR);
+    if (next) observer.observe(next);
+  }
+
+  const first = listing.querySelector(NEXT_SELECTOR);
+  if (first) observer.observe(first);
+}
+
+if (document.readyState === 'loading') {
+  document.addEventListener('DOMContentLoaded', initInfiniteScroll);
+} else {
+  initInfiniteScroll();
+}
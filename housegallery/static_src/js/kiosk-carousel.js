@@ -9,6 +9,20 @@
  *
  * Falls back to legacy DOM-based cycling when no JSON data is present
  * (e.g. background carousels using StreamField display_images).
+ *
+ * When the container has a data-manifest-url, the kiosk's manifest.json is
+ * fetched with If-None-Match. Unchanged content costs a 304; new content
+ * replaces the dataset in place, picked up from the next slide onwards.
+ * With a data-events-url the server says when to fetch it, over
+ * server-sent events; without one, or if the event stream is refused,
+ * the manifest is polled.
+ *
+ * With a data-window-url the items from data-window-start onwards are one
+ * page of a large image set. The next page is fetched from the window
+ * URL while the current one shows and swapped in when the carousel wraps.
+ *
+ * Randomized kiosks render with a data-carousel-seed. The manifest lists
+ * items in canonical order and they are put in the seed's order here.
  */
 const KioskCarousel = {
   init(containerSelector) {
@@ -52,6 +66,24 @@ const KioskCarousel = {
       container.classList.add('transition-' + this.transition);
     }
 
+    this.manifestUrl = container.dataset.manifestUrl || '';
+    this.manifestEtag = container.dataset.manifestEtag || '';
+    this.pollInterval = parseInt(container.dataset.manifestPoll, 10) || 10000;
+    this.eventsUrl = container.dataset.eventsUrl || '';
+    this.seed = container.dataset.carouselSeed ? parseInt(container.dataset.carouselSeed, 10) : null;
+    this._startUpdates();
+
+    this.window = null;
+    if (container.dataset.windowUrl) {
+      this.window = {
+        url: container.dataset.windowUrl,
+        start: parseInt(container.dataset.windowStart, 10) || 0,
+        next: container.dataset.windowNext || '',
+        pending: null
+      };
+      this._fetchWindow();
+    }
+
     // Single item: show it statically, wire up click, done
     if (this.items.length === 1) {
       this._setupClickHandler();
@@ -67,6 +99,129 @@ const KioskCarousel = {
     this.start();
   },
 
+  // --- Manifest updates ---------------------------------------------------
+
+  _startUpdates() {
+    if (!this.manifestUrl || !window.fetch) return;
+    if (!this.eventsUrl || !window.EventSource) {
+      this._startPolling();
+      return;
+    }
+
+    const events = new EventSource(this.eventsUrl);
+    events.addEventListener('manifest', (event) => {
+      const data = JSON.parse(event.data);
+      if (data.etag !== this.manifestEtag) this._pollManifest();
+    });
+    events.addEventListener('unpublished', () => window.location.reload());
+    events.onerror = () => {
+      // Dropped connections reconnect by themselves; a refused one
+      // (e.g. a server without streaming support) does not
+      if (events.readyState === EventSource.CLOSED) this._startPolling();
+    };
+  },
+
+  _startPolling() {
+    if (!this.manifestUrl || !window.fetch) return;
+    setInterval(() => {
+      if (!document.hidden) this._pollManifest();
+    }, this.pollInterval);
+  },
+
+  _pollManifest() {
+    const headers = this.manifestEtag ? { 'If-None-Match': this.manifestEtag } : {};
+    fetch(this.manifestUrl, { headers: headers, cache: 'no-store' })
+      .then((response) => {
+        if (response.status !== 200) return null;
+        this.manifestEtag = response.headers.get('ETag') || '';
+        return response.json();
+      })
+      .then((manifest) => {
+        if (manifest) this._applyManifest(manifest);
+      })
+      .catch(() => {});
+  },
+
+  _applyManifest(manifest) {
+    let items = (manifest.items || []).map(this._toCamelCase);
+    if (items.length === 0 && !this.window) return;
+
+    // A change in slide count or timing is simplest to apply with a reload
+    const settings = manifest.settings || {};
+    if (Boolean(manifest.window) !== Boolean(this.window) ||
+        Boolean(settings.randomize) !== (this.seed !== null)) {
+      this._reload();
+      return;
+    }
+    if (this.seed !== null) {
+      // Same order as the server rendered for this display's seed
+      items = Array.from(this._permutation(items.length, this.seed), (i) => items[i]);
+    }
+    if (this.window) {
+      // The manifest lists the fixed items; keep showing the current page
+      const page = this.items.slice(this.window.start);
+      this.window.start = items.length;
+      items.push(...page);
+      this.window.pending = null;
+      this._fetchWindow();
+    }
+    if (!this.pool || items.length === 1 ||
+        settings.interval !== this.interval ||
+        settings.transition !== this.transition ||
+        settings.transition_duration !== this.duration) {
+      this._reload();
+      return;
+    }
+
+    this.items = items;
+    this.currentIndex = this.currentIndex % items.length;
+    if (!this.isTransitioning) {
+      const nextIdx = (this.currentIndex + 1) % items.length;
+      this._populateSlide(this.pool.next, items[nextIdx], nextIdx);
+    }
+  },
+
+  _reload() {
+    // Keep this display's shuffle order across the reload
+    const url = new URL(window.location.href);
+    if (this.seed !== null) url.searchParams.set('seed', this.seed);
+    window.location.replace(url.toString());
+  },
+
+
+  // --- Image set pages ---------------------------------------------------
+
+  _fetchWindow() {
+    const url = this.window.url + '?cursor=' + encodeURIComponent(this.window.next);
+    fetch(url, { cache: 'no-store' })
+      .then((response) => (response.status === 200 ? response.json() : null))
+      .then((page) => {
+        if (page) this.window.pending = page;
+      })
+      .catch(() => {});
+  },
+
+  _swapWindow() {
+    const page = this.window.pending;
+    if (!page) return false;
+    if (page.items.length === 0) {
+      // Nothing left in this cycle; carry on from the next one
+      if (page.next !== this.window.next) {
+        this.window.next = page.next;
+        this.window.pending = null;
+        this._fetchWindow();
+      }
+      return false;
+    }
+
+    this.items = this.items.slice(0, this.window.start)
+      .concat(page.items.map(this._toCamelCase));
+    this.window.next = page.next;
+    this.window.pending = null;
+    this._fetchWindow();
+    return true;
+  },
+
   // --- Pool management ---------------------------------------------------
 
   _createPool() {
@@ -262,6 +417,11 @@ const KioskCarousel = {
 
       this.currentIndex = (this.currentIndex + 1) % this.items.length;
 
+      // Wrapping round: show the next page of the image set from here
+      if (this.window && this.currentIndex === this.items.length - 1 && this._swapWindow()) {
+        this.currentIndex = this.items.length - 1;
+      }
+
       // Pre-populate the new 'next' slide
       const nextIdx = (this.currentIndex + 1) % this.items.length;
       this._populateSlide(this.pool.next, this.items[nextIdx], nextIdx);
@@ -315,6 +475,23 @@ const KioskCarousel = {
 
   // --- Helpers ------------------------------------------------------------
 
+  // Same generator and shuffle as housegallery/kiosk/shuffle.py
+  _permutation(n, seed) {
+    const order = new Uint32Array(n);
+    for (let i = 0; i < n; i++) order[i] = i;
+    let state = (seed >>> 0) || 0x9E3779B9;
+    for (let i = n - 1; i > 0; i--) {
+      state = (state ^ (state << 13)) >>> 0;
+      state = (state ^ (state >>> 17)) >>> 0;
+      state = (state ^ (state << 5)) >>> 0;
+      const j = state % (i + 1);
+      const swap = order[i];
+      order[i] = order[j];
+      order[j] = swap;
+    }
+    return order;
+  },
+
   _toCamelCase(item) {
     const out = {};
     for (const key in item) {
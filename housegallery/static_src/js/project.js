@@ -7,6 +7,9 @@ import './menu.js';
 // Import exhibition feature lightbox functionality
 import './exhibition-feature-lightbox.js';
 
+// Import exhibitions listing infinite scroll functionality
+import './exhibitions-infinite-scroll.js';
+
 // Import horizontal features carousel functionality
 import './horizontal-features.js';
 
@@ -0,0 +1,108 @@
+/**
+ * Kiosk service worker, served at /display/sw.js.
+ *
+ * Precaches each kiosk's offline manifest (/display/<slug>/offline.json)
+ * when a kiosk page asks it to, and again whenever the kiosk's
+ * manifest.json returns new content. Only entries whose revision changed
+ * are downloaded; entries no longer listed are deleted.
+ *
+ * Precached files are served from the cache. Pages, manifests and image
+ * pages are fetched from the network first and fall back to the last
+ * copy, so a display keeps cycling its slides while the Wi-Fi is down.
+ */
+const PRECACHE_PREFIX = 'kiosk-precache:';
+const PAGES_CACHE = 'kiosk-pages';
+const INDEX_KEY = 'precache-index.json';
+
+self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', (event) => event.waitUntil(self.clients.claim()));
+
+self.addEventListener('message', (event) => {
+  if (event.data && event.data.type === 'precache' && event.data.url) {
+    event.waitUntil(precache(event.data.url));
+  }
+});
+
+async function precache(offlineUrl) {
+  const response = await fetch(offlineUrl, { cache: 'no-store' });
+  if (!response.ok) return;
+  const manifest = await response.json();
+
+  const cache = await caches.open(PRECACHE_PREFIX + new URL(offlineUrl, self.location).pathname);
+  const indexResponse = await cache.match(INDEX_KEY);
+  const index = indexResponse ? await indexResponse.json() : {};
+  if (index.version === manifest.version) return;
+
+  const revisions = index.revisions || {};
+  const wanted = {};
+  for (const asset of manifest.assets) {
+    wanted[asset.url] = asset.revision;
+    if (revisions[asset.url] === asset.revision && await cache.match(asset.url)) continue;
+    try {
+      // Media may be on another origin without CORS; opaque responses
+      // still display as images
+      const sameOrigin = new URL(asset.url, self.location).origin === self.location.origin;
+      const fetched = await fetch(asset.url, sameOrigin ? {} : { mode: 'no-cors' });
+      if (fetched.ok || fetched.type === 'opaque') {
+        await cache.put(asset.url, fetched);
+        revisions[asset.url] = asset.revision;
+      }
+    } catch (e) {
+      // Offline part way through: the rest is fetched next time
+    }
+  }
+
+  for (const url of Object.keys(revisions)) {
+    if (!(url in wanted)) {
+      await cache.delete(url);
+      delete revisions[url];
+    }
+  }
+
+  const complete = Object.keys(wanted).every((url) => revisions[url] === wanted[url]);
+  await cache.put(INDEX_KEY, new Response(JSON.stringify({
+    version: complete ? manifest.version : null,
+    revisions: revisions
+  })));
+}
+
+function isKioskData(url) {
+  return /\/(manifest|images)\.json$/.test(url.pathname);
+}
+
+async function networkFirst(request) {
+  const cache = await caches.open(PAGES_CACHE);
+  try {
+    const response = await fetch(request);
+    if (response.ok) {
+      cache.put(request, response.clone());
+      const url = new URL(request.url);
+      if (url.pathname.endsWith('/manifest.json')) {
+        // New content: bring the precache up to date
+        precache(url.pathname.replace(/manifest\.json$/, 'offline.json')).catch(() => {});
+      }
+    }
+    return response;
+  } catch (e) {
+    const cached = await cache.match(request, { ignoreSearch: request.mode === 'navigate' });
+    if (cached) return cached;
+    throw e;
+  }
+}
+
+self.addEventListener('fetch', (event) => {
+  const request = event.request;
+  if (request.method !== 'GET') return;
+  // Leave the server-sent events stream alone
+  if ((request.headers.get('Accept') || '').includes('text/event-stream')) return;
+
+  const url = new URL(request.url);
+  if (request.mode === 'navigate' || isKioskData(url)) {
+    event.respondWith(networkFirst(request));
+    return;
+  }
+
+  event.respondWith(
+    caches.match(request, { ignoreVary: true }).then((cached) => cached || fetch(request))
+  );
+});